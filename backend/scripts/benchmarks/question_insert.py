@@ -0,0 +1,142 @@
+"""
+Benchmark for persisting generated questions.
+
+Compares the per-row ORM path (``session.add`` for each question, commit,
+then a refresh per question) with ``bulk_insert_questions`` on the
+configured database. A throwaway quiz owns the questions and is deleted
+together with them afterwards.
+
+Usage (from the backend directory):
+    python scripts/benchmarks/question_insert.py --sizes 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from uuid import UUID
+
+import structlog
+from sqlalchemy import delete
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Import all models so SQLAlchemy can resolve relationships
+import src.auth.models  # noqa: E402, F401
+import src.question.models  # noqa: E402, F401
+import src.quiz.models  # noqa: E402, F401
+from src.database import get_async_session  # noqa: E402
+from src.question.models import Question  # noqa: E402
+from src.question.service import (  # noqa: E402
+    BULK_INSERT_COPY_THRESHOLD,
+    bulk_insert_questions,
+)
+from src.question.types import QuestionDifficulty, QuestionType  # noqa: E402
+from src.quiz.models import Quiz  # noqa: E402
+
+
+def make_questions(quiz_id: UUID, count: int) -> list[Question]:
+    return [
+        Question(
+            quiz_id=quiz_id,
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            question_data={
+                "question_text": f"Benchmark question {index}?",
+                "option_a": "One",
+                "option_b": "Two",
+                "option_c": "Three",
+                "option_d": "Four",
+                "correct_answer": "ABCD"[index % 4],
+                "explanation": "Benchmark explanation.",
+            },
+            difficulty=QuestionDifficulty.MEDIUM,
+            tags=["benchmark"],
+            is_approved=False,
+        )
+        for index in range(count)
+    ]
+
+
+async def orm_insert(quiz_id: UUID, count: int) -> None:
+    async with get_async_session() as session:
+        questions = make_questions(quiz_id, count)
+        for question in questions:
+            session.add(question)
+        await session.commit()
+        for question in questions:
+            await session.refresh(question)
+
+
+async def bulk_insert(quiz_id: UUID, count: int) -> None:
+    async with get_async_session() as session:
+        await bulk_insert_questions(session, make_questions(quiz_id, count))
+        await session.commit()
+
+
+async def clear_questions(quiz_id: UUID) -> None:
+    async with get_async_session() as session:
+        await session.execute(delete(Question).where(Question.quiz_id == quiz_id))  # type: ignore[arg-type]
+        await session.commit()
+
+
+async def run(sizes: list[int], repeats: int) -> None:
+    async with get_async_session() as session:
+        quiz = Quiz(
+            canvas_course_id=0,
+            canvas_course_name="Benchmark",
+            title="Question insert benchmark",
+        )
+        quiz_id = quiz.id
+        session.add(quiz)
+        await session.commit()
+
+    methods: dict[str, Callable[[UUID, int], Awaitable[None]]] = {
+        "orm (add + refresh)": orm_insert,
+        "bulk": bulk_insert,
+    }
+    try:
+        # Warm up connections and statement caches
+        for method in methods.values():
+            await method(quiz_id, 10)
+        await clear_questions(quiz_id)
+
+        print(f"bulk path switches to COPY at {BULK_INSERT_COPY_THRESHOLD} rows")
+        print(f"{'questions':>10} {'method':>20} {'best ms':>10} {'rows/s':>10}")
+        for size in sizes:
+            for name, method in methods.items():
+                timings = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    await method(quiz_id, size)
+                    timings.append(time.perf_counter() - start)
+                    await clear_questions(quiz_id)
+                best = min(timings)
+                print(
+                    f"{size:>10} {name:>20} {best * 1000:>10.1f} {size / best:>10.0f}"
+                )
+    finally:
+        async with get_async_session() as session:
+            await session.execute(delete(Question).where(Question.quiz_id == quiz_id))  # type: ignore[arg-type]
+            await session.execute(delete(Quiz).where(Quiz.id == quiz_id))  # type: ignore[arg-type]
+            await session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    # Log output would dominate the timings
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL)
+    )
+    asyncio.run(run(args.sizes, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
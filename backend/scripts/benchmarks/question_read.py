@@ -0,0 +1,80 @@
+"""
+Micro-benchmark for formatting stored questions for display.
+
+Compares questions without a validation stamp, whose data is fully validated
+on every read, with questions stamped on write, whose data takes the
+validation engine's trusted path.
+
+Usage (from the backend directory):
+    python scripts/benchmarks/question_read.py --iterations 20000
+"""
+
+import argparse
+import logging
+import sys
+import uuid
+from pathlib import Path
+
+import structlog
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Import all models to ensure SQLAlchemy can resolve relationships
+import src.auth.models  # noqa
+import src.question.models  # noqa
+import src.quiz.models  # noqa
+from question_validation import SAMPLE_DATA, measure  # noqa: E402
+from src.question.formatters import format_question_display_data  # noqa: E402
+from src.question.types import Question  # noqa: E402
+from src.question.types.registry import get_question_type_registry  # noqa: E402
+
+
+def run(iterations: int) -> None:
+    registry = get_question_type_registry()
+
+    print(f"iterations: {iterations}")
+    print(f"{'question type':<18} {'unstamped/s':>12} {'stamped/s':>12} {'speedup':>8}")
+
+    for question_type, data in SAMPLE_DATA.items():
+        engine = registry.get_question_type(question_type).validation_engine
+        validated = engine.validate(data)
+        stored = validated.model_dump()
+        unstamped, stamped = (
+            Question(
+                quiz_id=uuid.uuid4(),
+                question_type=question_type,
+                question_data=stored,
+                validation_stamp=stamp,
+            )
+            for stamp in (None, engine.stamp_for(validated))
+        )
+
+        def read_unstamped(question: Question = unstamped) -> object:
+            return format_question_display_data(question)
+
+        def read_stamped(question: Question = stamped) -> object:
+            return format_question_display_data(question)
+
+        unstamped_rate = measure(iterations, read_unstamped)
+        stamped_rate = measure(iterations, read_stamped)
+        print(
+            f"{question_type.value:<18} {unstamped_rate:>12.0f} "
+            f"{stamped_rate:>12.0f} {stamped_rate / unstamped_rate:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    # Log output would dominate the timings
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL)
+    )
+    run(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Micro-benchmark for question data validation throughput per question type.
+
+Compares full validation, which runs every data model validator and the
+type's extra checks, with the validation engine's trusted load of data
+stamped as valid.
+
+Usage (from the backend directory):
+    python scripts/benchmarks/question_validation.py --iterations 20000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.question.types import QuestionType  # noqa: E402
+from src.question.types.registry import get_question_type_registry  # noqa: E402
+
+SAMPLE_DATA: dict[QuestionType, dict[str, Any]] = {
+    QuestionType.MULTIPLE_CHOICE: {
+        "question_text": "What is the capital of France?",
+        "option_a": "Paris",
+        "option_b": "London",
+        "option_c": "Berlin",
+        "option_d": "Madrid",
+        "correct_answer": "A",
+        "explanation": "Paris is the capital of France.",
+    },
+    QuestionType.TRUE_FALSE: {
+        "question_text": "Paris is the capital of France.",
+        "correct_answer": True,
+        "explanation": "Paris has been the capital since 987.",
+    },
+    QuestionType.FILL_IN_BLANK: {
+        "question_text": " ".join(
+            f"Sentence {index} mentions [blank_{index}]." for index in range(1, 11)
+        ),
+        "blanks": [
+            {
+                "position": index,
+                "correct_answer": f"answer {index}",
+                "answer_variations": [f"variation {index}", "1", "1.0"],
+            }
+            for index in range(1, 11)
+        ],
+    },
+    QuestionType.MATCHING: {
+        "question_text": "Match countries to their capitals",
+        "pairs": [
+            {"question": f"Country {index}", "answer": f"Capital {index}"}
+            for index in range(10)
+        ],
+        "distractors": ["Capital X", "Capital Y", "Capital Z"],
+    },
+    QuestionType.CATEGORIZATION: {
+        "question_text": "Categorize these items",
+        "categories": [
+            {
+                "name": f"Category {category}",
+                "correct_items": [f"item{category}{index}" for index in range(3)],
+            }
+            for category in range(4)
+        ],
+        "items": [
+            {"id": f"item{category}{index}", "text": f"Item {category}{index}"}
+            for category in range(4)
+            for index in range(3)
+        ],
+        "distractors": [{"id": "item99", "text": "Distractor"}],
+    },
+}
+
+
+def measure(iterations: int, validate: Callable[[], Any]) -> float:
+    """Return validations per second."""
+    for _ in range(100):
+        validate()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        validate()
+    return iterations / (time.perf_counter() - start)
+
+
+def run(iterations: int) -> None:
+    registry = get_question_type_registry()
+
+    print(f"iterations: {iterations}")
+    print(f"{'question type':<18} {'full/s':>12} {'trusted/s':>12} {'speedup':>8}")
+
+    for question_type, data in SAMPLE_DATA.items():
+        engine = registry.get_question_type(question_type).validation_engine
+        validated = engine.validate(data)
+        stored = validated.model_dump()
+        stamp = engine.stamp_for(validated)
+
+        def full(engine: Any = engine, stored: dict[str, Any] = stored) -> Any:
+            return engine.load(stored)
+
+        def trusted(
+            engine: Any = engine, stored: dict[str, Any] = stored, stamp: str = stamp
+        ) -> Any:
+            return engine.load(stored, stamp)
+
+        full_rate = measure(iterations, full)
+        trusted_rate = measure(iterations, trusted)
+        print(
+            f"{question_type.value:<18} {full_rate:>12.0f} "
+            f"{trusted_rate:>12.0f} {trusted_rate / full_rate:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    # Log output would dominate the timings
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL)
+    )
+    run(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
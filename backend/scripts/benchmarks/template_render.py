@@ -0,0 +1,112 @@
+"""
+Micro-benchmark for prompt template render throughput per question type.
+
+Renders each question type's default template through ``create_messages``,
+which uses the templates compiled at load time, and through the uncached
+path that parses and compiles both prompts on every render.
+
+Usage (from the backend directory):
+    python scripts/benchmarks/template_render.py --renders 2000 --content-kb 8
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.question.templates.manager import TemplateManager  # noqa: E402
+from src.question.types import (  # noqa: E402
+    GenerationParameters,
+    QuestionType,
+    QuizLanguage,
+)
+
+
+async def measure(renders: int, render: Callable[[], Awaitable[Any]]) -> float:
+    """Return renders per second."""
+    for _ in range(10):
+        await render()
+
+    start = time.perf_counter()
+    for _ in range(renders):
+        await render()
+    return renders / (time.perf_counter() - start)
+
+
+async def run(renders: int, content_kb: int) -> None:
+    manager = TemplateManager()
+    manager.initialize()
+    paragraph = "Benchmark module content about a course topic. " * 20
+    content = "\n\n".join(
+        [paragraph] * max(1, content_kb * 1024 // (len(paragraph) + 2))
+    )
+    parameters = GenerationParameters(target_count=10, language=QuizLanguage.ENGLISH)
+    extra_variables = {
+        "module_name": "Benchmark Module",
+        "question_count": 10,
+        "tone": "academic",
+    }
+
+    print(f"renders: {renders}, module content: {len(content) // 1024} KB")
+    print(f"{'question type':<18} {'compiled/s':>12} {'uncached/s':>12} {'speedup':>8}")
+
+    for question_type in QuestionType:
+        template = manager.get_template(question_type)
+        variables = {
+            "module_content": content,
+            "target_count": parameters.target_count,
+            "difficulty": None,
+            "tags": [],
+            "custom_instructions": None,
+            "question_type": question_type.value,
+            **extra_variables,
+        }
+
+        async def compiled(question_type: QuestionType = question_type) -> Any:
+            return await manager.create_messages(
+                question_type,
+                content,
+                parameters,
+                extra_variables=extra_variables,
+            )
+
+        async def uncached(
+            template: Any = template, variables: dict[str, Any] = variables
+        ) -> Any:
+            return (
+                manager._render_template(template.system_prompt, variables),
+                manager._render_template(template.user_prompt, variables),
+            )
+
+        compiled_rate = await measure(renders, compiled)
+        uncached_rate = await measure(renders, uncached)
+        print(
+            f"{question_type.value:<18} {compiled_rate:>12.0f} "
+            f"{uncached_rate:>12.0f} {compiled_rate / uncached_rate:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--renders", type=int, default=2000)
+    parser.add_argument("--content-kb", type=int, default=8)
+    args = parser.parse_args()
+
+    # Log output would dominate the timings
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL)
+    )
+    asyncio.run(run(args.renders, args.content_kb))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Micro-benchmark for per-batch module workflow orchestration overhead.
+
+Runs complete module batches against an LLM provider that answers instantly
+and skips the database write, so the measured time is the workflow itself:
+building the workflow, moving state through the graph nodes, prompt
+rendering and question validation.
+
+Usage (from the backend directory):
+    python scripts/benchmarks/workflow_overhead.py --batches 200 --content-kb 64
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import structlog
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Import all models so SQLAlchemy can resolve relationships
+import src.auth.models  # noqa: E402, F401
+import src.question.models  # noqa: E402, F401
+import src.quiz.models  # noqa: E402, F401
+from src.question.providers import (  # noqa: E402
+    LLMConfiguration,
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+)
+from src.question.providers.mock_provider import MockProvider  # noqa: E402
+from src.question.templates.manager import TemplateManager  # noqa: E402
+from src.question.types import QuestionType  # noqa: E402
+from src.question.workflows.module_batch_workflow import (  # noqa: E402
+    ModuleBatchState,
+    ModuleBatchWorkflow,
+)
+
+QUESTIONS_PER_BATCH = 10
+
+
+class InstantProvider(MockProvider):
+    """Provider returning a full batch of valid questions without delay."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            LLMConfiguration(provider=LLMProvider.MOCK, model="mock-large")
+        )
+        self._content = json.dumps(
+            [
+                {
+                    "question_text": f"Benchmark question {index}?",
+                    "option_a": "One",
+                    "option_b": "Two",
+                    "option_c": "Three",
+                    "option_d": "Four",
+                    "correct_answer": "ABCD"[index % 4],
+                    "explanation": "Benchmark explanation.",
+                }
+                for index in range(QUESTIONS_PER_BATCH)
+            ]
+        )
+
+    async def generate(self, messages: list[LLMMessage], **kwargs: Any) -> LLMResponse:
+        return LLMResponse(
+            content=self._content,
+            model=self.configuration.model,
+            provider=self.provider_name,
+            total_tokens=0,
+            response_time=0.0,
+        )
+
+
+class BenchmarkWorkflow(ModuleBatchWorkflow):
+    """Workflow that keeps generated questions in memory instead of saving."""
+
+    async def save_questions(self, state: ModuleBatchState) -> ModuleBatchState:
+        return state
+
+
+async def run(batches: int, content_kb: int) -> None:
+    provider = InstantProvider()
+    template_manager = TemplateManager()
+    template_manager.initialize()
+    paragraph = "Benchmark module content about a course topic. " * 20
+    content = "\n\n".join(
+        [paragraph] * max(1, content_kb * 1024 // (len(paragraph) + 2))
+    )
+
+    async def run_batch() -> tuple[float, float]:
+        start = time.perf_counter()
+        workflow = BenchmarkWorkflow(
+            llm_provider=provider, template_manager=template_manager
+        )
+        built = time.perf_counter()
+        questions = await workflow.process_module(
+            quiz_id=uuid4(),
+            module_id="benchmark",
+            module_name="Benchmark Module",
+            module_content=content,
+            question_count=QUESTIONS_PER_BATCH,
+            question_type=QuestionType.MULTIPLE_CHOICE,
+        )
+        assert len(questions) >= QUESTIONS_PER_BATCH
+        return built - start, time.perf_counter() - start
+
+    # Warm up imports, template compilation and provider state
+    for _ in range(3):
+        await run_batch()
+
+    build_times, batch_times = [], []
+    for _ in range(batches):
+        build_time, batch_time = await run_batch()
+        build_times.append(build_time * 1000)
+        batch_times.append(batch_time * 1000)
+
+    print(f"batches: {batches}, module content: {len(content) // 1024} KB")
+    print(
+        f"workflow construction: mean {statistics.mean(build_times):.3f} ms, "
+        f"median {statistics.median(build_times):.3f} ms"
+    )
+    print(
+        f"full batch:            mean {statistics.mean(batch_times):.3f} ms, "
+        f"median {statistics.median(batch_times):.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batches", type=int, default=200)
+    parser.add_argument("--content-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    # Log output would dominate the timings
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL)
+    )
+    asyncio.run(run(args.batches, args.content_kb))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,5 +9,8 @@ python scripts/setup/wait_for_db.py
 # Run migrations
 alembic upgrade head
 
+# Revalidate questions stored under an older schema version
+python scripts/setup/restamp_questions.py
+
 # Create initial data in DB
 python scripts/setup/init_data.py
@@ -0,0 +1,43 @@
+"""
+Build the precompiled prompt template bundle.
+
+Validates every template in the templates directory and writes them, with
+their compiled prompts and an index by type and language, to one bundle file
+that the template manager loads lazily at runtime. The bundle records the
+template files it was built from and is ignored once any of them changes, so
+rebuild it whenever template files change.
+
+Usage (from the backend directory):
+    python scripts/setup/build_template_bundle.py [--templates-dir DIR] [--output FILE]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.question.templates.bundle import build_bundle  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATES_DIR = (
+    Path(__file__).parent.parent.parent / "src" / "question" / "templates" / "files"
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--templates-dir", type=Path, default=DEFAULT_TEMPLATES_DIR)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    count = build_bundle(args.templates_dir, args.output)
+    logger.info(f"Bundled {count} templates from {args.templates_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Stamp stored questions that are missing a current validation stamp.
+
+Fully validates questions saved before validation stamps existed, or under an
+older question type schema version, so their data is trusted on read again.
+Run after migrations.
+
+Usage (from the backend directory):
+    python scripts/setup/restamp_questions.py [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Import all models to ensure SQLAlchemy can resolve relationships
+import src.auth.models  # noqa
+import src.question.models  # noqa
+import src.quiz.models  # noqa
+from src.database import get_async_session  # noqa: E402
+from src.question.service import restamp_questions  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def restamp(batch_size: int) -> int:
+    async with get_async_session() as session:
+        return await restamp_questions(session, batch_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    count = asyncio.run(restamp(args.batch_size))
+    logger.info(f"Stamped {count} questions")
+
+
+if __name__ == "__main__":
+    main()
@@ -90,19 +90,79 @@ class Settings(BaseSettings):
     # LLM settings
     OPENAI_SECRET_KEY: str | None = None
     LLM_API_TIMEOUT: float = 500.0  # LLM request timeout in seconds (5 minutes)
+    LLM_REQUESTS_PER_MINUTE: int | None = 500  # Per-model request budget
+    LLM_TOKENS_PER_MINUTE: int | None = 500_000  # Per-model token budget
+    LLM_HTTP_MAX_CONNECTIONS: int = 100  # Pooled connections to LLM APIs
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20  # Idle connections kept open
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 60.0  # Seconds before idle connections close
+    LLM_PROVIDER_IDLE_TIMEOUT: float = 900.0  # Seconds before cached providers expire
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5  # Consecutive failures that open a circuit
+    LLM_CIRCUIT_RECOVERY_TIMEOUT: float = 30.0  # Seconds before a half-open probe
+    LLM_TOKEN_COUNT_OFFLOAD_CHARS: int = (
+        32_000  # Tokenize prompts at least this long in a worker thread
+    )
+
+    # Offline generation through the OpenAI Batch API
+    LLM_BATCH_MODE_ENABLED: bool = False  # Generate quizzes via the Batch API
+    LLM_BATCH_COLLECT_WINDOW: float = 2.0  # Seconds to gather requests per batch
+    LLM_BATCH_POLL_INTERVAL: float = 30.0  # Seconds between batch status polls
+    LLM_BATCH_MAX_REQUESTS: int = 50_000  # Batch API limit per input file
+    LLM_BATCH_COMPLETION_WINDOW: str = "24h"  # Batch API completion window
+
+    # LLM response cache (enabled via QuestionGenerationConfig.enable_content_caching)
+    LLM_RESPONSE_CACHE_BACKEND: Literal["memory", "disk", "postgres"] = "memory"
+    LLM_RESPONSE_CACHE_TTL: int = 60 * 60 * 24  # Seconds a cached response is valid
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 1000  # Size-based eviction threshold
+    LLM_RESPONSE_CACHE_DIR: str = "/tmp/llm_response_cache"  # Disk backend location
 
     # Module-based question generation settings
-    MAX_CONCURRENT_MODULES: int = 5  # Maximum concurrent module processing tasks
+    MAX_CONCURRENT_MODULES: int = 5  # Maximum concurrent LLM requests per quiz
+    BATCH_SCHEDULING_ORDER: Literal["longest_first", "shortest_first"] = (
+        "longest_first"  # "shortest_first" gets the first questions out sooner
+    )
     MAX_GENERATION_RETRIES: int = (
         3  # Maximum retries for question generation per module
     )
     MAX_JSON_CORRECTIONS: int = 2  # Maximum JSON correction attempts per module
+    LLM_TOP_UP_RETRIES_ENABLED: bool = (
+        True  # Retries ask only for missing questions instead of a full batch
+    )
+    QUESTION_OVERGENERATION_RATIO: float = (
+        0.0  # Extra share of questions requested per batch to rank (0 disables)
+    )
     MODULE_GENERATION_TIMEOUT: int = (
         300  # Timeout per module generation in seconds (5 minutes)
     )
+    LLM_STREAMING_ENABLED: bool = False  # Stream and validate questions incrementally
+    LLM_STRUCTURED_OUTPUT_ENABLED: bool = (
+        True  # Constrain responses to the question schema where supported
+    )
+    LLM_REQUEST_COALESCING_ENABLED: bool = (
+        True  # Share one upstream call between identical in-flight requests
+    )
     CONTENT_LENGTH_THRESHOLD: int = (
         100  # Minimum content length for question generation
     )
+    CONTENT_CHUNK_MAX_CHARS: int = (
+        16_000  # Split larger modules into parallel prompts (0 disables)
+    )
+    MODULE_PACKING_MAX_CHARS: int = (
+        3_000  # Batches of modules up to this size share LLM calls (0 disables)
+    )
+    MODULE_PACKING_MAX_MODULES: int = 4  # Maximum modules packed into one LLM call
+    PROMPT_LAYOUT: Literal["standard", "prefix_cache"] = (
+        "standard"  # "prefix_cache" puts module content first for provider caching
+    )
+    TEMPLATE_HOT_RELOAD: bool = False  # Reload prompt template files when they change
+    TEMPLATE_BUNDLE_ENABLED: bool = (
+        True  # Load prompt templates lazily from a built templates.bundle if present
+    )
+    TEMPLATE_STATIC_FRAGMENTS: bool = (
+        True  # Render content-independent prompt parts once and splice content in
+    )
+    TEMPLATE_RENDER_OFFLOAD_CHARS: int = (
+        32_000  # Render prompts for content at least this long in a worker thread
+    )
 
     @computed_field  # type: ignore[prop-decorator]
     @property
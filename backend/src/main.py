@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import sentry_sdk
 from fastapi import APIRouter, FastAPI, Request
 from fastapi.responses import JSONResponse
@@ -18,7 +21,9 @@ from src.exceptions import (
     service_error_handler,
 )
 from src.middleware import LoggingMiddleware
+from src.question.providers import get_llm_provider_registry
 from src.question.router import router as question_router
+from src.quiz.progress import reset_progress_listener
 from src.quiz.router import router as quiz_router
 
 
@@ -34,10 +39,23 @@ if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
     logger.info("sentry_initialized", dsn=str(settings.SENTRY_DSN))
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Release shared resources when the application shuts down."""
+    yield
+    # Close cached LLM providers and their pooled HTTP connections
+    await get_llm_provider_registry().aclose()
+    # Close the LISTEN connection behind quiz progress streams
+    await reset_progress_listener()
+    logger.info("application_shutdown_completed")
+
+
 app: FastAPI = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 logger.info(
@@ -38,7 +38,7 @@ class QuestionGenerationConfig(BaseModel):
     template_auto_reload: bool = Field(default=True)
 
     # Generation settings
-    enable_content_caching: bool = Field(default=True)
+    enable_content_caching: bool = Field(default=False)  # Opt-in LLM response cache
     max_concurrent_generations: int = Field(default=20, ge=1, le=50)
     generation_timeout: float = Field(default=300.0, ge=60.0)
 
@@ -457,6 +457,10 @@ class ConfigurationService:
         if max_concurrent_str:
             overrides["max_concurrent_generations"] = int(max_concurrent_str)
 
+        content_caching_str = os.getenv("QUESTION_ENABLE_CONTENT_CACHING")
+        if content_caching_str:
+            overrides["enable_content_caching"] = content_caching_str.lower() == "true"
+
         generation_timeout_str = os.getenv("QUESTION_GENERATION_TIMEOUT")
         if generation_timeout_str:
             overrides["generation_timeout"] = float(generation_timeout_str)
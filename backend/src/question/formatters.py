@@ -55,8 +55,10 @@ def format_question_display_data(question: Question) -> dict[str, Any]:
     question_registry = get_question_type_registry()
     question_impl = question_registry.get_question_type(question.question_type)
 
-    # Validate and get typed data
-    typed_data = question_impl.validate_data(question.question_data)
+    # Get typed data, skipping re-validation of data stamped on write
+    typed_data = question_impl.validation_engine.load(
+        question.question_data, question.validation_stamp
+    )
 
     # Format for display using question type implementation
     return question_impl.format_for_display(typed_data)
@@ -109,7 +111,9 @@ def format_question_for_export(question: Question) -> dict[str, Any]:
     """
     question_registry = get_question_type_registry()
     question_impl = question_registry.get_question_type(question.question_type)
-    typed_data = question_impl.validate_data(question.question_data)
+    typed_data = question_impl.validation_engine.load(
+        question.question_data, question.validation_stamp
+    )
 
     # Use Canvas-specific formatting
     return question_impl.format_for_canvas(typed_data)
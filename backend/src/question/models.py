@@ -1,5 +1,8 @@
 """Polymorphic question models for multiple question types."""
 
+# Re-export the LLM response cache table so it is registered with the metadata
+from .providers.cache import LLMResponseCacheEntry
+
 # Re-export the new polymorphic Question model and related types
 from .types.base import (
     GenerationParameters,
@@ -15,4 +18,5 @@ __all__ = [
     "QuestionDifficulty",
     "GenerationParameters",
     "GenerationResult",
+    "LLMResponseCacheEntry",
 ]
@@ -1,8 +1,14 @@
 """LLM provider module for question generation."""
 
+from .admission import (
+    LLMAdmissionController,
+    ModelRateLimits,
+    get_admission_controller,
+)
 from .base import (
     AuthenticationError,
     BaseLLMProvider,
+    CircuitOpenError,
     LLMConfiguration,
     LLMError,
     LLMMessage,
@@ -12,7 +18,15 @@ from .base import (
     ModelNotFoundError,
     RateLimitError,
 )
+from .cache import (
+    ResponseCache,
+    discard_cached_responses,
+    get_response_cache,
+)
+from .circuit_breaker import CircuitBreaker, CircuitState, get_circuit_breakers
+from .coalescing import RequestCoalescer, get_request_coalescer
 from .mock_provider import MockProvider
+from .openai_batch_provider import OpenAIBatchProvider
 from .openai_provider import OpenAIProvider
 from .registry import LLMProviderRegistry, get_llm_provider_registry
 
@@ -28,10 +42,27 @@ __all__ = [
     "LLMError",
     "AuthenticationError",
     "RateLimitError",
+    "CircuitOpenError",
     "ModelNotFoundError",
     # Provider implementations
     "OpenAIProvider",
+    "OpenAIBatchProvider",
     "MockProvider",
+    # Admission control
+    "LLMAdmissionController",
+    "ModelRateLimits",
+    "get_admission_controller",
+    # Response cache
+    "ResponseCache",
+    "get_response_cache",
+    "discard_cached_responses",
+    # Circuit breakers
+    "CircuitBreaker",
+    "CircuitState",
+    "get_circuit_breakers",
+    # Request coalescing
+    "RequestCoalescer",
+    "get_request_coalescer",
     # Registry
     "LLMProviderRegistry",
     "get_llm_provider_registry",
@@ -0,0 +1,390 @@
+"""Process-wide admission control for LLM requests.
+
+Every call made through ``BaseLLMProvider.generate_with_retry`` passes through
+a single ``LLMAdmissionController``. The controller enforces:
+
+- a global cap on in-flight LLM requests across all quizzes,
+- a per-tenant (quiz) cap so one large quiz cannot take every slot,
+- round-robin fair queuing between tenants waiting for a slot,
+- requests-per-minute and tokens-per-minute token buckets per model.
+
+The controller only uses plain counters and futures created on the running
+loop, so it is safe to share between event loops (e.g. one loop per test).
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from src.config import get_logger
+
+logger = get_logger("llm_admission")
+
+DEFAULT_TENANT = "default"
+
+# Rough chars-per-token ratio used to estimate prompt size before sending
+CHARS_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``per_minute`` tokens per minute."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.refill_rate = per_minute / 60.0
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+
+    def time_until_available(self, amount: float) -> float:
+        """Return seconds until ``amount`` tokens can be consumed (0 if now)."""
+        self._refill()
+        # A single request larger than the bucket is allowed once it is full
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def consume(self, amount: float) -> None:
+        """Consume tokens; the balance may go negative when reconciling usage."""
+        self._refill()
+        self.tokens -= amount
+
+    def refund(self, amount: float) -> None:
+        """Return unused tokens to the bucket."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+@dataclass(frozen=True)
+class ModelRateLimits:
+    """Per-model request and token budgets. ``None`` disables a budget."""
+
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+
+
+@dataclass
+class AdmissionTicket:
+    """Handle for an admitted request, used to reconcile actual token usage."""
+
+    model_key: str
+    estimated_tokens: int
+    actual_tokens: int | None = None
+    wait_time: float = 0.0
+
+    def record_usage(self, total_tokens: int | None) -> None:
+        """Record the actual token usage reported by the provider."""
+        self.actual_tokens = total_tokens
+
+
+@dataclass
+class _ModelBuckets:
+    limits: ModelRateLimits
+    requests: TokenBucket | None
+    tokens: TokenBucket | None
+
+
+class LLMAdmissionController:
+    """
+    Shared admission controller for outbound LLM requests.
+
+    Callers wrap each provider call in ``async with controller.admit(...)``.
+    Waiters are granted slots tenant by tenant in round-robin order, so a quiz
+    with many batches cannot starve a quiz that enqueued later.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_in_flight_per_tenant: int | None = None,
+        default_limits: ModelRateLimits | None = None,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_tenant = max_in_flight_per_tenant or max_in_flight
+        self.default_limits = default_limits or ModelRateLimits()
+
+        self._in_flight = 0
+        self._tenant_in_flight: dict[str, int] = {}
+        self._waiters: dict[str, deque[asyncio.Future[None]]] = {}
+        self._rotation: deque[str] = deque()
+        self._buckets: dict[str, _ModelBuckets] = {}
+
+        self._stats = {
+            "admitted": 0,
+            "queued": 0,
+            "rate_limited": 0,
+            "total_wait_time": 0.0,
+        }
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        model_key: str,
+        estimated_tokens: int,
+        tenant: str | None = None,
+        limits: ModelRateLimits | None = None,
+    ) -> AsyncIterator[AdmissionTicket]:
+        """
+        Wait for rate budget and a concurrency slot, then hold the slot.
+
+        The model's budget is waited for without holding a slot, so requests
+        to a rate-limited model do not block other models and tenants.
+
+        Args:
+            model_key: Identifier of the model budget (e.g. "openai:gpt-5-mini")
+            estimated_tokens: Estimated total tokens for the request
+            tenant: Fairness key, typically the quiz ID
+            limits: Per-model budgets, defaults to the controller defaults
+
+        Yields:
+            Ticket used to reconcile the token estimate with actual usage
+        """
+        tenant = tenant or DEFAULT_TENANT
+        started_at = time.monotonic()
+
+        buckets = self._get_buckets(model_key, limits or self.default_limits)
+        await self._acquire_slot_with_budget(tenant, buckets, estimated_tokens)
+        ticket = AdmissionTicket(model_key=model_key, estimated_tokens=estimated_tokens)
+        try:
+            ticket.wait_time = time.monotonic() - started_at
+
+            self._stats["admitted"] += 1
+            self._stats["total_wait_time"] += ticket.wait_time
+            if ticket.wait_time >= 1.0:
+                logger.info(
+                    "llm_admission_delayed",
+                    model=model_key,
+                    tenant=tenant,
+                    wait_time=round(ticket.wait_time, 3),
+                    in_flight=self._in_flight,
+                    queued_tenants=len(self._rotation),
+                )
+
+            yield ticket
+        finally:
+            self._release_slot(tenant)
+            if ticket.actual_tokens is not None and ticket.estimated_tokens:
+                self._reconcile(model_key, ticket)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get admission statistics."""
+        return {
+            **self._stats,
+            "in_flight": self._in_flight,
+            "waiting": sum(len(queue) for queue in self._waiters.values()),
+            "waiting_tenants": len(self._rotation),
+            "max_in_flight": self.max_in_flight,
+            "max_in_flight_per_tenant": self.max_in_flight_per_tenant,
+        }
+
+    def _has_capacity(self, tenant: str) -> bool:
+        return (
+            self._in_flight < self.max_in_flight
+            and self._tenant_in_flight.get(tenant, 0) < self.max_in_flight_per_tenant
+        )
+
+    def _take_slot(self, tenant: str) -> None:
+        self._in_flight += 1
+        self._tenant_in_flight[tenant] = self._tenant_in_flight.get(tenant, 0) + 1
+
+    async def _acquire_slot(self, tenant: str) -> None:
+        if self._has_capacity(tenant) and not self._waiters.get(tenant):
+            self._take_slot(tenant)
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue = self._waiters.get(tenant)
+        if queue is None:
+            queue = self._waiters[tenant] = deque()
+            self._rotation.append(tenant)
+        queue.append(waiter)
+        self._stats["queued"] += 1
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before cancellation; give it back
+                self._release_slot(tenant)
+            else:
+                self._discard_waiter(tenant, waiter)
+            raise
+
+    def _discard_waiter(self, tenant: str, waiter: asyncio.Future[None]) -> None:
+        queue = self._waiters.get(tenant)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            pass
+        if not queue:
+            del self._waiters[tenant]
+            self._rotation.remove(tenant)
+
+    def _release_slot(self, tenant: str) -> None:
+        self._in_flight -= 1
+        remaining = self._tenant_in_flight.get(tenant, 0) - 1
+        if remaining > 0:
+            self._tenant_in_flight[tenant] = remaining
+        else:
+            self._tenant_in_flight.pop(tenant, None)
+        self._grant_waiters()
+
+    def _grant_waiters(self) -> None:
+        """Hand free slots to waiting tenants in round-robin order."""
+        skipped = 0
+        while (
+            self._rotation
+            and self._in_flight < self.max_in_flight
+            and skipped < len(self._rotation)
+        ):
+            tenant = self._rotation[0]
+            self._rotation.rotate(-1)
+
+            if not self._has_capacity(tenant):
+                skipped += 1
+                continue
+
+            queue = self._waiters[tenant]
+            waiter = queue.popleft()
+            if not queue:
+                del self._waiters[tenant]
+                self._rotation.pop()
+
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+
+            self._take_slot(tenant)
+            waiter.set_result(None)
+            skipped = 0
+
+    def _get_buckets(self, model_key: str, limits: ModelRateLimits) -> _ModelBuckets:
+        buckets = self._buckets.get(model_key)
+        if buckets is None or buckets.limits != limits:
+            buckets = _ModelBuckets(
+                limits=limits,
+                requests=(
+                    TokenBucket(limits.requests_per_minute)
+                    if limits.requests_per_minute
+                    else None
+                ),
+                tokens=(
+                    TokenBucket(limits.tokens_per_minute)
+                    if limits.tokens_per_minute
+                    else None
+                ),
+            )
+            self._buckets[model_key] = buckets
+        return buckets
+
+    def _budget_delay(self, buckets: _ModelBuckets, estimated_tokens: int) -> float:
+        delay = 0.0
+        if buckets.requests:
+            delay = max(delay, buckets.requests.time_until_available(1))
+        if buckets.tokens:
+            delay = max(delay, buckets.tokens.time_until_available(estimated_tokens))
+        return delay
+
+    async def _acquire_slot_with_budget(
+        self, tenant: str, buckets: _ModelBuckets, estimated_tokens: int
+    ) -> None:
+        rate_limited = False
+        while True:
+            delay = self._budget_delay(buckets, estimated_tokens)
+            if delay > 0:
+                if not rate_limited:
+                    rate_limited = True
+                    self._stats["rate_limited"] += 1
+                await asyncio.sleep(delay)
+                continue
+
+            await self._acquire_slot(tenant)
+            # Others may have spent the budget while this request was queued
+            if self._budget_delay(buckets, estimated_tokens) <= 0:
+                break
+            self._release_slot(tenant)
+
+        if buckets.requests:
+            buckets.requests.consume(1)
+        if buckets.tokens:
+            buckets.tokens.consume(estimated_tokens)
+
+    def _reconcile(self, model_key: str, ticket: AdmissionTicket) -> None:
+        buckets = self._buckets.get(model_key)
+        if buckets is None or buckets.tokens is None or ticket.actual_tokens is None:
+            return
+
+        difference = ticket.actual_tokens - ticket.estimated_tokens
+        if difference > 0:
+            buckets.tokens.consume(difference)
+        elif difference < 0:
+            buckets.tokens.refund(-difference)
+
+
+def estimate_tokens(messages: list[Any], max_completion_tokens: int | None) -> int:
+    """
+    Estimate total tokens for a request from message sizes.
+
+    Args:
+        messages: Messages with a ``content`` attribute
+        max_completion_tokens: Configured completion limit, if any
+
+    Returns:
+        Estimated prompt plus completion tokens
+    """
+    prompt_chars = sum(len(message.content) for message in messages)
+    return prompt_chars // CHARS_PER_TOKEN + 1 + (max_completion_tokens or 0)
+
+
+# Global admission controller instance
+_admission_controller: LLMAdmissionController | None = None
+
+
+def get_admission_controller() -> LLMAdmissionController:
+    """Get the process-wide LLM admission controller."""
+    global _admission_controller
+
+    if _admission_controller is None:
+        from src.config import settings
+
+        from ..config import get_configuration_service
+
+        config = get_configuration_service().get_config()
+        _admission_controller = LLMAdmissionController(
+            max_in_flight=config.max_concurrent_generations,
+            max_in_flight_per_tenant=settings.MAX_CONCURRENT_MODULES,
+            default_limits=ModelRateLimits(
+                requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+                tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+            ),
+        )
+
+        logger.info(
+            "llm_admission_controller_initialized",
+            max_in_flight=_admission_controller.max_in_flight,
+            max_in_flight_per_tenant=_admission_controller.max_in_flight_per_tenant,
+            requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+        )
+
+    return _admission_controller
+
+
+def reset_admission_controller() -> None:
+    """Drop the global controller so it is rebuilt from current settings."""
+    global _admission_controller
+    _admission_controller = None
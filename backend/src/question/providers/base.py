@@ -2,6 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -10,6 +11,8 @@ from pydantic import BaseModel, Field
 
 from src.config import get_logger
 
+from .admission import ModelRateLimits, get_admission_controller
+
 logger = get_logger("llm_provider")
 
 
@@ -22,6 +25,7 @@ class LLMProvider(str, Enum):
     """Enumeration of supported LLM providers."""
 
     OPENAI = "openai"
+    OPENAI_BATCH = "openai_batch"  # Offline generation via the OpenAI Batch API
     ANTHROPIC = "anthropic"
     AZURE_OPENAI = "azure_openai"
     OLLAMA = "ollama"
@@ -36,6 +40,7 @@ class LLMModel(BaseModel):
     display_name: str
     max_tokens: int
     supports_streaming: bool = False
+    supports_structured_output: bool = False
     cost_per_1k_tokens: float | None = None
     description: str | None = None
 
@@ -120,6 +125,19 @@ class RateLimitError(LLMError):
         self.retry_after = retry_after
 
 
+class CircuitOpenError(LLMError):
+    """Exception raised when a provider's circuit breaker rejects a call."""
+
+    def __init__(
+        self,
+        message: str,
+        provider: LLMProvider | None = None,
+        retry_after: float | None = None,
+    ):
+        super().__init__(message, provider, "circuit_open", retryable=True)
+        self.retry_after = retry_after
+
+
 class AuthenticationError(LLMError):
     """Exception for authentication errors."""
 
@@ -175,6 +193,75 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Release work the provider still holds open; nothing by default."""
+        return
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether the configured model streams tokens natively."""
+        return False
+
+    @property
+    def supports_structured_output(self) -> bool:
+        """
+        Whether the configured model honours a ``response_schema``.
+
+        Providers that support it accept a JSON schema as the
+        ``response_schema`` generation parameter and constrain the response to
+        it. Others must not be passed the parameter.
+        """
+        return False
+
+    @property
+    def model_key(self) -> str:
+        """Key of the configured model in the shared admission and circuit state."""
+        return f"{self.provider_name.value}:{self.configuration.model}"
+
+    def backoff_remaining(self) -> float:
+        """Seconds left on the shared backoff for the configured model."""
+        from .circuit_breaker import get_circuit_breakers
+
+        return get_circuit_breakers().get(self.model_key).backoff_remaining()
+
+    def get_model_info(self, model_id: str) -> LLMModel | None:
+        """
+        Get information about a specific model.
+
+        Args:
+            model_id: The model ID
+
+        Returns:
+            Model information or None if not found
+        """
+        models: list[LLMModel] = getattr(self, "_models", [])
+        for model in models:
+            if model.model_id == model_id:
+                return model
+        return None
+
+    async def stream(
+        self, messages: list[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """
+        Stream the response content as it is generated.
+
+        Providers without native streaming yield the complete response as a
+        single chunk.
+
+        Args:
+            messages: List of messages for the conversation
+            **kwargs: Additional generation parameters
+
+        Yields:
+            Content chunks in generation order
+
+        Raises:
+            LLMError: If generation fails
+        """
+        response = await self.generate(messages, **kwargs)
+        yield response.content
+
     @abstractmethod
     async def get_available_models(self) -> list[LLMModel]:
         """
@@ -195,14 +282,124 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    def get_rate_limits(self) -> ModelRateLimits:
+        """
+        Get the request and token budgets for this provider's model.
+
+        Budgets default to the global settings and can be overridden per
+        provider with ``requests_per_minute`` / ``tokens_per_minute`` in
+        ``provider_settings``.
+
+        Returns:
+            Rate limits for the configured model
+        """
+        defaults = get_admission_controller().default_limits
+        provider_settings = self.configuration.provider_settings
+        return ModelRateLimits(
+            requests_per_minute=provider_settings.get(
+                "requests_per_minute", defaults.requests_per_minute
+            ),
+            tokens_per_minute=provider_settings.get(
+                "tokens_per_minute", defaults.tokens_per_minute
+            ),
+        )
+
+    async def _generate_admitted(
+        self, messages: list[LLMMessage], tenant: str | None, **kwargs: Any
+    ) -> LLMResponse:
+        """Run a single generation attempt under the shared admission controller."""
+        from .circuit_breaker import get_circuit_breakers
+        from .tokens import count_prompt_tokens, get_token_counter
+
+        controller = get_admission_controller()
+        model_key = self.model_key
+        prompt_tokens = await count_prompt_tokens(
+            get_token_counter(self.configuration.model), messages
+        )
+
+        # The breaker is checked before admission so a failing-fast call never
+        # holds a concurrency slot
+        async with get_circuit_breakers().get(model_key).guard():
+            async with controller.admit(
+                model_key,
+                prompt_tokens + (self.configuration.max_tokens or 0),
+                tenant=tenant,
+                limits=self.get_rate_limits(),
+            ) as ticket:
+                response = await self.generate(messages, **kwargs)
+                ticket.record_usage(response.total_tokens)
+
+        # Kept next to the provider's reported prompt_tokens for comparison
+        response.metadata["estimated_prompt_tokens"] = prompt_tokens
+        return response
+
+    async def stream_with_admission(
+        self,
+        messages: list[LLMMessage],
+        *,
+        tenant: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response under the shared admission controller.
+
+        Streams are not retried or cached: once chunks have been consumed a
+        transparent retry would duplicate output, so callers handle failures
+        (see ``retry_delay`` for the backoff ``generate_with_retry`` uses).
+        The provider's circuit breaker still applies.
+
+        Args:
+            messages: List of messages for the conversation
+            tenant: Fairness key for admission queuing, typically the quiz ID
+            **kwargs: Additional generation parameters
+
+        Yields:
+            Content chunks in generation order
+        """
+        if not self._initialized:
+            await self.initialize()
+            self._initialized = True
+
+        from .circuit_breaker import get_circuit_breakers
+        from .tokens import count_prompt_tokens, get_token_counter
+
+        controller = get_admission_controller()
+        model_key = self.model_key
+        prompt_tokens = await count_prompt_tokens(
+            get_token_counter(self.configuration.model), messages
+        )
+
+        async with get_circuit_breakers().get(model_key).guard():
+            async with controller.admit(
+                model_key,
+                prompt_tokens + (self.configuration.max_tokens or 0),
+                tenant=tenant,
+                limits=self.get_rate_limits(),
+            ):
+                async for chunk in self.stream(messages, **kwargs):
+                    yield chunk
+
     async def generate_with_retry(
-        self, messages: list[LLMMessage], **kwargs: Any
+        self,
+        messages: list[LLMMessage],
+        *,
+        tenant: str | None = None,
+        cache_bypass: bool = False,
+        **kwargs: Any,
     ) -> LLMResponse:
         """
         Generate with automatic retry logic.
 
+        When content caching is enabled, identical requests are served from the
+        response cache. Identical requests already in flight are coalesced so
+        only one upstream call is made. Each attempt passes the provider's
+        circuit breaker and is admitted by the process-wide admission
+        controller, so retry backoff does not hold a concurrency slot.
+
         Args:
             messages: List of messages for the conversation
+            tenant: Fairness key for admission queuing, typically the quiz ID
+            cache_bypass: Skip the response cache and request coalescing for this call
             **kwargs: Additional generation parameters
 
         Returns:
@@ -211,6 +408,65 @@ class BaseLLMProvider(ABC):
         Raises:
             LLMError: If all retries fail
         """
+        from src.config import settings
+
+        from .cache import get_response_cache, request_key
+        from .coalescing import get_request_coalescer
+
+        cache = None if cache_bypass else get_response_cache()
+        coalesce = settings.LLM_REQUEST_COALESCING_ENABLED and not cache_bypass
+        key = None
+        if cache is not None or coalesce:
+            key = request_key(
+                self.provider_name.value,
+                self.configuration.model,
+                self.configuration.temperature,
+                messages,
+                **kwargs,
+            )
+
+        if cache is not None and key is not None:
+            cached_response = await cache.get(key)
+            if cached_response is not None:
+                return cached_response
+
+        async def generate_and_store() -> LLMResponse:
+            response = await self._generate_with_retries(messages, tenant, **kwargs)
+            if cache is not None and key is not None:
+                await cache.set(key, response)
+                response.metadata["cache_key"] = key
+            return response
+
+        if coalesce and key is not None:
+            return await get_request_coalescer().run(key, generate_and_store)
+        return await generate_and_store()
+
+    def retry_delay(self, attempt: int, error: LLMError) -> float:
+        """
+        Backoff before retrying a failed attempt.
+
+        Args:
+            attempt: Zero-based index of the attempt that failed
+            error: The retryable error it failed with
+
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        delay = min(
+            self.configuration.initial_retry_delay
+            * (self.configuration.retry_backoff_factor**attempt),
+            self.configuration.max_retry_delay,
+        )
+
+        # Honour server-provided or circuit breaker wait times
+        if isinstance(error, RateLimitError | CircuitOpenError) and error.retry_after:
+            delay = max(delay, error.retry_after)
+        return delay
+
+    async def _generate_with_retries(
+        self, messages: list[LLMMessage], tenant: str | None, **kwargs: Any
+    ) -> LLMResponse:
+        """Run the retry loop for a single logical request."""
         if not self._initialized:
             await self.initialize()
             self._initialized = True
@@ -219,7 +475,7 @@ class BaseLLMProvider(ABC):
 
         for attempt in range(self.configuration.max_retries + 1):
             try:
-                return await self.generate(messages, **kwargs)
+                return await self._generate_admitted(messages, tenant, **kwargs)
 
             except LLMError as e:
                 last_exception = e
@@ -246,17 +502,7 @@ class BaseLLMProvider(ABC):
                     )
                     raise
 
-                # Calculate delay for retry
-                delay = min(
-                    self.configuration.initial_retry_delay
-                    * (self.configuration.retry_backoff_factor**attempt),
-                    self.configuration.max_retry_delay,
-                )
-
-                # Special handling for rate limits
-                if isinstance(e, RateLimitError) and e.retry_after:
-                    delay = max(delay, e.retry_after)
-
+                delay = self.retry_delay(attempt, e)
                 logger.warning(
                     "llm_error_retrying",
                     provider=self.provider_name.value,
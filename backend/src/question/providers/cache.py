@@ -0,0 +1,491 @@
+"""Content-addressed cache for LLM responses.
+
+Responses are keyed on a hash of the provider, model, temperature and the
+rendered messages, so retrying or regenerating a batch with an identical
+prompt can reuse a response we have already paid for. The cache is opt-in
+via ``QuestionGenerationConfig.enable_content_caching`` and supports three
+pluggable backends: in-memory LRU, on-disk JSON files and a Postgres table.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Column, DateTime, delete, func, select
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlmodel import Field, SQLModel
+
+from src.config import get_logger
+
+from .base import LLMMessage, LLMResponse
+
+logger = get_logger("llm_response_cache")
+
+
+class LLMResponseCacheEntry(SQLModel, table=True):
+    """Cached LLM response stored by the Postgres cache backend."""
+
+    __tablename__ = "llm_response_cache"
+
+    key: str = Field(primary_key=True, max_length=64)
+    model: str = Field(index=True)
+    response: dict[str, Any] = Field(sa_column=Column(JSONB, nullable=False))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=True
+        ),
+    )
+    last_accessed_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True)
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True)
+    )
+
+
+def request_key(
+    provider: str,
+    model: str,
+    temperature: float,
+    messages: list[LLMMessage],
+    **kwargs: Any,
+) -> str:
+    """
+    Build the content-addressed key identifying an LLM request.
+
+    Args:
+        provider: Provider name
+        model: Model identifier
+        temperature: Sampling temperature
+        messages: Rendered conversation messages
+        **kwargs: Extra generation parameters passed to the provider
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "temperature": temperature,
+            "messages": [(message.role, message.content) for message in messages],
+            "params": kwargs,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCacheBackend(ABC):
+    """Storage backend for cached responses."""
+
+    @abstractmethod
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached payload for ``key``, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: dict[str, Any], ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove ``key`` from the cache if present."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all entries."""
+        pass
+
+
+class InMemoryCacheBackend(ResponseCacheBackend):
+    """Process-local LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        # Callers may edit the response they build from it; keep the entry intact
+        return copy.deepcopy(value)
+
+    async def set(self, key: str, value: dict[str, Any], ttl: float) -> None:
+        self._entries[key] = (time.time() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskCacheBackend(ResponseCacheBackend):
+    """
+    One JSON file per entry in a cache directory.
+
+    File modification time tracks recency, so size-based eviction removes the
+    least recently used files. File I/O runs in a worker thread.
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: dict[str, Any], ttl: float) -> None:
+        await asyncio.to_thread(self._write, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if entry["expires_at"] <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+
+        # Touch the file so it counts as recently used
+        os.utime(path)
+        value: dict[str, Any] = entry["value"]
+        return value
+
+    def _write(self, key: str, value: dict[str, Any], ttl: float) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"expires_at": time.time() + ttl, "value": value}, f)
+        tmp_path.replace(path)
+        self._evict()
+
+    def _evict(self) -> None:
+        files = list(self.directory.glob("*.json"))
+        excess = len(files) - self.max_entries
+        if excess <= 0:
+            return
+
+        files.sort(key=lambda file: file.stat().st_mtime)
+        for file in files[:excess]:
+            file.unlink(missing_ok=True)
+
+    def _clear(self) -> None:
+        for file in self.directory.glob("*.json"):
+            file.unlink(missing_ok=True)
+
+
+class PostgresCacheBackend(ResponseCacheBackend):
+    """
+    Cache entries stored in the ``llm_response_cache`` table.
+
+    Shared by all application processes. Expired and least recently used
+    rows are pruned periodically rather than on every write.
+    """
+
+    # Number of writes between eviction passes
+    EVICTION_INTERVAL = 50
+
+    def __init__(
+        self,
+        max_entries: int,
+        session_factory: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+    ):
+        if session_factory is None:
+            from src.database import get_async_session
+
+            session_factory = get_async_session
+
+        self.max_entries = max_entries
+        self._session_factory = session_factory
+        self._writes_since_eviction = 0
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        now = datetime.now(timezone.utc)
+        async with self._session_factory() as session:
+            entry = await session.get(LLMResponseCacheEntry, key)
+            if entry is None:
+                return None
+
+            if entry.expires_at <= now:
+                await session.delete(entry)
+                await session.commit()
+                return None
+
+            response = entry.response
+            entry.last_accessed_at = now
+            await session.commit()
+            return response
+
+    async def set(self, key: str, value: dict[str, Any], ttl: float) -> None:
+        now = datetime.now(timezone.utc)
+        values = {
+            "key": key,
+            "model": value.get("model", ""),
+            "response": value,
+            "last_accessed_at": now,
+            "expires_at": now + timedelta(seconds=ttl),
+        }
+        statement = insert(LLMResponseCacheEntry).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                "response": statement.excluded.response,
+                "last_accessed_at": statement.excluded.last_accessed_at,
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
+
+        async with self._session_factory() as session:
+            await session.execute(statement)
+
+            self._writes_since_eviction += 1
+            if self._writes_since_eviction >= self.EVICTION_INTERVAL:
+                self._writes_since_eviction = 0
+                await self._evict(session, now)
+
+            await session.commit()
+
+    async def delete(self, key: str) -> None:
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(LLMResponseCacheEntry).where(
+                    LLMResponseCacheEntry.key == key  # type: ignore[arg-type]
+                )
+            )
+            await session.commit()
+
+    async def clear(self) -> None:
+        async with self._session_factory() as session:
+            await session.execute(delete(LLMResponseCacheEntry))
+            await session.commit()
+
+    async def _evict(self, session: Any, now: datetime) -> None:
+        await session.execute(
+            delete(LLMResponseCacheEntry).where(
+                LLMResponseCacheEntry.expires_at <= now  # type: ignore[arg-type]
+            )
+        )
+        stale_keys = (
+            select(LLMResponseCacheEntry.key)  # type: ignore[call-overload]
+            .order_by(LLMResponseCacheEntry.last_accessed_at.desc())  # type: ignore[attr-defined]
+            .offset(self.max_entries)
+        )
+        await session.execute(
+            delete(LLMResponseCacheEntry).where(
+                LLMResponseCacheEntry.key.in_(stale_keys)  # type: ignore[attr-defined]
+            )
+        )
+
+
+class ResponseCache:
+    """
+    LLM response cache in front of a storage backend.
+
+    Backend failures are logged and treated as misses, so the cache can never
+    fail a generation.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend, ttl_seconds: float):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "invalidations": 0}
+        self._errors = 0
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: float,
+        messages: list[LLMMessage],
+        **kwargs: Any,
+    ) -> str:
+        """Build the content-addressed key for a request (see ``request_key``)."""
+        return request_key(provider, model, temperature, messages, **kwargs)
+
+    async def get(self, key: str) -> LLMResponse | None:
+        """Look up a cached response."""
+        try:
+            payload = await self.backend.get(key)
+        except Exception as e:
+            self._errors += 1
+            logger.warning("llm_response_cache_read_failed", error=str(e))
+            payload = None
+
+        if payload is None:
+            self._stats["misses"] += 1
+            return None
+
+        self._stats["hits"] += 1
+        response = LLMResponse.model_validate(payload)
+        response.metadata.update({"cache_hit": True, "cache_key": key})
+
+        logger.info(
+            "llm_response_cache_hit",
+            model=response.model,
+            hits=self._stats["hits"],
+            misses=self._stats["misses"],
+        )
+        return response
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response."""
+        try:
+            await self.backend.set(
+                key, response.model_dump(mode="json"), self.ttl_seconds
+            )
+            self._stats["writes"] += 1
+        except Exception as e:
+            self._errors += 1
+            logger.warning("llm_response_cache_write_failed", error=str(e))
+
+    async def invalidate(self, key: str) -> None:
+        """Remove a response, e.g. because its content was rejected."""
+        try:
+            await self.backend.delete(key)
+            self._stats["invalidations"] += 1
+        except Exception as e:
+            self._errors += 1
+            logger.warning("llm_response_cache_delete_failed", error=str(e))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "errors": self._errors,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "backend": type(self.backend).__name__,
+        }
+
+
+def create_cache_backend(backend: str) -> ResponseCacheBackend:
+    """
+    Create a cache backend from its configured name.
+
+    Args:
+        backend: One of "memory", "disk" or "postgres"
+
+    Returns:
+        Cache backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    from src.config import settings
+
+    max_entries = settings.LLM_RESPONSE_CACHE_MAX_ENTRIES
+    if backend == "memory":
+        return InMemoryCacheBackend(max_entries)
+    if backend == "disk":
+        return DiskCacheBackend(settings.LLM_RESPONSE_CACHE_DIR, max_entries)
+    if backend == "postgres":
+        return PostgresCacheBackend(max_entries)
+    raise ValueError(f"Unknown LLM response cache backend: {backend}")
+
+
+# Global response cache instance (None when caching is disabled)
+_response_cache: ResponseCache | None = None
+_response_cache_loaded = False
+
+
+def get_response_cache() -> ResponseCache | None:
+    """
+    Get the global response cache.
+
+    Returns:
+        The configured cache, or None if content caching is disabled
+    """
+    global _response_cache, _response_cache_loaded
+
+    if not _response_cache_loaded:
+        from src.config import settings
+
+        from ..config import get_configuration_service
+
+        if get_configuration_service().get_config().enable_content_caching:
+            _response_cache = ResponseCache(
+                create_cache_backend(settings.LLM_RESPONSE_CACHE_BACKEND),
+                ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL,
+            )
+            logger.info(
+                "llm_response_cache_enabled",
+                backend=settings.LLM_RESPONSE_CACHE_BACKEND,
+                ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL,
+                max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+            )
+        _response_cache_loaded = True
+
+    return _response_cache
+
+
+def set_response_cache(cache: ResponseCache | None) -> None:
+    """Replace the global response cache (None disables caching)."""
+    global _response_cache, _response_cache_loaded
+    _response_cache = cache
+    _response_cache_loaded = True
+
+
+def reset_response_cache() -> None:
+    """Drop the global cache so it is rebuilt from current configuration."""
+    global _response_cache, _response_cache_loaded
+    _response_cache = None
+    _response_cache_loaded = False
+
+
+async def discard_cached_responses(keys: list[str]) -> None:
+    """
+    Invalidate cached responses whose content was rejected downstream.
+
+    Without this, retrying a failed batch would replay the same rejected
+    response from the cache.
+
+    Args:
+        keys: Cache keys taken from ``LLMResponse.metadata["cache_key"]``
+    """
+    cache = get_response_cache()
+    if cache is None:
+        return
+
+    for key in keys:
+        await cache.invalidate(key)
@@ -0,0 +1,262 @@
+"""Circuit breakers and shared backoff for LLM provider calls.
+
+One ``CircuitBreaker`` exists per provider/model pair and is shared by every
+task calling that model:
+
+- **closed**: calls pass through; consecutive transient failures are counted.
+- **open**: after ``failure_threshold`` consecutive failures calls fail fast
+  with ``CircuitOpenError`` until ``recovery_timeout`` has passed.
+- **half-open**: a single probe call is let through; success closes the
+  circuit, failure opens it again.
+
+Rate limit responses additionally set a shared backoff deadline taken from the
+provider's ``Retry-After`` information, so all tasks pause together instead of
+each retrying on its own schedule.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Any
+
+from src.config import get_logger
+
+from .base import CircuitOpenError, LLMError, RateLimitError
+
+logger = get_logger("llm_circuit_breaker")
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker with shared backoff for a single provider/model."""
+
+    def __init__(
+        self,
+        key: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ):
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        # Start of the current outage, which may span several reopenings
+        self._outage_started_at: float | None = None
+        self._probe_in_flight = False
+        self._backoff_until = 0.0
+        self._stats = {
+            "opened": 0,
+            "rejected": 0,
+            "failures": 0,
+            "backoff_waits": 0,
+            "open_seconds_total": 0.0,
+        }
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once recovery is due."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._opened_at is not None
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._stats["open_seconds_total"] += time.monotonic() - self._opened_at
+            self._opened_at = None
+            self._state = CircuitState.HALF_OPEN
+            logger.info("llm_circuit_half_open", circuit=self.key)
+        return self._state
+
+    def backoff_remaining(self) -> float:
+        """Seconds until the shared backoff deadline passes (0 if none)."""
+        return max(0.0, self._backoff_until - time.monotonic())
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """
+        Guard one provider call.
+
+        Waits out any shared backoff, rejects the call while the circuit is
+        open, and records the call's outcome on exit.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is in flight
+        """
+        await self._wait_for_backoff()
+        probe = self._before_call()
+
+        try:
+            yield
+        except LLMError as e:
+            self._record_failure(e)
+            raise
+        except BaseException:
+            # Cancellation and unexpected errors say nothing about the provider
+            if probe:
+                self._probe_in_flight = False
+            raise
+        else:
+            self._record_success()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get circuit statistics, including time spent open."""
+        state = self.state
+        open_seconds = self._stats["open_seconds_total"]
+        if self._opened_at is not None:
+            open_seconds += time.monotonic() - self._opened_at
+        return {
+            **self._stats,
+            "open_seconds_total": round(open_seconds, 3),
+            "state": state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "backoff_remaining": round(self.backoff_remaining(), 3),
+        }
+
+    async def _wait_for_backoff(self) -> None:
+        waited = False
+        while (remaining := self.backoff_remaining()) > 0:
+            if not waited:
+                waited = True
+                self._stats["backoff_waits"] += 1
+            await asyncio.sleep(remaining)
+
+    def _before_call(self) -> bool:
+        """Admit or reject a call; returns whether it is the half-open probe."""
+        state = self.state
+
+        if state == CircuitState.CLOSED:
+            return False
+
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        self._stats["rejected"] += 1
+        retry_after = None
+        if state == CircuitState.OPEN and self._opened_at is not None:
+            retry_after = max(
+                0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)
+            )
+        raise CircuitOpenError(
+            f"Circuit open for {self.key}; failing fast",
+            retry_after=retry_after,
+        )
+
+    def _record_success(self) -> None:
+        self._consecutive_failures = 0
+        if self._state != CircuitState.CLOSED:
+            self._state = CircuitState.CLOSED
+            self._probe_in_flight = False
+            outage_seconds = 0.0
+            if self._outage_started_at is not None:
+                outage_seconds = time.monotonic() - self._outage_started_at
+                self._outage_started_at = None
+            logger.info(
+                "llm_circuit_closed",
+                circuit=self.key,
+                outage_seconds=round(outage_seconds, 3),
+                open_seconds_total=round(self._stats["open_seconds_total"], 3),
+            )
+
+    def _record_failure(self, error: LLMError) -> None:
+        # Non-retryable errors (bad credentials, unknown model) are caller
+        # problems and do not indicate an unhealthy provider
+        if not error.retryable or isinstance(error, CircuitOpenError):
+            if self._state == CircuitState.HALF_OPEN:
+                self._probe_in_flight = False
+            return
+
+        self._stats["failures"] += 1
+        self._consecutive_failures += 1
+
+        if isinstance(error, RateLimitError) and error.retry_after:
+            self._backoff_until = max(
+                self._backoff_until, time.monotonic() + error.retry_after
+            )
+            logger.info(
+                "llm_shared_backoff_set",
+                circuit=self.key,
+                retry_after=error.retry_after,
+            )
+
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._open(error)
+
+    def _open(self, error: LLMError) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        if self._outage_started_at is None:
+            self._outage_started_at = self._opened_at
+        self._probe_in_flight = False
+        self._stats["opened"] += 1
+        logger.warning(
+            "llm_circuit_opened",
+            circuit=self.key,
+            consecutive_failures=self._consecutive_failures,
+            error_code=error.error_code,
+            recovery_timeout=self.recovery_timeout,
+        )
+
+
+class CircuitBreakerRegistry:
+    """Registry holding one circuit breaker per provider/model key."""
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, key: str) -> CircuitBreaker:
+        """Get (or create) the breaker for a provider/model key."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                key,
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+            )
+            self._breakers[key] = breaker
+        return breaker
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get statistics for every known circuit."""
+        return {key: breaker.get_stats() for key, breaker in self._breakers.items()}
+
+
+# Global circuit breaker registry instance
+_circuit_breakers: CircuitBreakerRegistry | None = None
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get the process-wide circuit breaker registry."""
+    global _circuit_breakers
+
+    if _circuit_breakers is None:
+        from src.config import settings
+
+        _circuit_breakers = CircuitBreakerRegistry(
+            failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=settings.LLM_CIRCUIT_RECOVERY_TIMEOUT,
+        )
+
+    return _circuit_breakers
+
+
+def reset_circuit_breakers() -> None:
+    """Drop all circuit state so breakers are rebuilt from current settings."""
+    global _circuit_breakers
+    _circuit_breakers = None
@@ -0,0 +1,101 @@
+"""Single-flight coalescing of identical in-flight LLM requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from src.config import get_logger
+
+from .base import LLMResponse
+
+logger = get_logger("llm_request_coalescing")
+
+
+@dataclass
+class _Flight:
+    """An upstream request shared by every caller with the same key."""
+
+    task: asyncio.Task[LLMResponse]
+    waiters: int = 0
+
+
+class RequestCoalescer:
+    """
+    Deduplicates concurrent requests that share a request key.
+
+    The first caller for a key starts the upstream request in its own task;
+    callers arriving while it is in flight await the same task and each receive
+    their own copy of its ``LLMResponse`` (or the same exception). The upstream
+    task is only cancelled once every waiter has gone away.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, _Flight] = {}
+        self._stats = {"leaders": 0, "coalesced": 0}
+
+    async def run(
+        self, key: str, request: Callable[[], Awaitable[LLMResponse]]
+    ) -> LLMResponse:
+        """
+        Run ``request`` once per key among concurrent callers.
+
+        Args:
+            key: Request key, see ``cache.request_key``
+            request: Factory starting the upstream request
+
+        Returns:
+            A copy of the response shared by all callers with this key, which
+            the caller may modify freely
+        """
+        loop = asyncio.get_running_loop()
+        flight = self._flights.get(key)
+
+        if flight is not None and flight.task.get_loop() is loop:
+            self._stats["coalesced"] += 1
+            logger.info(
+                "llm_request_coalesced",
+                waiters=flight.waiters + 1,
+                coalesced_total=self._stats["coalesced"],
+            )
+        else:
+            flight = _Flight(task=loop.create_task(self._run_request(request)))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._finish(key, flight))
+            self._stats["leaders"] += 1
+
+        flight.waiters += 1
+        try:
+            response = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Last interested caller left; stop the upstream request
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+        return response.model_copy(deep=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescing statistics."""
+        return {**self._stats, "in_flight": len(self._flights)}
+
+    @staticmethod
+    async def _run_request(
+        request: Callable[[], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        return await request()
+
+    def _finish(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+# Global request coalescer instance
+request_coalescer = RequestCoalescer()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Get the global LLM request coalescer."""
+    return request_coalescer
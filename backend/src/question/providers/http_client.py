@@ -0,0 +1,95 @@
+"""Shared pooled HTTP client for LLM provider SDKs."""
+
+import asyncio
+import importlib.util
+
+import httpx
+
+from src.config import get_logger, settings
+
+logger = get_logger("llm_http_client")
+
+
+def _http2_available() -> bool:
+    """HTTP/2 support in httpx requires the optional ``h2`` package."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class SharedHTTPClient:
+    """
+    Lazily created ``httpx.AsyncClient`` shared by all provider instances.
+
+    The client is bound to the event loop it was created on. A request from a
+    different loop gets a fresh client, since pooled connections cannot be
+    reused across loops.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared client, creating it if needed.
+
+        Returns:
+            Pooled async HTTP client
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = self._create_client()
+            self._loop = loop
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        http2 = _http2_available()
+        limits = httpx.Limits(
+            max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+        )
+
+        logger.info(
+            "llm_http_client_created",
+            http2=http2,
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+        )
+
+        # Per-request timeouts are set by the provider SDKs
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=limits,
+            timeout=httpx.Timeout(settings.LLM_API_TIMEOUT, connect=10.0),
+            follow_redirects=True,
+        )
+
+    @property
+    def is_open(self) -> bool:
+        """Whether a live client currently exists."""
+        return self._client is not None and not self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close the shared client and its pooled connections."""
+        client, loop = self._client, self._loop
+        self._client, self._loop = None, None
+        if client is None or client.is_closed:
+            return
+
+        # Connections from another (possibly closed) loop cannot be closed here
+        if loop is not asyncio.get_running_loop():
+            logger.warning("llm_http_client_dropped", reason="different_event_loop")
+            return
+
+        await client.aclose()
+        logger.info("llm_http_client_closed")
+
+
+# Global shared client instance
+shared_http_client = SharedHTTPClient()
+
+
+def get_shared_http_client() -> SharedHTTPClient:
+    """Get the global shared LLM HTTP client."""
+    return shared_http_client
@@ -0,0 +1,445 @@
+"""OpenAI Batch API provider for offline, lower-cost generation.
+
+Instead of calling the chat completions endpoint directly, each ``generate``
+call is queued. Requests arriving close together (e.g. every module batch of
+a quiz, which start in parallel) are written into one JSONL file, submitted
+as a single Batch API job and polled until the job finishes. Each waiting
+caller then receives its own line of the batch output as a normal
+``LLMResponse``, so the workflows' validation and save path is unchanged.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+import openai
+
+from src.config import get_logger
+
+from .base import (
+    AuthenticationError,
+    LLMConfiguration,
+    LLMError,
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    RateLimitError,
+)
+from .http_client import get_shared_http_client
+from .openai_provider import (
+    OpenAIProvider,
+    cached_tokens_from_usage,
+    response_format_from_schema,
+)
+
+logger = get_logger("openai_batch_provider")
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+TERMINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@dataclass
+class _PendingRequest:
+    """A queued chat completion request awaiting its batch result."""
+
+    custom_id: str
+    body: dict[str, Any]
+    future: asyncio.Future[dict[str, Any]]
+
+
+class OpenAIBatchProvider(OpenAIProvider):
+    """
+    OpenAI provider that routes generations through the Batch API.
+
+    Batch jobs complete within the configured completion window (up to 24
+    hours) at roughly half the synchronous price, and count against a separate
+    queue-based rate limit, so this provider is meant for offline runs where
+    latency does not matter.
+    """
+
+    def __init__(self, configuration: LLMConfiguration):
+        super().__init__(configuration)
+        self._batch_client: openai.AsyncOpenAI | None = None
+        self._pending: list[_PendingRequest] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Running batch jobs and the requests each one resolves
+        self._batch_tasks: dict[asyncio.Task[None], list[_PendingRequest]] = {}
+
+        from src.config import settings
+
+        settings_overrides = configuration.provider_settings
+        self.collect_window: float = settings_overrides.get(
+            "batch_collect_window", settings.LLM_BATCH_COLLECT_WINDOW
+        )
+        self.poll_interval: float = settings_overrides.get(
+            "batch_poll_interval", settings.LLM_BATCH_POLL_INTERVAL
+        )
+        self.max_requests_per_batch: int = settings_overrides.get(
+            "batch_max_requests", settings.LLM_BATCH_MAX_REQUESTS
+        )
+        self.completion_window: str = settings.LLM_BATCH_COMPLETION_WINDOW
+
+    @property
+    def provider_name(self) -> LLMProvider:
+        """Return the provider name."""
+        return LLMProvider.OPENAI_BATCH
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Batch jobs return complete responses only."""
+        return False
+
+    async def initialize(self) -> None:
+        """Initialize the OpenAI SDK client used for files and batches."""
+        if self._batch_client is not None:
+            return
+
+        api_key = self.configuration.provider_settings.get("api_key")
+        if not api_key:
+            raise AuthenticationError(
+                "OpenAI API key is required", provider=self.provider_name
+            )
+
+        self._http_client = get_shared_http_client().get_client()
+        self._batch_client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=self.configuration.provider_settings.get("base_url"),
+            timeout=self.configuration.timeout,
+            max_retries=0,  # We handle retries ourselves
+            http_client=self._http_client,
+        )
+
+        logger.info(
+            "openai_batch_provider_initialized",
+            model=self.configuration.model,
+            collect_window=self.collect_window,
+            poll_interval=self.poll_interval,
+            completion_window=self.completion_window,
+        )
+
+    async def _generate_admitted(
+        self, messages: list[LLMMessage], tenant: str | None, **kwargs: Any
+    ) -> LLMResponse:
+        """
+        Queue a request without holding a synchronous admission slot.
+
+        Batch jobs are limited by the Batch API's enqueued-token quota rather
+        than the synchronous request limits, and holding a concurrency slot for
+        hours would starve synchronous callers.
+        """
+        return await self.generate(messages, **kwargs)
+
+    async def generate(self, messages: list[LLMMessage], **kwargs: Any) -> LLMResponse:
+        """
+        Generate a response through the next Batch API job.
+
+        Args:
+            messages: List of messages for the conversation
+            **kwargs: Additional generation parameters
+
+        Returns:
+            LLM response
+
+        Raises:
+            LLMError: If the batch or this request within it fails
+        """
+        if (
+            self._batch_client is None
+            or self._http_client is not get_shared_http_client().get_client()
+        ):
+            # Shared HTTP client was closed or replaced; rebuild on the new one
+            self._batch_client = None
+            await self.initialize()
+
+        response_schema = kwargs.pop("response_schema", None)
+        if response_schema is not None and self.supports_structured_output:
+            kwargs["response_format"] = response_format_from_schema(response_schema)
+
+        start_time = time.time()
+        request = _PendingRequest(
+            custom_id=uuid.uuid4().hex,
+            body={
+                "model": self.configuration.model,
+                "temperature": self.configuration.temperature,
+                "messages": [
+                    {"role": message.role, "content": message.content}
+                    for message in messages
+                ],
+                **kwargs,
+            },
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._enqueue(request)
+
+        try:
+            result = await request.future
+        except asyncio.CancelledError:
+            self._withdraw(request)
+            raise
+        return self._parse_result(request, result, time.time() - start_time)
+
+    async def aclose(self) -> None:
+        """Cancel queued requests and every Batch API job still running."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for request in self._pending:
+            request.future.cancel()
+        self._pending = []
+
+        tasks = list(self._batch_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _withdraw(self, request: _PendingRequest) -> None:
+        """Drop a cancelled caller's request, cancelling its batch if now unused."""
+        request.future.cancel()
+        if request in self._pending:
+            self._pending.remove(request)
+            if not self._pending and self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            return
+
+        for task, requests in self._batch_tasks.items():
+            if request in requests:
+                if all(pending.future.done() for pending in requests):
+                    # No caller is left waiting, so stop paying for the job
+                    task.cancel()
+                return
+
+    def _enqueue(self, request: _PendingRequest) -> None:
+        self._pending.append(request)
+
+        if len(self._pending) >= self.max_requests_per_batch:
+            self._flush()
+            return
+
+        # Restart the collection window so a burst of requests shares one batch
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = asyncio.get_running_loop().call_later(
+            self.collect_window, self._flush
+        )
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        requests = [request for request in self._pending if not request.future.done()]
+        self._pending = []
+        if not requests:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(requests))
+        self._batch_tasks[task] = requests
+        task.add_done_callback(self._forget_batch)
+
+    def _forget_batch(self, task: asyncio.Task[None]) -> None:
+        self._batch_tasks.pop(task, None)
+
+    async def _run_batch(self, requests: list[_PendingRequest]) -> None:
+        """Submit one batch job, wait for it and resolve every request."""
+        batch_id = None
+        try:
+            batch_id = await self._submit_batch(requests)
+            batch = await self._wait_for_batch(batch_id)
+
+            results: dict[str, dict[str, Any]] = {}
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    results.update(await self._download_results(file_id))
+
+            logger.info(
+                "openai_batch_finished",
+                batch_id=batch_id,
+                status=batch.status,
+                request_count=len(requests),
+                result_count=len(results),
+            )
+
+            for request in requests:
+                result = results.get(request.custom_id)
+                if result is not None:
+                    result["batch_id"] = batch_id
+                    self._resolve(request, result)
+                else:
+                    self._fail(request, self._batch_status_error(batch.status))
+
+        except asyncio.CancelledError:
+            for request in requests:
+                request.future.cancel()
+            if batch_id is not None:
+                await self._cancel_batch(batch_id)
+            raise
+
+        except Exception as e:
+            error = e if isinstance(e, LLMError) else self._map_error(e)
+            logger.error(
+                "openai_batch_failed",
+                batch_id=batch_id,
+                request_count=len(requests),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            for request in requests:
+                self._fail(request, error)
+
+    async def _submit_batch(self, requests: list[_PendingRequest]) -> str:
+        if self._batch_client is None:
+            raise RuntimeError("OpenAI batch client not initialized")
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": CHAT_COMPLETIONS_ENDPOINT,
+                    "body": request.body,
+                },
+                ensure_ascii=False,
+            )
+            for request in requests
+        ]
+        input_file = await self._batch_client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await self._batch_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,  # type: ignore[arg-type]
+        )
+
+        logger.info(
+            "openai_batch_submitted",
+            batch_id=batch.id,
+            input_file_id=input_file.id,
+            request_count=len(requests),
+            model=self.configuration.model,
+        )
+        return batch.id
+
+    async def _wait_for_batch(self, batch_id: str) -> Any:
+        if self._batch_client is None:
+            raise RuntimeError("OpenAI batch client not initialized")
+
+        while True:
+            batch = await self._batch_client.batches.retrieve(batch_id)
+            if batch.status in TERMINAL_BATCH_STATUSES:
+                return batch
+
+            logger.debug(
+                "openai_batch_polled",
+                batch_id=batch_id,
+                status=batch.status,
+                completed=getattr(batch.request_counts, "completed", None),
+                total=getattr(batch.request_counts, "total", None),
+            )
+            await asyncio.sleep(self.poll_interval)
+
+    async def _cancel_batch(self, batch_id: str) -> None:
+        """Ask OpenAI to stop a job nobody is waiting for any more."""
+        if self._batch_client is None:
+            return
+
+        try:
+            await self._batch_client.batches.cancel(batch_id)
+            logger.info("openai_batch_cancelled", batch_id=batch_id)
+        except Exception as e:
+            # The job runs out its completion window; nothing else to do
+            logger.warning(
+                "openai_batch_cancel_failed",
+                batch_id=batch_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    async def _download_results(self, file_id: str) -> dict[str, dict[str, Any]]:
+        if self._batch_client is None:
+            raise RuntimeError("OpenAI batch client not initialized")
+
+        content = await self._batch_client.files.content(file_id)
+        results = {}
+        for line in content.text.splitlines():
+            if line.strip():
+                result = json.loads(line)
+                results[result["custom_id"]] = result
+        return results
+
+    def _resolve(self, request: _PendingRequest, result: dict[str, Any]) -> None:
+        if not request.future.done():
+            request.future.set_result(result)
+
+    def _fail(self, request: _PendingRequest, error: LLMError) -> None:
+        if not request.future.done():
+            request.future.set_exception(error)
+
+    def _batch_status_error(self, status: str) -> LLMError:
+        """Error for requests missing from a finished batch's output."""
+        return LLMError(
+            f"OpenAI batch {status} without a result for this request",
+            provider=self.provider_name,
+            error_code=f"batch_{status}",
+            # Expired or cancelled requests can be resubmitted in a new batch
+            retryable=status in ("expired", "cancelled"),
+        )
+
+    def _parse_result(
+        self,
+        request: _PendingRequest,
+        result: dict[str, Any],
+        response_time: float,
+    ) -> LLMResponse:
+        """Turn one batch output line into an ``LLMResponse`` or raise."""
+        response = result.get("response") or {}
+        status_code = response.get("status_code")
+        body = response.get("body") or {}
+
+        if result.get("error") or status_code != 200:
+            error = result.get("error") or body.get("error") or {}
+            message = error.get("message", "unknown error")
+            if status_code == 429:
+                raise RateLimitError(
+                    f"OpenAI rate limit exceeded: {message}",
+                    provider=self.provider_name,
+                )
+            raise LLMError(
+                f"OpenAI batch request failed: {message}",
+                provider=self.provider_name,
+                error_code=error.get("code") or "batch_request_failed",
+                retryable=isinstance(status_code, int) and status_code >= 500,
+            )
+
+        usage = body.get("usage") or {}
+        cached_tokens = cached_tokens_from_usage(usage)
+        content = body["choices"][0]["message"].get("content") or ""
+
+        logger.info(
+            "openai_batch_generation_completed",
+            model=body.get("model", self.configuration.model),
+            batch_id=result.get("batch_id"),
+            total_tokens=usage.get("total_tokens"),
+            cached_tokens=cached_tokens,
+            response_time=response_time,
+        )
+
+        return LLMResponse(
+            content=content,
+            model=body.get("model", self.configuration.model),
+            provider=self.provider_name,
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+            total_tokens=usage.get("total_tokens"),
+            response_time=response_time,
+            metadata={
+                "batch_id": result.get("batch_id"),
+                "custom_id": request.custom_id,
+                "cached_tokens": cached_tokens,
+            },
+        )
@@ -1,8 +1,14 @@
 """OpenAI LLM provider implementation."""
 
+import re
 import time
+from collections.abc import AsyncIterator, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
+import httpx
+import openai
 from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 
@@ -12,6 +18,7 @@ from .base import (
     AuthenticationError,
     BaseLLMProvider,
     LLMConfiguration,
+    LLMError,
     LLMMessage,
     LLMModel,
     LLMProvider,
@@ -19,9 +26,141 @@ from .base import (
     ModelNotFoundError,
     RateLimitError,
 )
+from .http_client import get_shared_http_client
 
 logger = get_logger("openai_provider")
 
+# Durations used by x-ratelimit-reset-* headers, e.g. "20ms", "1s", "6m0.5s"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str) -> float | None:
+    parts = _DURATION_PART.findall(value.strip())
+    if not parts:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def retry_after_from_headers(headers: Mapping[str, str]) -> float | None:
+    """
+    Extract the server-requested wait time from OpenAI response headers.
+
+    ``retry-after-ms`` and ``retry-after`` (seconds or HTTP date) take
+    precedence. Otherwise the ``x-ratelimit-reset-*`` value of whichever
+    request/token budget is exhausted is used.
+
+    Args:
+        headers: HTTP response headers
+
+    Returns:
+        Seconds to wait, or None if the headers carry no hint
+    """
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+    resets = []
+    for budget in ("requests", "tokens"):
+        reset = headers.get(f"x-ratelimit-reset-{budget}")
+        remaining = headers.get(f"x-ratelimit-remaining-{budget}")
+        if reset and remaining in (None, "0"):
+            seconds = _parse_duration(reset)
+            if seconds is not None:
+                resets.append(seconds)
+    return max(resets) if resets else None
+
+
+def cached_tokens_from_usage(usage: Any) -> int | None:
+    """
+    Extract the number of prompt tokens served from OpenAI's prompt cache.
+
+    Accepts raw API usage (``prompt_tokens_details.cached_tokens``) as well as
+    LangChain usage metadata (``input_token_details.cache_read``).
+
+    Args:
+        usage: Usage mapping from a response
+
+    Returns:
+        Cached prompt tokens, or None if the usage does not report them
+    """
+    if not isinstance(usage, Mapping):
+        return None
+    for details_key, count_key in (
+        ("prompt_tokens_details", "cached_tokens"),
+        ("input_token_details", "cache_read"),
+    ):
+        details = usage.get(details_key)
+        if isinstance(details, Mapping) and isinstance(details.get(count_key), int):
+            return int(details[count_key])
+    return None
+
+
+def _cached_tokens(result: Any) -> int | None:
+    """Cached prompt tokens reported on a LangChain chat result."""
+    response_metadata = getattr(result, "response_metadata", None)
+    token_usage = (
+        response_metadata.get("token_usage")
+        if isinstance(response_metadata, Mapping)
+        else None
+    )
+    for usage in (
+        getattr(result, "usage", None),
+        token_usage,
+        getattr(result, "usage_metadata", None),
+    ):
+        cached_tokens = cached_tokens_from_usage(usage)
+        if cached_tokens is not None:
+            return cached_tokens
+    return None
+
+
+def response_format_from_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build the strict ``json_schema`` response format for a response schema.
+
+    Args:
+        schema: JSON schema; its ``title`` becomes the format name
+
+    Returns:
+        Value for the Chat Completions ``response_format`` parameter
+    """
+    body = {key: value for key, value in schema.items() if key != "title"}
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": schema.get("title", "response"),
+            "strict": True,
+            "schema": body,
+        },
+    }
+
+
+def _rejects_response_format(error: openai.BadRequestError) -> bool:
+    """
+    Whether a 400 error is about the structured output response format.
+
+    Other 400s, such as exceeded context length or content filtering, would
+    fail the same way without a response format.
+    """
+    param = error.param or ""
+    code = error.code or ""
+    return param.startswith("response_format") or "json_schema" in code
+
 
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI LLM provider implementation using LangChain."""
@@ -29,6 +168,8 @@ class OpenAIProvider(BaseLLMProvider):
     def __init__(self, configuration: LLMConfiguration):
         super().__init__(configuration)
         self._client: ChatOpenAI | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self._structured_output_rejected = False
 
         # OpenAI model definitions
         self._models = [
@@ -38,6 +179,7 @@ class OpenAIProvider(BaseLLMProvider):
                 display_name="OpenAI GPT-5 Mini",
                 max_tokens=400000,
                 supports_streaming=False,
+                supports_structured_output=True,
                 cost_per_1k_tokens=0.025,
                 description="Cost-efficient OpenAI GPT-5 Mini model for development",
             ),
@@ -47,6 +189,7 @@ class OpenAIProvider(BaseLLMProvider):
                 display_name="OpenAI o3",
                 max_tokens=200000,
                 supports_streaming=True,
+                supports_structured_output=True,
                 cost_per_1k_tokens=0.015,
                 description="Latest OpenAI o3 reasoning model",
             ),
@@ -69,12 +212,15 @@ class OpenAIProvider(BaseLLMProvider):
             )
 
         try:
+            # Share one pooled HTTP client across all provider instances
+            self._http_client = get_shared_http_client().get_client()
             self._client = ChatOpenAI(
                 model=self.configuration.model,
                 temperature=self.configuration.temperature,
                 api_key=SecretStr(api_key),
                 timeout=self.configuration.timeout,
                 max_retries=0,  # We handle retries ourselves
+                http_async_client=self._http_client,
             )
 
             logger.info(
@@ -99,7 +245,8 @@ class OpenAIProvider(BaseLLMProvider):
 
         Args:
             messages: List of messages for the conversation
-            **kwargs: Additional generation parameters
+            **kwargs: Additional generation parameters; ``response_schema``
+                constrains the response with strict structured output
 
         Returns:
             LLM response
@@ -107,7 +254,13 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             LLMError: If generation fails
         """
-        if self._client is None:
+        response_schema = kwargs.pop("response_schema", None)
+        if (
+            self._client is None
+            or self._http_client is not get_shared_http_client().get_client()
+        ):
+            # Shared HTTP client was closed or replaced; rebuild on the new one
+            self._client = None
             await self.initialize()
 
         start_time = time.time()
@@ -121,7 +274,28 @@ class OpenAIProvider(BaseLLMProvider):
             # Call the LangChain client
             if self._client is None:
                 raise RuntimeError("OpenAI client not initialized")
-            result = await self._client.ainvoke(langchain_messages)
+
+            structured = response_schema is not None and self.supports_structured_output
+            if structured:
+                try:
+                    result = await self._client.ainvoke(
+                        langchain_messages,
+                        response_format=response_format_from_schema(response_schema),
+                    )
+                except openai.BadRequestError as e:
+                    if not _rejects_response_format(e):
+                        raise
+                    # Fall back to free-form JSON for this model from now on
+                    self._structured_output_rejected = True
+                    structured = False
+                    logger.warning(
+                        "openai_structured_output_rejected",
+                        model=self.configuration.model,
+                        error=str(e),
+                    )
+                    result = await self._client.ainvoke(langchain_messages)
+            else:
+                result = await self._client.ainvoke(langchain_messages)
 
             response_time = time.time() - start_time
 
@@ -129,6 +303,7 @@ class OpenAIProvider(BaseLLMProvider):
             prompt_tokens = getattr(result, "usage", {}).get("prompt_tokens")
             completion_tokens = getattr(result, "usage", {}).get("completion_tokens")
             total_tokens = getattr(result, "usage", {}).get("total_tokens")
+            cached_tokens = _cached_tokens(result)
 
             # Get content from response
             if hasattr(result, "content"):
@@ -142,6 +317,7 @@ class OpenAIProvider(BaseLLMProvider):
                 response_time=response_time,
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
+                cached_tokens=cached_tokens,
                 content_length=len(content),
             )
 
@@ -153,11 +329,15 @@ class OpenAIProvider(BaseLLMProvider):
                 completion_tokens=completion_tokens,
                 total_tokens=total_tokens,
                 response_time=response_time,
-                metadata={"langchain_response": True, **kwargs},
+                metadata={
+                    "langchain_response": True,
+                    "cached_tokens": cached_tokens,
+                    "structured_output": structured,
+                    **kwargs,
+                },
             )
 
         except Exception as e:
-            error_str = str(e).lower()
             error_type = type(e).__name__.lower()
 
             logger.error(
@@ -170,77 +350,196 @@ class OpenAIProvider(BaseLLMProvider):
             )
 
             # Map specific errors to our exception types
-            if any(
-                pattern in error_str
-                for pattern in [
-                    "invalid_api_key",
-                    "invalidapikeyerror",
-                    "authentication",
-                    "insufficient_quota",
-                    "billing",
-                    "organization must be verified",
-                ]
-            ):
-                raise AuthenticationError(
-                    f"OpenAI authentication error: {str(e)}",
-                    provider=self.provider_name,
-                )
+            raise self._map_error(e)
 
-            elif any(
-                pattern in error_str
-                for pattern in ["rate_limit", "rate limit", "too many requests"]
-            ):
-                # Try to extract retry-after from error message
-                retry_after = None
-                if "retry after" in error_str:
-                    try:
-                        # Simple parsing for retry-after seconds
-                        parts = error_str.split("retry after")
-                        if len(parts) > 1:
-                            number_part = parts[1].split()[0]
-                            retry_after = float(number_part)
-                    except (ValueError, IndexError):
-                        pass
-
-                raise RateLimitError(
-                    f"OpenAI rate limit exceeded: {str(e)}",
-                    provider=self.provider_name,
-                    retry_after=retry_after,
-                )
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether the configured model streams tokens natively."""
+        model = self.get_model_info(self.configuration.model)
+        return model is not None and model.supports_streaming
 
-            elif any(
-                pattern in error_str
-                for pattern in ["model_not_found", "invalid_model", "unsupported_model"]
-            ):
-                raise ModelNotFoundError(
-                    f"OpenAI model not found: {str(e)}",
-                    provider=self.provider_name,
-                    model=self.configuration.model,
-                )
+    @property
+    def supports_structured_output(self) -> bool:
+        """Whether the configured model accepts a strict response schema."""
+        model = self.get_model_info(self.configuration.model)
+        return (
+            model is not None
+            and model.supports_structured_output
+            and not self._structured_output_rejected
+        )
+
+    async def stream(
+        self, messages: list[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response using OpenAI.
 
-            elif any(
-                pattern in error_str for pattern in ["timeout", "502", "503", "504"]
-            ):
-                # These are retryable errors
-                from .base import LLMError
+        Args:
+            messages: List of messages for the conversation
+            **kwargs: Additional generation parameters
 
-                raise LLMError(
-                    f"OpenAI temporary error: {str(e)}",
-                    provider=self.provider_name,
-                    error_code="temporary_error",
-                    retryable=True,
-                )
+        Yields:
+            Content chunks in generation order
 
-            else:
-                # Generic error
-                from .base import LLMError
+        Raises:
+            LLMError: If generation fails
+        """
+        if self._client is None:
+            await self.initialize()
+        if self._client is None:
+            raise RuntimeError("OpenAI client not initialized")
 
-                raise LLMError(
-                    f"OpenAI error: {str(e)}",
+        start_time = time.time()
+        chunk_count = 0
+        content_length = 0
+
+        try:
+            langchain_messages = [(msg.role, msg.content) for msg in messages]
+            async for chunk in self._client.astream(langchain_messages):
+                content = chunk.content
+                if isinstance(content, str) and content:
+                    chunk_count += 1
+                    content_length += len(content)
+                    yield content
+
+            logger.info(
+                "openai_stream_completed",
+                model=self.configuration.model,
+                response_time=time.time() - start_time,
+                chunk_count=chunk_count,
+                content_length=content_length,
+            )
+
+        except Exception as e:
+            logger.error(
+                "openai_stream_failed",
+                model=self.configuration.model,
+                error=str(e),
+                error_type=type(e).__name__.lower(),
+                response_time=time.time() - start_time,
+                chunks_received=chunk_count,
+                exc_info=True,
+            )
+            raise self._map_error(e)
+
+    def _map_error(self, e: Exception) -> LLMError:
+        """Map an OpenAI/LangChain exception to our exception types."""
+        if isinstance(e, openai.OpenAIError):
+            return self._map_openai_error(e)
+
+        # Fallback for errors raised outside the OpenAI SDK
+        error_str = str(e).lower()
+
+        if any(
+            pattern in error_str
+            for pattern in [
+                "invalid_api_key",
+                "invalidapikeyerror",
+                "authentication",
+                "insufficient_quota",
+                "billing",
+                "organization must be verified",
+            ]
+        ):
+            return AuthenticationError(
+                f"OpenAI authentication error: {str(e)}",
+                provider=self.provider_name,
+            )
+
+        elif any(
+            pattern in error_str
+            for pattern in ["rate_limit", "rate limit", "too many requests"]
+        ):
+            # Try to extract retry-after from error message
+            retry_after = None
+            if "retry after" in error_str:
+                try:
+                    # Simple parsing for retry-after seconds
+                    parts = error_str.split("retry after")
+                    if len(parts) > 1:
+                        number_part = parts[1].split()[0]
+                        retry_after = float(number_part)
+                except (ValueError, IndexError):
+                    pass
+
+            return RateLimitError(
+                f"OpenAI rate limit exceeded: {str(e)}",
+                provider=self.provider_name,
+                retry_after=retry_after,
+            )
+
+        elif any(
+            pattern in error_str
+            for pattern in ["model_not_found", "invalid_model", "unsupported_model"]
+        ):
+            return ModelNotFoundError(
+                f"OpenAI model not found: {str(e)}",
+                provider=self.provider_name,
+                model=self.configuration.model,
+            )
+
+        elif any(pattern in error_str for pattern in ["timeout", "502", "503", "504"]):
+            # These are retryable errors
+            return LLMError(
+                f"OpenAI temporary error: {str(e)}",
+                provider=self.provider_name,
+                error_code="temporary_error",
+                retryable=True,
+            )
+
+        else:
+            # Generic error
+            return LLMError(
+                f"OpenAI error: {str(e)}",
+                provider=self.provider_name,
+                error_code="unknown_error",
+                retryable=False,
+            )
+
+    def _map_openai_error(self, e: openai.OpenAIError) -> LLMError:
+        """Map a typed OpenAI SDK exception using its status and headers."""
+        if isinstance(e, openai.AuthenticationError | openai.PermissionDeniedError):
+            return AuthenticationError(
+                f"OpenAI authentication error: {str(e)}",
+                provider=self.provider_name,
+            )
+
+        if isinstance(e, openai.RateLimitError):
+            # Exhausted quota is reported as a 429 but will not recover by waiting
+            if getattr(e, "code", None) == "insufficient_quota":
+                return AuthenticationError(
+                    f"OpenAI authentication error: {str(e)}",
                     provider=self.provider_name,
-                    error_code="unknown_error",
-                    retryable=False,
                 )
+            return RateLimitError(
+                f"OpenAI rate limit exceeded: {str(e)}",
+                provider=self.provider_name,
+                retry_after=retry_after_from_headers(e.response.headers),
+            )
+
+        if isinstance(e, openai.NotFoundError):
+            return ModelNotFoundError(
+                f"OpenAI model not found: {str(e)}",
+                provider=self.provider_name,
+                model=self.configuration.model,
+            )
+
+        if isinstance(e, openai.APIConnectionError | openai.InternalServerError) or (
+            isinstance(e, openai.APIStatusError) and e.status_code in (408, 409)
+        ):
+            return LLMError(
+                f"OpenAI temporary error: {str(e)}",
+                provider=self.provider_name,
+                error_code="temporary_error",
+                retryable=True,
+            )
+
+        return LLMError(
+            f"OpenAI error: {str(e)}",
+            provider=self.provider_name,
+            error_code="unknown_error",
+            retryable=False,
+        )
 
     async def get_available_models(self) -> list[LLMModel]:
         """
@@ -258,8 +557,8 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             ValueError: If configuration is invalid
         """
-        if self.configuration.provider != LLMProvider.OPENAI:
-            raise ValueError(f"Configuration provider must be {LLMProvider.OPENAI}")
+        if self.configuration.provider != self.provider_name:
+            raise ValueError(f"Configuration provider must be {self.provider_name}")
 
         api_key = self.configuration.provider_settings.get("api_key")
         if not api_key:
@@ -284,21 +583,6 @@ class OpenAIProvider(BaseLLMProvider):
         if self.configuration.timeout <= 0:
             raise ValueError("Timeout must be positive")
 
-    def get_model_info(self, model_id: str) -> LLMModel | None:
-        """
-        Get information about a specific model.
-
-        Args:
-            model_id: The model ID
-
-        Returns:
-            Model information or None if not found
-        """
-        for model in self._models:
-            if model.model_id == model_id:
-                return model
-        return None
-
     def __str__(self) -> str:
         """String representation of the provider."""
         return f"OpenAI Provider (model: {self.configuration.model})"
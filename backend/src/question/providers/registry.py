@@ -1,5 +1,10 @@
 """LLM provider registry for managing and creating provider instances."""
 
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+
 from src.config import get_logger
 
 from .base import (
@@ -14,17 +19,27 @@ from .base import (
 logger = get_logger("llm_provider_registry")
 
 
+@dataclass
+class _CachedProvider:
+    """A cached provider instance and when it was last handed out."""
+
+    instance: BaseLLMProvider
+    last_used: float
+
+
 class LLMProviderRegistry:
     """
     Registry for LLM provider implementations.
 
     Manages provider classes, configurations, and provides factory methods
-    for creating provider instances.
+    for creating provider instances. Instances are cached per configuration so
+    initialized clients and their pooled connections are reused across calls.
     """
 
     def __init__(self) -> None:
         self._provider_classes: dict[LLMProvider, type[BaseLLMProvider]] = {}
         self._default_configurations: dict[LLMProvider, LLMConfiguration] = {}
+        self._instances: dict[str, _CachedProvider] = {}
         self._initialized = False
 
     def register_provider(
@@ -71,7 +86,7 @@ class LLMProviderRegistry:
         self, provider: LLMProvider, configuration: LLMConfiguration | None = None
     ) -> BaseLLMProvider:
         """
-        Create a provider instance.
+        Get a provider instance, reusing a cached one for the same configuration.
 
         Args:
             provider: The provider to create
@@ -105,12 +120,29 @@ class LLMProviderRegistry:
                 f"does not match requested provider {provider}"
             )
 
+        now = time.monotonic()
+        self._evict_idle_instances(now)
+
+        cache_key = self._get_cache_key(configuration)
+        cached = self._instances.get(cache_key)
+        if cached is not None:
+            cached.last_used = now
+            return cached.instance
+
         provider_class = self._provider_classes[provider]
         instance = provider_class(configuration)
 
         # Validate the configuration
         instance.validate_configuration()
 
+        self._instances[cache_key] = _CachedProvider(instance=instance, last_used=now)
+        logger.debug(
+            "llm_provider_instance_cached",
+            provider=provider.value,
+            model=configuration.model,
+            cached_instances=len(self._instances),
+        )
+
         return instance
 
     def get_available_providers(self) -> list[LLMProvider]:
@@ -177,6 +209,7 @@ class LLMProviderRegistry:
             )
 
         self._default_configurations[provider] = configuration
+        self._drop_instances(provider)
 
         logger.info(
             "default_configuration_updated",
@@ -248,8 +281,58 @@ class LLMProviderRegistry:
         if provider in self._default_configurations:
             del self._default_configurations[provider]
 
+        self._drop_instances(provider)
+
         logger.info("llm_provider_unregistered", provider=provider.value)
 
+    async def aclose(self) -> None:
+        """Close and drop cached provider instances, then the shared HTTP client."""
+        from .http_client import get_shared_http_client
+
+        cached_instances = len(self._instances)
+        # Providers may still need the HTTP client to release remote work
+        for cached in self._instances.values():
+            await cached.instance.aclose()
+        self._instances.clear()
+        await get_shared_http_client().aclose()
+
+        logger.info("llm_provider_registry_closed", cached_instances=cached_instances)
+
+    @staticmethod
+    def _get_cache_key(configuration: LLMConfiguration) -> str:
+        """Hash the full configuration, so any setting change gets a new instance."""
+        payload = json.dumps(
+            configuration.model_dump(mode="json"), sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _evict_idle_instances(self, now: float) -> None:
+        """Drop cached instances that have not been used within the idle timeout."""
+        from src.config import settings
+
+        idle_keys = [
+            key
+            for key, cached in self._instances.items()
+            if now - cached.last_used > settings.LLM_PROVIDER_IDLE_TIMEOUT
+        ]
+        for key in idle_keys:
+            del self._instances[key]
+
+        if idle_keys:
+            logger.info(
+                "llm_provider_instances_evicted",
+                evicted=len(idle_keys),
+                remaining=len(self._instances),
+            )
+
+    def _drop_instances(self, provider: LLMProvider) -> None:
+        """Drop cached instances for a provider after its registration changes."""
+        self._instances = {
+            key: cached
+            for key, cached in self._instances.items()
+            if cached.instance.configuration.provider != provider
+        }
+
     def _initialize_default_providers(self) -> None:
         """Initialize the registry with default provider implementations."""
         if self._initialized:
@@ -261,6 +344,7 @@ class LLMProviderRegistry:
             from src.config import settings
 
             from .mock_provider import MockProvider
+            from .openai_batch_provider import OpenAIBatchProvider
             from .openai_provider import OpenAIProvider
 
             if settings.OPENAI_SECRET_KEY:
@@ -280,6 +364,15 @@ class LLMProviderRegistry:
                     LLMProvider.OPENAI, OpenAIProvider, openai_config
                 )
 
+                # Offline generation through the Batch API shares the settings
+                self.register_provider(
+                    LLMProvider.OPENAI_BATCH,
+                    OpenAIBatchProvider,
+                    openai_config.model_copy(
+                        update={"provider": LLMProvider.OPENAI_BATCH}
+                    ),
+                )
+
             # Always register mock provider for testing
             mock_config = LLMConfiguration(
                 provider=LLMProvider.MOCK,
@@ -0,0 +1,108 @@
+"""Token counting for prompt budgeting.
+
+Counts use ``tiktoken`` when the model's encoding can be loaded. Encodings are
+downloaded on first use, so in environments without network access (or for
+non-OpenAI models) counts fall back to the characters-per-token heuristic used
+for admission estimates.
+"""
+
+import asyncio
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from src.config import get_logger, settings
+
+from .admission import CHARS_PER_TOKEN
+
+logger = get_logger("llm_token_counter")
+
+# Chat format framing tokens added per message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Encoding used for OpenAI models tiktoken does not know yet
+DEFAULT_ENCODING = "o200k_base"
+
+
+class TokenCounter:
+    """Counts and truncates text in tokens for a specific model."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self._encoding = _load_encoding(model)
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from the model's tokenizer rather than a heuristic."""
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """Count the tokens in ``text``."""
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    def count_messages(self, messages: Sequence[Any]) -> int:
+        """Count prompt tokens for messages with a ``content`` attribute."""
+        return sum(
+            self.count(message.content) + MESSAGE_OVERHEAD_TOKENS
+            for message in messages
+        )
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Return the longest prefix of ``text`` that fits in ``max_tokens``."""
+        if max_tokens <= 0:
+            return ""
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                return text
+            return str(self._encoding.decode(tokens[:max_tokens]))
+        return text[: max_tokens * CHARS_PER_TOKEN]
+
+
+def _load_encoding(model: str) -> Any:
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(
+            "token_counter_fallback",
+            model=model,
+            reason=str(e),
+            chars_per_token=CHARS_PER_TOKEN,
+        )
+        return None
+
+
+@lru_cache(maxsize=32)
+def get_token_counter(model: str) -> TokenCounter:
+    """Get the shared token counter for a model."""
+    return TokenCounter(model)
+
+
+async def count_prompt_tokens(counter: TokenCounter, messages: Sequence[Any]) -> int:
+    """
+    Count prompt tokens without stalling the event loop on long prompts.
+
+    Prompts of at least ``LLM_TOKEN_COUNT_OFFLOAD_CHARS`` characters are
+    tokenized in a worker thread.
+
+    Args:
+        counter: Token counter for the target model
+        messages: Messages with a ``content`` attribute
+
+    Returns:
+        Prompt tokens including per-message framing
+    """
+    prompt_chars = sum(len(message.content) for message in messages)
+    if counter.exact and prompt_chars >= settings.LLM_TOKEN_COUNT_OFFLOAD_CHARS:
+        return await asyncio.to_thread(counter.count_messages, messages)
+    return counter.count_messages(messages)
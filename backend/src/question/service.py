@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import asc, select
 
@@ -19,6 +20,87 @@ from .types import (
 
 logger = get_logger("question_service")
 
+# Batches at least this large are written with COPY instead of INSERT
+BULK_INSERT_COPY_THRESHOLD = 5_000
+
+
+async def bulk_insert_questions(
+    session: AsyncSession, questions: list[Question]
+) -> list[UUID]:
+    """
+    Insert questions in bulk without reading each row back.
+
+    IDs are assigned client-side, so the questions are written with one
+    multi-row ``INSERT ... RETURNING id`` per page of rows (or COPY for very
+    large batches) instead of one INSERT and one refresh per question. The
+    question objects are not attached to the session. The caller commits.
+
+    Args:
+        session: Async database session
+        questions: Questions to insert
+
+    Returns:
+        IDs of the inserted questions, in order
+    """
+    if not questions:
+        return []
+
+    table = Question.__table__  # type: ignore[attr-defined]
+    # Leave server-generated columns to the database unless a value was set
+    columns = [
+        column
+        for column in table.columns
+        if column.server_default is None
+        or any(getattr(question, column.key) is not None for question in questions)
+    ]
+
+    if len(questions) >= BULK_INSERT_COPY_THRESHOLD:
+        await _copy_questions(session, columns, questions)
+        question_ids = [question.id for question in questions]
+    else:
+        rows = [
+            {column.key: getattr(question, column.key) for column in columns}
+            for question in questions
+        ]
+        # Executed as paged multi-row VALUES lists with RETURNING
+        result = await session.execute(insert(table).returning(table.c.id), rows)
+        question_ids = list(result.scalars().all())
+
+    logger.debug("questions_bulk_inserted", question_count=len(question_ids))
+    return question_ids
+
+
+async def _copy_questions(
+    session: AsyncSession, columns: list[Any], questions: list[Question]
+) -> None:
+    """Write questions with asyncpg's binary COPY on the session's connection."""
+    connection = await session.connection()
+    dialect = connection.dialect
+    processors = [column.type.bind_processor(dialect) for column in columns]
+
+    records = [
+        tuple(
+            processor(value) if processor is not None else value
+            for processor, value in zip(
+                processors,
+                (getattr(question, column.key) for column in columns),
+                strict=True,
+            )
+        )
+        for question in questions
+    ]
+
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if driver_connection is None:
+        raise RuntimeError("Database connection is not open")
+
+    await driver_connection.copy_records_to_table(
+        Question.__tablename__,
+        records=records,
+        columns=[column.name for column in columns],
+    )
+
 
 async def save_questions(
     session: AsyncSession,
@@ -75,12 +157,14 @@ async def save_questions(
                 quiz_id=quiz_id,
                 question_type=question_type,
                 question_data=validated_data.dict(),
+                validation_stamp=question_impl.validation_engine.stamp_for(
+                    validated_data
+                ),
                 difficulty=difficulty,
                 tags=tags,
                 is_approved=False,
             )
 
-            session.add(question)
             saved_questions.append(question)
 
         except Exception as e:
@@ -101,13 +185,10 @@ async def save_questions(
             "errors": validation_errors,
         }
 
-    # Commit all questions
+    # IDs are assigned client-side, so no per-row refresh is needed
+    await bulk_insert_questions(session, saved_questions)
     await session.commit()
 
-    # Refresh all questions to get IDs
-    for question in saved_questions:
-        await session.refresh(question)
-
     logger.info(
         "questions_save_completed",
         quiz_id=str(quiz_id),
@@ -344,6 +425,15 @@ async def update_question(
         if hasattr(question, field):
             setattr(question, field, value)
 
+    # Revalidate changed question data so reads can trust it again
+    if "question_data" in updates:
+        question_impl = get_question_type_registry().get_question_type(
+            question.question_type
+        )
+        question.validation_stamp = question_impl.validation_engine.stamp_if_valid(
+            question.question_data or {}
+        )
+
     question.updated_at = datetime.now(timezone.utc)
 
     session.add(question)
@@ -354,6 +444,59 @@ async def update_question(
     return question
 
 
+async def restamp_questions(session: AsyncSession, batch_size: int = 500) -> int:
+    """
+    Fully validate questions unstamped or stamped under another schema version.
+
+    Run after migrations and question type schema version bumps so stored
+    data is trusted on read again. Questions that fail validation or would be
+    changed by it stay unstamped. Those, and questions whose data no longer
+    matches their stamp's digest, are validated on every read.
+
+    Args:
+        session: Database session
+        batch_size: Number of questions loaded per query
+
+    Returns:
+        Number of questions stamped
+    """
+    question_registry = get_question_type_registry()
+    stamped = 0
+
+    for question_type in question_registry.get_available_types():
+        engine = question_registry.get_question_type(question_type).validation_engine
+        last_id: UUID | None = None
+
+        while True:
+            query = (
+                select(Question)
+                .where(
+                    Question.question_type == question_type,
+                    Question.validation_stamp.is_(None)  # type: ignore[union-attr]
+                    | ~Question.validation_stamp.startswith(f"{engine.stamp}:"),  # type: ignore[union-attr]
+                )
+                .order_by(asc(Question.id))
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                query = query.where(Question.id > last_id)
+
+            questions = list((await session.execute(query)).scalars().all())
+            if not questions:
+                break
+
+            for question in questions:
+                stamp = engine.stamp_if_valid(question.question_data)
+                if stamp is not None:
+                    question.validation_stamp = stamp
+                    stamped += 1
+            last_id = questions[-1].id
+            await session.commit()
+
+    logger.info("questions_restamped", stamped_count=stamped)
+    return stamped
+
+
 async def delete_question(
     session: AsyncSession, question_id: UUID, quiz_owner_id: UUID
 ) -> bool:
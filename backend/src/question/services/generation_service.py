@@ -1,5 +1,6 @@
 """Module-based question generation service."""
 
+from functools import partial
 from typing import Any
 from uuid import UUID
 
@@ -184,7 +185,9 @@ class QuestionGenerationService:
                     results,
                     batch_status,
                 ) = await processor.process_all_modules_with_batches(
-                    quiz_id, modules_to_process
+                    quiz_id,
+                    modules_to_process,
+                    on_batch_complete=partial(self._record_batch_progress, quiz_id),
                 )
 
                 # Logging moved to the logger.info call below
@@ -208,3 +211,22 @@ class QuestionGenerationService:
                 exc_info=True,
             )
             raise
+
+    async def _record_batch_progress(
+        self,
+        quiz_id: UUID,
+        batch_key: str,
+        questions: list[Any],
+        metadata: dict[str, Any],
+    ) -> None:
+        """Commit a finished batch to the quiz's generation metadata."""
+        from src.quiz.service import record_generation_batch
+
+        async with get_async_session() as session:
+            await record_generation_batch(
+                session,
+                quiz_id,
+                batch_key,
+                success=metadata.get("success", False),
+                questions_saved=metadata.get("questions_saved", 0),
+            )
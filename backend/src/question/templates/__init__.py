@@ -1,8 +1,14 @@
 """Templates module for prompt template management."""
 
-from .manager import PromptTemplate, TemplateManager, get_template_manager
+from .manager import (
+    PromptLayout,
+    PromptTemplate,
+    TemplateManager,
+    get_template_manager,
+)
 
 __all__ = [
+    "PromptLayout",
     "PromptTemplate",
     "TemplateManager",
     "get_template_manager",
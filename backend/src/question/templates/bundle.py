@@ -0,0 +1,238 @@
+"""Precompiled template bundle with an index read ahead of the templates."""
+
+import importlib.util
+import marshal
+import struct
+from pathlib import Path
+from types import CodeType
+from typing import Any, NamedTuple
+
+import jinja2
+
+from src.config import get_logger
+
+from ..types import QuestionType, QuizLanguage
+
+logger = get_logger("template_bundle")
+
+# Default bundle file name inside the templates directory
+BUNDLE_FILENAME = "templates.bundle"
+
+# Identifies bundle files ahead of the header
+_MAGIC = b"RAGTPLB\x00"
+
+_FORMAT_VERSION = 2
+
+# Length of the marshalled header, which precedes the template payloads
+_HEADER_LENGTH = struct.Struct(">Q")
+
+
+class BundleError(ValueError):
+    """Raised when a bundle is missing, corrupt or built for another runtime."""
+
+
+class BundleEntry(NamedTuple):
+    """Index entry locating one template's payload in the bundle."""
+
+    question_type: QuestionType
+    language: QuizLanguage | None
+    version: str
+    offset: int
+    length: int
+
+
+def _runtime_stamp() -> tuple[bytes, str]:
+    """Identify the runtime; marshalled code only loads on the same one."""
+    return importlib.util.MAGIC_NUMBER, jinja2.__version__
+
+
+def source_fingerprint(templates_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """
+    Fingerprint the template files a bundle is built from.
+
+    Args:
+        templates_dir: Directory containing template files
+
+    Returns:
+        Sorted (file name, size, mtime in ns) of every template file
+    """
+    fingerprint = []
+    for filepath in sorted(templates_dir.glob("*.json")):
+        stat = filepath.stat()
+        fingerprint.append((filepath.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(fingerprint)
+
+
+def build_bundle(templates_dir: Path, output: Path | None = None) -> int:
+    """
+    Validate a template directory and write it to a bundle.
+
+    Only templates passing ``validate_template`` are bundled, so loading them
+    at runtime skips validation and compilation.
+
+    Args:
+        templates_dir: Directory containing template files
+        output: Bundle file to write, defaults to ``templates.bundle`` in
+            the templates directory
+
+    Returns:
+        Number of bundled templates
+    """
+    from .manager import TemplateManager
+
+    output = output or templates_dir / BUNDLE_FILENAME
+    # Taken before loading, so files edited during the build make it stale
+    sources = source_fingerprint(templates_dir)
+    manager = TemplateManager(str(templates_dir), hot_reload=False, use_bundle=False)
+    manager.initialize()
+
+    payloads: list[bytes] = []
+    index: dict[str, tuple[str, str | None, str, int, int]] = {}
+    offset = 0
+
+    for template in manager.list_templates():
+        payload = marshal.dumps(
+            (
+                template.model_dump(mode="json"),
+                manager.jinja_env.compile(template.system_prompt),
+                manager.jinja_env.compile(template.user_prompt),
+            )
+        )
+        index[template.name] = (
+            template.question_type.value,
+            template.language.value if template.language else None,
+            template.version,
+            offset,
+            len(payload),
+        )
+        payloads.append(payload)
+        offset += len(payload)
+
+    header = marshal.dumps(
+        {
+            "format": _FORMAT_VERSION,
+            "runtime": _runtime_stamp(),
+            "sources": sources,
+            "index": index,
+        }
+    )
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temporary = output.with_suffix(output.suffix + ".tmp")
+    with open(temporary, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header)))
+        f.write(header)
+        for payload in payloads:
+            f.write(payload)
+    temporary.replace(output)
+
+    logger.info("template_bundle_built", output=str(output), templates=len(index))
+    return len(index)
+
+
+class TemplateBundle:
+    """
+    Read-only view of a template bundle.
+
+    Opening a bundle reads only its index; template payloads are read from
+    disk when first requested.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a bundle and read its index.
+
+        Args:
+            path: Path of the bundle file
+
+        Raises:
+            BundleError: If the bundle cannot be used by this runtime
+        """
+        self.path = path
+
+        try:
+            with open(path, "rb") as f:
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    raise BundleError(f"{path} is not a template bundle")
+                (header_length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+                header = marshal.loads(f.read(header_length))
+        except (OSError, EOFError, ValueError, TypeError, struct.error) as e:
+            raise BundleError(f"Cannot read template bundle {path}: {e}") from e
+
+        if not isinstance(header, dict) or header.get("format") != _FORMAT_VERSION:
+            raise BundleError(f"Unsupported template bundle format in {path}")
+        if tuple(header.get("runtime", ())) != _runtime_stamp():
+            raise BundleError(f"Template bundle {path} was built for another runtime")
+
+        self.sources: tuple[tuple[str, int, int], ...] = tuple(
+            tuple(source) for source in header.get("sources", ())
+        )
+        self._payload_start = len(_MAGIC) + _HEADER_LENGTH.size + header_length
+        self.index: dict[str, BundleEntry] = {
+            name: BundleEntry(
+                QuestionType(question_type),
+                QuizLanguage(language) if language else None,
+                version,
+                offset,
+                length,
+            )
+            for name, (question_type, language, version, offset, length) in header[
+                "index"
+            ].items()
+        }
+
+    def matches(self, templates_dir: Path) -> bool:
+        """
+        Check that the bundle was built from the current template files.
+
+        Args:
+            templates_dir: Directory containing template files
+
+        Returns:
+            True if no template file was added, removed or modified since
+        """
+        return self.sources == source_fingerprint(templates_dir)
+
+    def names(self, question_type: QuestionType | None = None) -> list[str]:
+        """
+        List bundled template names.
+
+        Args:
+            question_type: Filter by question type, returns all if None
+
+        Returns:
+            Names of matching templates
+        """
+        return [
+            name
+            for name, entry in self.index.items()
+            if question_type is None or entry.question_type == question_type
+        ]
+
+    def read(self, name: str) -> tuple[dict[str, Any], CodeType, CodeType]:
+        """
+        Read one template's payload.
+
+        Args:
+            name: Template name
+
+        Returns:
+            Tuple of (template data, system prompt code, user prompt code)
+
+        Raises:
+            KeyError: If the template is not in the bundle
+            BundleError: If the payload cannot be read
+        """
+        entry = self.index[name]
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._payload_start + entry.offset)
+                data, system_code, user_code = marshal.loads(f.read(entry.length))
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            raise BundleError(f"Cannot read template {name} from bundle: {e}") from e
+        return data, system_code, user_code
+
+    def discard(self, name: str) -> None:
+        """Hide a template, for example after it was deleted from disk."""
+        self.index.pop(name, None)
@@ -1,20 +1,64 @@
 """Template manager for prompt templates and question generation."""
 
+import asyncio
 import json
+import threading
+from collections import OrderedDict
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, Template
 from pydantic import BaseModel, Field
 
-from src.config import get_logger
+from src.config import get_logger, settings
 
 from ..providers import LLMMessage
 from ..types import GenerationParameters, QuestionType, QuizLanguage
+from ..utils import truncate_at_boundary
+from .bundle import BUNDLE_FILENAME, BundleError, TemplateBundle
 
 logger = get_logger("template_manager")
 
 
+class PromptLayout(str, Enum):
+    """How rendered templates are arranged into LLM messages."""
+
+    # Template system prompt, then the user prompt with the content inlined
+    STANDARD = "standard"
+    # Stable preamble and module content first, per-batch instructions last
+    PREFIX_CACHE = "prefix_cache"
+
+
+# Shared system preamble for the prefix cache layout. It must not depend on
+# any per-batch parameter, or the cached prefix changes between batches.
+PREFIX_SYSTEM_PROMPTS = {
+    QuizLanguage.ENGLISH: (
+        "You are an expert educator creating quiz questions from course material. "
+        "The module content is given below. Instructions for the questions to "
+        "generate follow in the next message."
+    ),
+    QuizLanguage.NORWEGIAN: (
+        "Du er en erfaren pedagog som lager quizspørsmål fra kursmateriell. "
+        "Modulinnholdet står nedenfor. Instruksjoner for spørsmålene som skal "
+        "lages følger i neste melding."
+    ),
+}
+
+# Stands in for the module content where templates reference it
+PREFIX_CONTENT_REFERENCES = {
+    QuizLanguage.ENGLISH: "(see the module content in the system message)",
+    QuizLanguage.NORWEGIAN: "(se modulinnholdet i systemmeldingen)",
+}
+
+# Stand-ins for the module content when rendering static prompt fragments.
+# They differ in length so content-dependent template logic is detected.
+_CONTENT_SENTINELS = ("\x00module_content\x00", "\x00module_content_check\x00")
+
+# Maximum number of rendered fragment sets kept per template manager
+_FRAGMENT_CACHE_SIZE = 512
+
+
 class PromptTemplate(BaseModel):
     """A prompt template configuration."""
 
@@ -65,13 +109,45 @@ class TemplateManager:
     different question types and use cases.
     """
 
-    def __init__(self, templates_dir: str | None = None):
+    def __init__(
+        self,
+        templates_dir: str | None = None,
+        layout: PromptLayout | None = None,
+        hot_reload: bool | None = None,
+        static_fragments: bool | None = None,
+        use_bundle: bool | None = None,
+        bundle_path: str | None = None,
+    ):
         """
         Initialize template manager.
 
         Args:
             templates_dir: Directory containing template files
+            layout: Message layout, uses ``settings.PROMPT_LAYOUT`` if None
+            hot_reload: Reload template files whose mtime changed, uses
+                ``settings.TEMPLATE_HOT_RELOAD`` if None
+            static_fragments: Render the content-independent parts of prompts
+                once and splice content in, uses
+                ``settings.TEMPLATE_STATIC_FRAGMENTS`` if None
+            use_bundle: Load templates lazily from a precompiled bundle when
+                it exists and hot reload is off, uses
+                ``settings.TEMPLATE_BUNDLE_ENABLED`` if None
+            bundle_path: Bundle file, defaults to ``templates.bundle`` in the
+                templates directory
         """
+        self.layout = PromptLayout(layout or settings.PROMPT_LAYOUT)
+        self.hot_reload = (
+            settings.TEMPLATE_HOT_RELOAD if hot_reload is None else hot_reload
+        )
+        self.use_bundle = (
+            settings.TEMPLATE_BUNDLE_ENABLED if use_bundle is None else use_bundle
+        )
+        self.static_fragments = (
+            settings.TEMPLATE_STATIC_FRAGMENTS
+            if static_fragments is None
+            else static_fragments
+        )
+
         if templates_dir is None:
             # Default to templates directory relative to this file
             current_dir = Path(__file__).parent
@@ -79,6 +155,9 @@ class TemplateManager:
         else:
             self.templates_dir = Path(templates_dir)
         self.templates_dir.mkdir(parents=True, exist_ok=True)
+        self.bundle_path = (
+            Path(bundle_path) if bundle_path else self.templates_dir / BUNDLE_FILENAME
+        )
 
         # Jinja2 environment for template rendering
         self.jinja_env = Environment(
@@ -90,7 +169,19 @@ class TemplateManager:
 
         # Template cache
         self._template_cache: dict[str, PromptTemplate] = {}
-        self._jinja_cache: dict[str, Template] = {}
+        # Compiled (system, user) prompts keyed by template name and version
+        self._jinja_cache: dict[tuple[str, str], tuple[Template, Template]] = {}
+        # Modification time of each loaded template file, for hot reload
+        self._template_mtimes: dict[str, float] = {}
+        # Rendered prompt pieces around the module content, None when a prompt
+        # uses the content in a way that cannot be spliced. Renders may run in
+        # worker threads, so access goes through the lock.
+        self._fragment_cache: OrderedDict[tuple[str, ...], tuple[str, ...] | None] = (
+            OrderedDict()
+        )
+        self._fragment_lock = threading.Lock()
+        # Bundle templates are read into the caches when first requested
+        self._bundle: TemplateBundle | None = None
         self._initialized = False
 
     def initialize(self) -> None:
@@ -99,12 +190,15 @@ class TemplateManager:
             return
 
         try:
-            self._load_templates()
+            self._bundle = self._open_bundle()
+            if self._bundle is None:
+                self._load_templates()
 
             logger.info(
                 "template_manager_initialized",
                 templates_dir=str(self.templates_dir),
                 loaded_templates=len(self._template_cache),
+                bundled_templates=len(self._bundle.index) if self._bundle else 0,
             )
 
         except Exception as e:
@@ -153,6 +247,11 @@ class TemplateManager:
             if language == QuizLanguage.NORWEGIAN:
                 template_name += "_no"
 
+        if self.hot_reload:
+            self._reload_if_modified(template_name)
+        elif template_name not in self._template_cache:
+            self._load_bundled(template_name)
+
         # Try to find the template
         if template_name in self._template_cache:
             template = self._template_cache[template_name]
@@ -180,6 +279,11 @@ class TemplateManager:
         if not self._initialized:
             self.initialize()
 
+        if self._bundle is not None:
+            for name in self._bundle.names(question_type):
+                if name not in self._template_cache:
+                    self._load_bundled(name)
+
         templates = list(self._template_cache.values())
 
         if question_type is not None:
@@ -199,6 +303,8 @@ class TemplateManager:
         """
         Create LLM messages using a template.
 
+        Content longer than the template's ``max_content_length`` is truncated.
+
         Args:
             question_type: The question type
             content: Content to generate questions from
@@ -218,7 +324,6 @@ class TemplateManager:
 
         # Prepare template variables
         variables = {
-            "module_content": content,
             "target_count": generation_parameters.target_count,
             "difficulty": generation_parameters.difficulty.value
             if generation_parameters.difficulty
@@ -232,14 +337,22 @@ class TemplateManager:
         if extra_variables:
             variables.update(extra_variables)
 
-        # Render templates
-        system_prompt = self._render_template(template.system_prompt, variables)
-        user_prompt = self._render_template(template.user_prompt, variables)
+        render_language = template.language or language or QuizLanguage.ENGLISH
+        if len(content) >= settings.TEMPLATE_RENDER_OFFLOAD_CHARS:
+            # Keep large renders from stalling other requests on the event loop
+            system_prompt, user_prompt = await asyncio.to_thread(
+                self._render_messages, template, content, variables, render_language
+            )
+        else:
+            system_prompt, user_prompt = self._render_messages(
+                template, content, variables, render_language
+            )
 
         logger.debug(
             "template_messages_created",
             question_type=question_type.value,
             template_name=template.name,
+            layout=self.layout.value,
             system_prompt_length=len(system_prompt),
             user_prompt_length=len(user_prompt),
             variables_count=len(variables),
@@ -250,6 +363,45 @@ class TemplateManager:
             LLMMessage(role="user", content=user_prompt),
         ]
 
+    def _render_messages(
+        self,
+        template: PromptTemplate,
+        content: str,
+        variables: dict[str, Any],
+        language: QuizLanguage,
+    ) -> tuple[str, str]:
+        """
+        Truncate content and render the system and user prompts.
+
+        Args:
+            template: Template to render
+            content: Module content
+            variables: Template variables other than the module content
+            language: Language of the prefix cache preamble
+
+        Returns:
+            Tuple of (system prompt, user prompt)
+        """
+        if len(content) > template.max_content_length:
+            logger.warning(
+                "template_content_truncated",
+                template_name=template.name,
+                content_length=len(content),
+                max_content_length=template.max_content_length,
+            )
+            content = truncate_at_boundary(content, template.max_content_length)
+
+        variables = {**variables, "module_content": content}
+
+        if self.layout == PromptLayout.PREFIX_CACHE:
+            return self._render_prefix_cache_layout(template, variables, language)
+
+        system_template, user_template = self._get_compiled(template)
+        return (
+            self._render_prompt(template, "system", system_template, variables),
+            self._render_prompt(template, "user", user_template, variables),
+        )
+
     def save_template(self, template: PromptTemplate) -> None:
         """
         Save a template to file.
@@ -266,6 +418,9 @@ class TemplateManager:
 
         # Update cache
         self._template_cache[template.name] = template
+        self._invalidate_compiled(template.name)
+        self._compile(template)
+        self._template_mtimes[template.name] = filepath.stat().st_mtime
 
         logger.info(
             "template_saved",
@@ -284,6 +439,8 @@ class TemplateManager:
         Raises:
             ValueError: If template is not found
         """
+        if template_name not in self._template_cache:
+            self._load_bundled(template_name)
         if template_name not in self._template_cache:
             raise ValueError(f"Template {template_name} not found")
 
@@ -296,10 +453,10 @@ class TemplateManager:
 
         # Remove from cache
         del self._template_cache[template_name]
-
-        # Remove from Jinja cache if present
-        if template_name in self._jinja_cache:
-            del self._jinja_cache[template_name]
+        if self._bundle is not None:
+            self._bundle.discard(template_name)
+        self._template_mtimes.pop(template_name, None)
+        self._invalidate_compiled(template_name)
 
         logger.info(
             "template_deleted", template_name=template_name, filepath=str(filepath)
@@ -355,43 +512,307 @@ class TemplateManager:
             return
 
         for filepath in self.templates_dir.glob("*.json"):
-            try:
-                with open(filepath, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                template = PromptTemplate(**data)
-
-                # Validate template
-                errors = self.validate_template(template)
-                if errors:
-                    logger.warning(
-                        "template_validation_failed",
-                        filepath=str(filepath),
-                        errors=errors,
-                    )
-                    continue
-
-                self._template_cache[template.name] = template
-
-                logger.debug(
-                    "template_loaded",
-                    template_name=template.name,
-                    question_type=template.question_type.value,
-                    filepath=str(filepath),
-                )
+            self._load_template_file(filepath)
+
+    def _load_template_file(self, filepath: Path) -> PromptTemplate | None:
+        """
+        Load, validate and compile a single template file into the caches.
+
+        Args:
+            filepath: Path of the template JSON file
+
+        Returns:
+            Loaded template, or None if it could not be loaded
+        """
+        try:
+            mtime = filepath.stat().st_mtime
+            with open(filepath, encoding="utf-8") as f:
+                data = json.load(f)
 
-            except Exception as e:
-                logger.error(
-                    "template_load_failed",
+            template = PromptTemplate(**data)
+
+            # Validate template
+            errors = self.validate_template(template)
+            if errors:
+                logger.warning(
+                    "template_validation_failed",
                     filepath=str(filepath),
-                    error=str(e),
-                    exc_info=True,
+                    errors=errors,
                 )
+                return None
+
+            self._template_cache[template.name] = template
+            self._template_mtimes[template.name] = mtime
+            self._invalidate_compiled(template.name)
+            self._compile(template)
+
+            logger.debug(
+                "template_loaded",
+                template_name=template.name,
+                question_type=template.question_type.value,
+                filepath=str(filepath),
+            )
+            return template
+
+        except Exception as e:
+            logger.error(
+                "template_load_failed",
+                filepath=str(filepath),
+                error=str(e),
+                exc_info=True,
+            )
+            return None
+
+    def _open_bundle(self) -> TemplateBundle | None:
+        """Open the template bundle if it should be used instead of the files."""
+        if not self.use_bundle or self.hot_reload or not self.bundle_path.exists():
+            return None
+
+        try:
+            bundle = TemplateBundle(self.bundle_path)
+        except BundleError as e:
+            logger.warning(
+                "template_bundle_unusable",
+                bundle_path=str(self.bundle_path),
+                error=str(e),
+            )
+            return None
+
+        if not bundle.matches(self.templates_dir):
+            logger.warning(
+                "template_bundle_stale",
+                bundle_path=str(self.bundle_path),
+                templates_dir=str(self.templates_dir),
+            )
+            return None
+
+        logger.debug(
+            "template_bundle_opened",
+            bundle_path=str(self.bundle_path),
+            templates=len(bundle.index),
+        )
+        return bundle
+
+    def _load_bundled(self, template_name: str) -> None:
+        """
+        Load a prevalidated, precompiled template from the bundle into the caches.
+
+        Args:
+            template_name: Name of the template to load
+        """
+        if self._bundle is None or template_name not in self._bundle.index:
+            return
+
+        try:
+            data, system_code, user_code = self._bundle.read(template_name)
+        except BundleError as e:
+            logger.error(
+                "template_bundle_read_failed",
+                template_name=template_name,
+                bundle_path=str(self.bundle_path),
+                error=str(e),
+            )
+            return
+
+        template = PromptTemplate(**data)
+        template_globals = self.jinja_env.make_globals(None)
+        self._template_cache[template.name] = template
+        self._jinja_cache[(template.name, template.version)] = (
+            self.jinja_env.template_class.from_code(
+                self.jinja_env, system_code, template_globals
+            ),
+            self.jinja_env.template_class.from_code(
+                self.jinja_env, user_code, template_globals
+            ),
+        )
+
+        logger.debug(
+            "template_loaded_from_bundle",
+            template_name=template.name,
+            question_type=template.question_type.value,
+        )
+
+    def _reload_if_modified(self, template_name: str) -> None:
+        """Reload a template whose file changed since it was loaded."""
+        filepath = self.templates_dir / f"{template_name}.json"
+        try:
+            mtime = filepath.stat().st_mtime
+        except OSError:
+            # Missing files keep serving the cached template
+            return
+
+        if self._template_mtimes.get(template_name) == mtime:
+            return
+
+        if self._load_template_file(filepath) is not None:
+            logger.info(
+                "template_reloaded",
+                template_name=template_name,
+                filepath=str(filepath),
+            )
+
+    def _compile(self, template: PromptTemplate) -> tuple[Template, Template]:
+        """
+        Compile a template's prompts and cache them by name and version.
+
+        Args:
+            template: Template to compile
+
+        Returns:
+            Tuple of compiled (system prompt, user prompt) templates
+        """
+        compiled = (
+            self.jinja_env.from_string(template.system_prompt),
+            self.jinja_env.from_string(template.user_prompt),
+        )
+        self._jinja_cache[(template.name, template.version)] = compiled
+        return compiled
+
+    def _get_compiled(self, template: PromptTemplate) -> tuple[Template, Template]:
+        """Get a template's compiled prompts, compiling them on a cache miss."""
+        compiled = self._jinja_cache.get((template.name, template.version))
+        if compiled is None:
+            compiled = self._compile(template)
+        return compiled
+
+    def _invalidate_compiled(self, template_name: str) -> None:
+        """Drop compiled prompts for every version of a template."""
+        for key in [key for key in self._jinja_cache if key[0] == template_name]:
+            del self._jinja_cache[key]
+        with self._fragment_lock:
+            for fragment_key in [
+                key for key in self._fragment_cache if key[0] == template_name
+            ]:
+                del self._fragment_cache[fragment_key]
+
+    def _render_prefix_cache_layout(
+        self,
+        template: PromptTemplate,
+        variables: dict[str, Any],
+        language: QuizLanguage,
+    ) -> tuple[str, str]:
+        """
+        Render a template so all batches for a module share a message prefix.
+
+        The system message holds only a fixed preamble and the module content,
+        making it byte-identical across question types, difficulties and
+        counts. The template's own instructions, which embed those per-batch
+        parameters, move to the user message.
+
+        Args:
+            template: Template to render
+            variables: Variables for the template
+            language: Language of the preamble
+
+        Returns:
+            Tuple of (system prompt, user prompt)
+        """
+        system_prompt = (
+            f"{PREFIX_SYSTEM_PROMPTS[language]}\n\n"
+            f"MODULE CONTENT:\n{variables['module_content']}"
+        )
+
+        instruction_variables = {
+            **variables,
+            "module_content": PREFIX_CONTENT_REFERENCES[language],
+        }
+        system_template, user_template = self._get_compiled(template)
+        instructions = self._render_prompt(
+            template, "system", system_template, instruction_variables
+        )
+        request = self._render_prompt(
+            template, "user", user_template, instruction_variables
+        )
+
+        return system_prompt, f"{instructions}\n\n{request}"
+
+    def _render_prompt(
+        self,
+        template: PromptTemplate,
+        prompt: str,
+        compiled: Template,
+        variables: dict[str, Any],
+    ) -> str:
+        """
+        Render one compiled prompt, splicing content into static fragments.
+
+        Args:
+            template: Template the prompt belongs to
+            prompt: Which prompt is rendered, "system" or "user"
+            compiled: Compiled prompt template
+            variables: Variables for the template, including the module content
+
+        Returns:
+            Rendered prompt
+        """
+        content = variables.get("module_content")
+        if not self.static_fragments or not isinstance(content, str) or not content:
+            return compiled.render(**variables)
+
+        fragments = self._static_fragments(template, prompt, compiled, variables)
+        if fragments is None:
+            return compiled.render(**variables)
+
+        # Fragments were split at the content, so joining on it restores it
+        return content.join(fragments)
+
+    def _static_fragments(
+        self,
+        template: PromptTemplate,
+        prompt: str,
+        compiled: Template,
+        variables: dict[str, Any],
+    ) -> tuple[str, ...] | None:
+        """
+        Get the rendered pieces of a prompt around its module content.
+
+        The prompt is rendered with two different stand-ins for the content.
+        If both renders split into the same pieces, the content is only ever
+        inserted verbatim and the pieces can be reused for any content.
+
+        Args:
+            template: Template the prompt belongs to
+            prompt: Which prompt is rendered, "system" or "user"
+            compiled: Compiled prompt template
+            variables: Variables for the template
+
+        Returns:
+            Prompt pieces, or None if the content cannot be spliced in
+        """
+        key = (
+            template.name,
+            template.version,
+            prompt,
+            json.dumps(
+                {k: v for k, v in variables.items() if k != "module_content"},
+                sort_keys=True,
+                default=str,
+            ),
+        )
+        with self._fragment_lock:
+            if key in self._fragment_cache:
+                self._fragment_cache.move_to_end(key)
+                return self._fragment_cache[key]
+
+        first, second = (
+            compiled.render(**{**variables, "module_content": sentinel}).split(sentinel)
+            for sentinel in _CONTENT_SENTINELS
+        )
+        fragments = tuple(first) if first == second else None
+
+        with self._fragment_lock:
+            self._fragment_cache[key] = fragments
+            if len(self._fragment_cache) > _FRAGMENT_CACHE_SIZE:
+                self._fragment_cache.popitem(last=False)
+        return fragments
 
     def _render_template(self, template_string: str, variables: dict[str, Any]) -> str:
         """
         Render a template string with variables.
 
+        Compiles the string on every call; prompts of loaded templates are
+        rendered from the compiled cache instead.
+
         Args:
             template_string: Template string to render
             variables: Variables for template
@@ -4,7 +4,8 @@ import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, TypeVar
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from pydantic import BaseModel
 from sqlalchemy import Column, DateTime, func
@@ -15,6 +16,7 @@ if TYPE_CHECKING:
     from src.quiz.models import Quiz
 
     from .registry import QuestionTypeRegistry
+    from .validation import ValidationEngine
 
 # Type variable for question type implementations
 T = TypeVar("T", bound="BaseQuestionType")
@@ -69,6 +71,14 @@ class BaseQuestionData(BaseModel):
 class BaseQuestionType(ABC):
     """Abstract base class for question type implementations."""
 
+    # Bump when the data model's validation rules change, so data stamped as
+    # valid under the old rules is validated again
+    schema_version: ClassVar[str] = "1"
+
+    # Set when the data model's validators skip their checks for trusted data;
+    # other types gain nothing from checking validation stamps on read
+    trusted_validators: ClassVar[bool] = False
+
     @property
     @abstractmethod
     def question_type(self) -> QuestionType:
@@ -86,6 +96,13 @@ class BaseQuestionType(ABC):
         """Validate and parse question data."""
         pass
 
+    @cached_property
+    def validation_engine(self) -> "ValidationEngine":
+        """Validation engine with a trusted fast path for this question type."""
+        from .validation import ValidationEngine
+
+        return ValidationEngine(self)
+
     @abstractmethod
     def format_for_display(self, data: BaseQuestionData) -> dict[str, Any]:
         """Format question data for API display."""
@@ -139,6 +156,10 @@ class Question(SQLModel, table=True):
         sa_column=Column(JSONB, nullable=False, default={}),
         description="Question type-specific data",
     )
+    validation_stamp: str | None = Field(
+        default=None,
+        description="Schema version and digest of question_data at its last full validation",
+    )
 
     # Question metadata
     difficulty: QuestionDifficulty | None = Field(default=None, index=True)
@@ -199,7 +220,9 @@ class Question(SQLModel, table=True):
     ) -> BaseQuestionData:
         """Get strongly-typed question data using the question registry."""
         question_impl = question_registry.get_question_type(self.question_type)
-        return question_impl.validate_data(self.question_data)
+        return question_impl.validation_engine.load(
+            self.question_data, self.validation_stamp
+        )
 
 
 class GenerationParameters(BaseModel):
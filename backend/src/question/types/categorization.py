@@ -3,7 +3,7 @@
 import uuid
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 from src.canvas.constants import CanvasInteractionType, CanvasScoringAlgorithm
 
@@ -13,6 +13,7 @@ from .base import (
     QuestionType,
     generate_canvas_title,
 )
+from .validation import is_trusted
 
 
 class CategoryItem(BaseModel):
@@ -73,8 +74,12 @@ class CategorizationData(BaseQuestionData):
 
     @field_validator("categories")
     @classmethod
-    def validate_categories(cls, v: list[Category]) -> list[Category]:
+    def validate_categories(
+        cls, v: list[Category], info: ValidationInfo
+    ) -> list[Category]:
         """Validate categories have unique names and IDs."""
+        if is_trusted(info):
+            return v
         if len(v) < 2:
             raise ValueError("At least 2 categories are required")
         if len(v) > 8:
@@ -94,8 +99,12 @@ class CategorizationData(BaseQuestionData):
 
     @field_validator("items")
     @classmethod
-    def validate_items(cls, v: list[CategoryItem]) -> list[CategoryItem]:
+    def validate_items(
+        cls, v: list[CategoryItem], info: ValidationInfo
+    ) -> list[CategoryItem]:
         """Validate items have unique texts and IDs."""
+        if is_trusted(info):
+            return v
         if len(v) < 4:
             raise ValueError("At least 4 items are required")
         if len(v) > 20:
@@ -116,10 +125,10 @@ class CategorizationData(BaseQuestionData):
     @field_validator("distractors")
     @classmethod
     def validate_distractors(
-        cls, v: list[CategoryItem] | None
+        cls, v: list[CategoryItem] | None, info: ValidationInfo
     ) -> list[CategoryItem] | None:
         """Validate distractors and ensure no duplicates."""
-        if v is None:
+        if v is None or is_trusted(info):
             return v
 
         if len(v) > 5:
@@ -212,6 +221,8 @@ class CategorizationData(BaseQuestionData):
 class CategorizationQuestionType(BaseQuestionType):
     """Implementation for categorization questions."""
 
+    trusted_validators = True
+
     @property
     def question_type(self) -> QuestionType:
         """Return the question type enum."""
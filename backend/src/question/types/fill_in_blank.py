@@ -6,7 +6,13 @@ from collections import Counter
 from collections.abc import Callable
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 from src.canvas.constants import CanvasInteractionType, CanvasScoringAlgorithm
 
@@ -16,6 +22,38 @@ from .base import (
     QuestionType,
     generate_canvas_title,
 )
+from .validation import is_trusted
+
+# [blank_N] tags where N is a number
+_BLANK_TAG_PATTERN = re.compile(r"\[blank_(\d+)\]", re.IGNORECASE)
+
+# Strings float() accepts as finite decimal numbers, checked before parsing
+# to avoid raising for the common non-numeric answer
+_NUMBER_PATTERN = re.compile(
+    r"\s*[+-]?(\d[\d_]*\.?[\d_]*|\.\d[\d_]*)([eE][+-]?\d+)?\s*"
+)
+
+
+def _analyze_blank_tags(question_text: str) -> tuple[list[int], list[int]]:
+    """
+    Scan question text once for [blank_N] tags.
+
+    Args:
+        question_text: The question text to parse
+
+    Returns:
+        Tuple of (sorted unique positions, positions that appear more than once)
+    """
+    seen: set[int] = set()
+    duplicates: dict[int, None] = {}
+    for match in _BLANK_TAG_PATTERN.finditer(question_text):
+        position = int(match.group(1))
+        if position in seen:
+            duplicates[position] = None
+        else:
+            seen.add(position)
+
+    return sorted(seen), list(duplicates)
 
 
 def _extract_blank_tags(question_text: str) -> list[int]:
@@ -31,12 +69,8 @@ def _extract_blank_tags(question_text: str) -> list[int]:
     if not question_text:
         return []
 
-    # Find all [blank_N] patterns where N is a number
-    pattern = r"\[blank_(\d+)\]"
-    matches = re.findall(pattern, question_text, re.IGNORECASE)
-
     # Convert to integers and return
-    return [int(match) for match in matches]
+    return [int(match) for match in _BLANK_TAG_PATTERN.findall(question_text)]
 
 
 def _find_duplicate_blank_tags(question_text: str) -> list[int]:
@@ -59,7 +93,9 @@ def _find_duplicate_blank_tags(question_text: str) -> list[int]:
 
 
 def _validate_blank_tags_match_positions(
-    question_text: str, blank_positions: list[int]
+    question_text: str,
+    blank_positions: list[int],
+    text_positions: list[int] | None = None,
 ) -> tuple[bool, str]:
     """
     Validate that blank tags in question text match the configured blank positions.
@@ -67,6 +103,7 @@ def _validate_blank_tags_match_positions(
     Args:
         question_text: The question text containing blank tags
         blank_positions: List of positions from blank configurations
+        text_positions: Sorted unique tag positions if already extracted
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -80,8 +117,8 @@ def _validate_blank_tags_match_positions(
         return True, ""
 
     # Extract unique blank positions from question text
-    text_positions = list(set(_extract_blank_tags(question_text)))
-    text_positions.sort()
+    if text_positions is None:
+        text_positions = sorted(set(_extract_blank_tags(question_text)))
 
     # Sort configured positions for comparison
     config_positions = sorted(blank_positions)
@@ -134,9 +171,11 @@ class BlankData(BaseModel):
 
     @field_validator("answer_variations")
     @classmethod
-    def validate_answer_variations(cls, v: list[str] | None) -> list[str] | None:
+    def validate_answer_variations(
+        cls, v: list[str] | None, info: ValidationInfo
+    ) -> list[str] | None:
         """Validate that answer variations are non-empty if provided."""
-        if v is None:
+        if v is None or is_trusted(info):
             return v
 
         # Check maximum length
@@ -177,6 +216,10 @@ class BlankData(BaseModel):
 
         # Process answers to remove float equivalents of integers
         for answer in answers:
+            if not _NUMBER_PATTERN.fullmatch(answer):
+                # Not a number, keep as is
+                filtered_answers.append(answer)
+                continue
             try:
                 # Try to parse as float
                 float_val = float(answer)
@@ -207,8 +250,13 @@ class FillInBlankData(BaseQuestionData):
 
     @field_validator("blanks")
     @classmethod
-    def validate_blanks(cls, v: list[BlankData]) -> list[BlankData]:
+    def validate_blanks(
+        cls, v: list[BlankData], info: ValidationInfo
+    ) -> list[BlankData]:
         """Validate that blanks have unique positions."""
+        if v and is_trusted(info):
+            return v
+
         if not v:
             raise ValueError("At least one blank is required")
 
@@ -242,7 +290,7 @@ class FillInBlankData(BaseQuestionData):
         return answers
 
     @model_validator(mode="after")
-    def validate_blank_tags(self) -> "FillInBlankData":
+    def validate_blank_tags(self, info: ValidationInfo) -> "FillInBlankData":
         """
         Validate that blank tags in question text match the blank configurations.
 
@@ -252,11 +300,13 @@ class FillInBlankData(BaseQuestionData):
         3. All blank positions have corresponding tags in question text
         """
         # Skip validation if no question text or blanks
-        if not self.question_text or not self.blanks:
+        if not self.question_text or not self.blanks or is_trusted(info):
             return self
 
+        # Scan the tags once for both checks
+        text_positions, duplicate_positions = _analyze_blank_tags(self.question_text)
+
         # Check for duplicate blank tags in question text
-        duplicate_positions = _find_duplicate_blank_tags(self.question_text)
         if duplicate_positions:
             duplicate_tags = [f"[blank_{pos}]" for pos in duplicate_positions]
             raise ValueError(
@@ -266,7 +316,7 @@ class FillInBlankData(BaseQuestionData):
         # Validate that blank tags match blank configurations
         blank_positions = [blank.position for blank in self.blanks]
         is_valid, error_message = _validate_blank_tags_match_positions(
-            self.question_text, blank_positions
+            self.question_text, blank_positions, text_positions
         )
 
         if not is_valid:
@@ -278,6 +328,8 @@ class FillInBlankData(BaseQuestionData):
 class FillInBlankQuestionType(BaseQuestionType):
     """Implementation for fill-in-blank questions."""
 
+    trusted_validators = True
+
     @property
     def question_type(self) -> QuestionType:
         """Return the question type enum."""
@@ -4,7 +4,7 @@ import random
 import uuid
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 from src.canvas.constants import CanvasInteractionType, CanvasScoringAlgorithm
 
@@ -14,6 +14,7 @@ from .base import (
     QuestionType,
     generate_canvas_title,
 )
+from .validation import is_trusted
 
 
 class MatchingPair(BaseModel):
@@ -49,8 +50,12 @@ class MatchingData(BaseQuestionData):
 
     @field_validator("pairs")
     @classmethod
-    def validate_pairs(cls, v: list[MatchingPair]) -> list[MatchingPair]:
+    def validate_pairs(
+        cls, v: list[MatchingPair], info: ValidationInfo
+    ) -> list[MatchingPair]:
         """Validate that pairs have no duplicate questions or answers."""
+        if is_trusted(info):
+            return v
         if len(v) < 3:
             raise ValueError("At least 3 pairs are required")
         if len(v) > 10:
@@ -70,9 +75,11 @@ class MatchingData(BaseQuestionData):
 
     @field_validator("distractors")
     @classmethod
-    def validate_distractors(cls, v: list[str] | None) -> list[str] | None:
+    def validate_distractors(
+        cls, v: list[str] | None, info: ValidationInfo
+    ) -> list[str] | None:
         """Validate distractors and ensure no duplicates."""
-        if v is None:
+        if v is None or is_trusted(info):
             return v
 
         if len(v) > 5:
@@ -113,6 +120,8 @@ class MatchingData(BaseQuestionData):
 class MatchingQuestionType(BaseQuestionType):
     """Implementation for matching questions."""
 
+    trusted_validators = True
+
     @property
     def question_type(self) -> QuestionType:
         """Return the question type enum."""
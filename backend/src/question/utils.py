@@ -39,3 +39,28 @@ def generate_edit_log_entries(
             )
 
     return edit_entries
+
+
+def truncate_at_boundary(text: str, max_chars: int) -> str:
+    """
+    Truncate text to at most ``max_chars`` characters at a natural boundary.
+
+    Prefers cutting at a paragraph break, then a line break, then a space, as
+    long as that keeps at least half of the allowed text.
+
+    Args:
+        text: Text to truncate
+        max_chars: Maximum number of characters to keep
+
+    Returns:
+        The text itself if it fits, otherwise a truncated prefix
+    """
+    if len(text) <= max_chars:
+        return text
+
+    prefix = text[:max_chars]
+    for separator in ("\n\n", "\n", " "):
+        index = prefix.rfind(separator)
+        if index >= max_chars // 2:
+            return prefix[:index].rstrip()
+    return prefix
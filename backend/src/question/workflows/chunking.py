@@ -0,0 +1,154 @@
+"""Splitting of module content into chunks for parallel generation prompts."""
+
+import re
+from dataclasses import dataclass
+
+from ..utils import truncate_at_boundary
+
+# Page headings emitted when module pages are combined ("## {page_title}")
+HEADING_PATTERN = re.compile(r"^## ", re.MULTILINE)
+
+PARAGRAPH_SEPARATOR = "\n\n"
+
+
+@dataclass(frozen=True)
+class ContentChunk:
+    """A contiguous part of a module's content."""
+
+    title: str | None
+    content: str
+
+    @property
+    def weight(self) -> int:
+        """Relative amount of material in the chunk."""
+        return len(self.content)
+
+
+def split_sections(content: str) -> list[ContentChunk]:
+    """
+    Split module content on its page headings.
+
+    Args:
+        content: Combined module content
+
+    Returns:
+        One chunk per page, in order; text before the first heading is kept
+    """
+    starts = [match.start() for match in HEADING_PATTERN.finditer(content)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+
+    sections = []
+    for start, end in zip(starts, [*starts[1:], len(content)], strict=True):
+        text = content[start:end].strip()
+        if not text:
+            continue
+        title = None
+        if text.startswith("## "):
+            title = text.splitlines()[0][3:].strip() or None
+        sections.append(ContentChunk(title=title, content=text))
+    return sections
+
+
+def chunk_module_content(content: str, max_chunk_chars: int) -> list[ContentChunk]:
+    """
+    Split module content into chunks of at most ``max_chunk_chars``.
+
+    Pages are kept whole where possible and small consecutive pages are packed
+    together. Pages longer than the limit are split on paragraph breaks, with
+    the page heading repeated so each part keeps its context.
+
+    Args:
+        content: Combined module content
+        max_chunk_chars: Maximum characters per chunk
+
+    Returns:
+        Chunks in content order (a single chunk if the content fits)
+    """
+    if len(content) <= max_chunk_chars:
+        return [ContentChunk(title=None, content=content)]
+
+    chunks: list[ContentChunk] = []
+    parts: list[str] = []
+    title: str | None = None
+    size = 0
+
+    for section in split_sections(content):
+        for piece in _split_section(section, max_chunk_chars):
+            added = len(piece) + (len(PARAGRAPH_SEPARATOR) if parts else 0)
+            if parts and size + added > max_chunk_chars:
+                chunks.append(ContentChunk(title, PARAGRAPH_SEPARATOR.join(parts)))
+                parts, size = [], 0
+                added = len(piece)
+            if not parts:
+                title = section.title
+            parts.append(piece)
+            size += added
+
+    if parts:
+        chunks.append(ContentChunk(title, PARAGRAPH_SEPARATOR.join(parts)))
+    return chunks
+
+
+def _split_section(section: ContentChunk, max_chunk_chars: int) -> list[str]:
+    if len(section.content) <= max_chunk_chars:
+        return [section.content]
+
+    heading = f"## {section.title}\n" if section.title else ""
+    body = section.content[len(heading) :] if heading else section.content
+    limit = max(max_chunk_chars - len(heading), 1)
+
+    pieces = []
+    current = ""
+    for paragraph in body.split(PARAGRAPH_SEPARATOR):
+        # Paragraphs longer than a whole chunk are cut at line/word boundaries
+        while len(paragraph) > limit:
+            head = truncate_at_boundary(paragraph, limit)
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(head)
+            paragraph = paragraph[len(head) :].lstrip()
+
+        candidate = (
+            f"{current}{PARAGRAPH_SEPARATOR}{paragraph}" if current else paragraph
+        )
+        if len(candidate) > limit:
+            pieces.append(current)
+            current = paragraph
+        else:
+            current = candidate
+    if current:
+        pieces.append(current)
+
+    return [f"{heading}{piece}" for piece in pieces if piece.strip()]
+
+
+def allocate_questions(chunks: list[ContentChunk], total: int) -> list[int]:
+    """
+    Allocate a question count across chunks in proportion to their weight.
+
+    Uses the largest remainder method, so counts always sum to ``total``.
+
+    Args:
+        chunks: Chunks to allocate across
+        total: Number of questions to distribute
+
+    Returns:
+        Question count per chunk, in chunk order
+    """
+    weights = [chunk.weight for chunk in chunks]
+    total_weight = sum(weights)
+    if total <= 0 or total_weight == 0:
+        return [0] * len(chunks)
+
+    quotas = [total * weight / total_weight for weight in weights]
+    counts = [int(quota) for quota in quotas]
+    by_remainder = sorted(
+        range(len(chunks)),
+        key=lambda index: (quotas[index] - counts[index], weights[index]),
+        reverse=True,
+    )
+    for index in by_remainder[: total - sum(counts)]:
+        counts[index] += 1
+    return counts
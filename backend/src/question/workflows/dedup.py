@@ -0,0 +1,229 @@
+"""Near-duplicate detection for generated questions within a quiz."""
+
+import random
+import re
+import zlib
+from typing import Any
+from uuid import UUID
+
+from src.config import get_logger
+from src.database import get_async_session
+
+from ..types import Question, QuestionType
+
+logger = get_logger("question_dedup")
+
+# Questions whose token sets are at least this similar are duplicates
+DEFAULT_SIMILARITY_THRESHOLD = 0.7
+
+# MinHash signature layout for locality-sensitive hashing. 16 bands of 4 rows
+# make pairs above ~0.6 similarity candidates with high probability, while
+# dissimilar questions rarely share a band.
+NUM_BANDS = 16
+ROWS_PER_BAND = 4
+NUM_PERMUTATIONS = NUM_BANDS * ROWS_PER_BAND
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(2024)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+_WORD = re.compile(r"\w+")
+
+# Function words carry no topic, and generated stems share many of them
+_STOP_WORDS = frozenset(
+    "a an and are as at be by does for from how in is it of on or the this "
+    "that to was what when where which who why with following".split()
+)
+
+# (band index, band of signature values)
+_BucketKey = tuple[int, tuple[int, ...]]
+
+
+def _answer_texts(question_type: QuestionType, data: dict[str, Any]) -> list[str]:
+    """Texts of the correct answers, which distinguish questions on one topic."""
+    if question_type == QuestionType.MULTIPLE_CHOICE:
+        letter = str(data.get("correct_answer", "")).lower()
+        return [str(data.get(f"option_{letter}", ""))]
+    if question_type == QuestionType.TRUE_FALSE:
+        return [str(data.get("correct_answer", ""))]
+    if question_type == QuestionType.FILL_IN_BLANK:
+        return [
+            str(blank.get("correct_answer", "")) for blank in data.get("blanks") or []
+        ]
+    if question_type == QuestionType.MATCHING:
+        return [
+            f"{pair.get('question', '')} {pair.get('answer', '')}"
+            for pair in data.get("pairs") or []
+        ]
+    if question_type == QuestionType.CATEGORIZATION:
+        categories = [str(c.get("name", "")) for c in data.get("categories") or []]
+        return categories + [str(i.get("text", "")) for i in data.get("items") or []]
+    return []
+
+
+def question_tokens(
+    question_type: QuestionType, data: dict[str, Any]
+) -> frozenset[str]:
+    """
+    Normalized token set of a question's text and answers.
+
+    Args:
+        question_type: Type of the question
+        data: Question data
+
+    Returns:
+        Lower-cased word tokens without stop words
+    """
+    text = " ".join(
+        [str(data.get("question_text", "")), *_answer_texts(question_type, data)]
+    )
+    return frozenset(_WORD.findall(text.lower())) - _STOP_WORDS
+
+
+def minhash_signature(tokens: frozenset[str]) -> list[int]:
+    """MinHash signature of a token set."""
+    hashes = [zlib.crc32(token.encode()) for token in tokens] or [0]
+    return [
+        min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def _jaccard(first: frozenset[str], second: frozenset[str]) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class QuestionDedupIndex:
+    """
+    Incremental near-duplicate index for the questions of one quiz.
+
+    Questions are bucketed by MinHash bands (LSH). A check only compares
+    exact token-set Jaccard similarity against questions sharing a bucket, so
+    its cost stays flat as the quiz grows to thousands of questions.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._tokens: dict[UUID, frozenset[str]] = {}
+        self._bands: dict[UUID, list[_BucketKey]] = {}
+        self._buckets: dict[_BucketKey, set[UUID]] = {}
+        self._stats = {"checks": 0, "duplicates": 0}
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def find_duplicate(self, question: Question) -> tuple[UUID, float] | None:
+        """
+        Find an indexed question the given one nearly duplicates.
+
+        Args:
+            question: Question to check
+
+        Returns:
+            Tuple of (duplicate question ID, similarity), or None
+        """
+        tokens = question_tokens(question.question_type, question.question_data)
+        return self._find(tokens, self._band_keys(tokens))
+
+    def add(self, question: Question) -> None:
+        """Index a question."""
+        tokens = question_tokens(question.question_type, question.question_data)
+        self._insert(question.id, tokens, self._band_keys(tokens))
+
+    def check_and_add(self, question: Question) -> bool:
+        """
+        Index a question unless it duplicates an indexed one.
+
+        Returns:
+            True if the question was added, False if it is a duplicate
+        """
+        tokens = question_tokens(question.question_type, question.question_data)
+        bands = self._band_keys(tokens)
+        self._stats["checks"] += 1
+
+        duplicate = self._find(tokens, bands)
+        if duplicate is not None:
+            self._stats["duplicates"] += 1
+            logger.info(
+                "question_duplicate_rejected",
+                question_text=question.question_data.get("question_text"),
+                duplicate_of=str(duplicate[0]),
+                similarity=round(duplicate[1], 3),
+            )
+            return False
+
+        self._insert(question.id, tokens, bands)
+        return True
+
+    def discard(self, question: Question) -> None:
+        """Remove a question, e.g. one that ended up not being saved."""
+        self._tokens.pop(question.id, None)
+        for key in self._bands.pop(question.id, []):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(question.id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def get_stats(self) -> dict[str, int]:
+        """Get index statistics."""
+        return {**self._stats, "indexed": len(self._tokens)}
+
+    def _band_keys(self, tokens: frozenset[str]) -> list[tuple[int, ...]]:
+        signature = minhash_signature(tokens)
+        return [
+            tuple(signature[start : start + ROWS_PER_BAND])
+            for start in range(0, NUM_PERMUTATIONS, ROWS_PER_BAND)
+        ]
+
+    def _find(
+        self, tokens: frozenset[str], bands: list[tuple[int, ...]]
+    ) -> tuple[UUID, float] | None:
+        candidates: set[UUID] = set()
+        for band_index, band in enumerate(bands):
+            candidates |= self._buckets.get((band_index, band), set())
+
+        best: tuple[UUID, float] | None = None
+        for candidate in candidates:
+            similarity = _jaccard(tokens, self._tokens[candidate])
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (candidate, similarity)
+        return best
+
+    def _insert(
+        self, question_id: UUID, tokens: frozenset[str], bands: list[tuple[int, ...]]
+    ) -> None:
+        self._tokens[question_id] = tokens
+        keys = list(enumerate(bands))
+        self._bands[question_id] = keys
+        for key in keys:
+            self._buckets.setdefault(key, set()).add(question_id)
+
+
+async def load_quiz_dedup_index(quiz_id: UUID) -> QuestionDedupIndex:
+    """
+    Build a dedup index seeded with the quiz's existing questions.
+
+    Regenerating failed batches then avoids paraphrasing questions that were
+    saved by earlier runs.
+
+    Args:
+        quiz_id: Quiz identifier
+
+    Returns:
+        Index containing all non-deleted questions of the quiz
+    """
+    from ..service import get_questions_by_quiz
+
+    index = QuestionDedupIndex()
+    async with get_async_session() as session:
+        for question in await get_questions_by_quiz(session, quiz_id):
+            index.add(question)
+
+    logger.info("question_dedup_index_loaded", quiz_id=str(quiz_id), indexed=len(index))
+    return index
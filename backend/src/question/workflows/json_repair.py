@@ -0,0 +1,192 @@
+"""Deterministic repair of malformed JSON array responses."""
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from src.config import get_logger
+
+from .json_stream import IncrementalJSONArrayParser
+
+logger = get_logger("json_repair")
+
+# Typographic double quotes that models emit in place of JSON string quotes
+_SMART_QUOTES = frozenset("“”„‟″")
+
+# Raw control characters that are invalid inside JSON strings
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+_decoder = json.JSONDecoder()
+
+_stats: dict[str, int] = {"attempts": 0, "repaired": 0, "failed": 0}
+
+
+@dataclass
+class JSONRepairResult:
+    """A JSON array recovered from a malformed response."""
+
+    data: list[Any]
+    strategy: str
+    dropped_elements: int = 0
+
+
+def _normalise(text: str) -> tuple[str, bool, list[str]]:
+    """
+    Fix mechanical JSON errors outside of string content.
+
+    Smart quotes used as string delimiters become plain quotes, trailing
+    commas are removed and raw control characters inside strings are
+    escaped.
+
+    Returns:
+        Tuple of (normalised text, whether it ends inside a string,
+        stack of unclosed brackets)
+    """
+    out: list[str] = []
+    stack: list[str] = []
+    in_string = False
+    smart_string = False
+    escape = False
+    length = len(text)
+
+    def next_significant(index: int) -> str:
+        while index < length and text[index].isspace():
+            index += 1
+        return text[index] if index < length else ""
+
+    for index, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+                out.append(char)
+            elif char == "\\":
+                escape = True
+                out.append(char)
+            elif char == '"' and not smart_string:
+                in_string = False
+                out.append(char)
+            elif (
+                char in _SMART_QUOTES
+                and smart_string
+                and next_significant(index + 1) in ("", ":", ",", "}", "]")
+            ):
+                in_string = False
+                out.append('"')
+            elif char == '"':
+                # A plain quote inside a smart-quoted string is content
+                out.append('\\"')
+            else:
+                out.append(_CONTROL_ESCAPES.get(char, char))
+            continue
+
+        if char == '"' or char in _SMART_QUOTES:
+            in_string = True
+            smart_string = char != '"'
+            out.append('"')
+        elif char == "," and next_significant(index + 1) in ("", "}", "]"):
+            continue
+        else:
+            if char in _CLOSERS:
+                stack.append(char)
+            elif char in "}]" and stack:
+                stack.pop()
+            out.append(char)
+
+    return "".join(out), in_string, stack
+
+
+def _decode_array(text: str) -> list[Any] | None:
+    """Decode the first array of objects in the text, ignoring surrounding prose."""
+    start = text.find("[")
+    while start != -1:
+        try:
+            value, _ = _decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if (
+                isinstance(value, list)
+                and value
+                and all(isinstance(item, dict) for item in value)
+            ):
+                return value
+        start = text.find("[", start + 1)
+    return None
+
+
+def _attempt(text: str) -> JSONRepairResult | None:
+    extracted = _decode_array(text)
+    if extracted:
+        return JSONRepairResult(data=extracted, strategy="extracted")
+
+    normalised, in_string, stack = _normalise(text)
+    repaired = _decode_array(normalised)
+    if repaired:
+        return JSONRepairResult(data=repaired, strategy="normalised")
+
+    if stack == ["["] and not in_string:
+        # Output cut off between elements; closing the array keeps every
+        # element that was fully written. A cut inside an element falls
+        # through to the prefix stage, which drops the partial element.
+        balanced = _decode_array(normalised.rstrip().rstrip(",") + "]")
+        if balanced:
+            return JSONRepairResult(data=balanced, strategy="balanced")
+
+    # Keep every complete element, skipping malformed or truncated ones
+    parser = IncrementalJSONArrayParser()
+    salvaged = parser.feed(normalised)
+    if salvaged:
+        dropped = len(parser.errors) + int(parser.has_partial_element)
+        return JSONRepairResult(
+            data=salvaged,
+            strategy="prefix" if not parser.errors else "salvaged",
+            dropped_elements=dropped,
+        )
+
+    return None
+
+
+def repair_json_array(text: str) -> JSONRepairResult | None:
+    """
+    Recover a JSON array from a response that failed strict parsing.
+
+    Repairs are tried from least to most lossy: extracting the array from
+    surrounding prose, fixing smart quotes, trailing commas and raw control
+    characters, closing the array of a response cut off between elements,
+    and finally keeping only the complete elements.
+
+    Args:
+        text: Raw model response
+
+    Returns:
+        Repaired non-empty array, or None if nothing could be recovered
+    """
+    _stats["attempts"] += 1
+    result = _attempt(text)
+
+    if result is None:
+        _stats["failed"] += 1
+        return None
+
+    _stats["repaired"] += 1
+    _stats[result.strategy] = _stats.get(result.strategy, 0) + 1
+    logger.info(
+        "json_response_repaired",
+        strategy=result.strategy,
+        elements=len(result.data),
+        dropped_elements=result.dropped_elements,
+    )
+    return result
+
+
+def get_repair_stats() -> dict[str, int]:
+    """Get process-wide repair statistics."""
+    return dict(_stats)
+
+
+def reset_repair_stats() -> None:
+    """Reset repair statistics (useful for testing)."""
+    _stats.clear()
+    _stats.update({"attempts": 0, "repaired": 0, "failed": 0})
@@ -0,0 +1,91 @@
+"""Incremental parsing of streamed JSON arrays."""
+
+import json
+from typing import Any
+
+
+class IncrementalJSONArrayParser:
+    """
+    Incremental parser for a streamed top-level JSON array of objects.
+
+    Text is fed in arbitrary chunks. Each object element of the array is
+    returned as soon as its closing brace arrives, so callers can process
+    elements while the rest of the array is still being generated. Anything
+    before the opening bracket (e.g. a markdown code fence) is ignored.
+    """
+
+    def __init__(self) -> None:
+        self.started = False
+        self.finished = False
+        self.objects_parsed = 0
+        self.errors: list[str] = []
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._element: list[str] = []
+
+    @property
+    def has_partial_element(self) -> bool:
+        """Whether an element was started but not yet closed."""
+        return self._depth > 0
+
+    def feed(self, chunk: str) -> list[Any]:
+        """
+        Consume a chunk of text.
+
+        Args:
+            chunk: Next piece of the streamed response
+
+        Returns:
+            Objects completed by this chunk, in order
+        """
+        completed: list[Any] = []
+        element = self._element
+
+        for char in chunk:
+            if self.finished:
+                break
+
+            if not self.started:
+                if char == "[":
+                    self.started = True
+                continue
+
+            if self._depth == 0:
+                # Between elements: only an object start or the array end matter
+                if char == "{":
+                    element.append(char)
+                    self._depth = 1
+                elif char == "]":
+                    self.finished = True
+                continue
+
+            element.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._complete_element(completed)
+
+        return completed
+
+    def _complete_element(self, completed: list[Any]) -> None:
+        text = "".join(self._element)
+        self._element.clear()
+        try:
+            completed.append(json.loads(text))
+            self.objects_parsed += 1
+        except json.JSONDecodeError as e:
+            self.errors.append(f"Invalid array element: {str(e)}")
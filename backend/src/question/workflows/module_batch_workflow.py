@@ -2,16 +2,25 @@
 
 import asyncio
 import json
-from typing import Any
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Any, TypedDict
 from uuid import UUID
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph
-from pydantic import BaseModel, Field
 
 from src.config import get_logger, settings
 from src.database import get_async_session
 
-from ..providers import BaseLLMProvider, LLMMessage
+from ..providers import BaseLLMProvider, LLMError, LLMMessage, LLMProvider
+from ..providers.cache import discard_cached_responses
+from ..providers.tokens import count_prompt_tokens, get_token_counter
+from ..service import bulk_insert_questions
 from ..templates.manager import TemplateManager, get_template_manager
 from ..types import (
     GenerationParameters,
@@ -20,12 +29,44 @@ from ..types import (
     QuestionType,
     QuizLanguage,
 )
+from .chunking import ContentChunk, allocate_questions, chunk_module_content
+from .dedup import QuestionDedupIndex, load_quiz_dedup_index
+from .json_repair import repair_json_array
+from .json_stream import IncrementalJSONArrayParser
+from .packing import (
+    PackMember,
+    build_packed_content,
+    packing_instructions,
+    plan_module_packs,
+    split_packed_response,
+)
+from .prompt_budget import PromptBudget, estimate_output_tokens, trim_to_tokens
+from .quality import select_best_questions
+from .scheduler import (
+    BatchScheduler,
+    ScheduledBatch,
+    estimate_batch_cost,
+    register_quiz_scheduler,
+    unregister_quiz_scheduler,
+)
+from .structured_output import RESPONSE_ARRAY_KEY, drop_nulls, question_batch_schema
 
 logger = get_logger("module_batch_workflow")
 
+# Top-up retries list at most this many accepted question stems, each shortened
+TOP_UP_MAX_STEMS = 50
+TOP_UP_STEM_MAX_CHARS = 200
+
 
-class ModuleBatchState(BaseModel):
-    """State for module batch generation workflow."""
+@dataclass(slots=True, kw_only=True)
+class ModuleBatchState:
+    """
+    State for module batch generation workflow.
+
+    A plain slotted dataclass rather than a Pydantic model: graph nodes mutate
+    a single instance in place, so module content, questions and providers
+    are held by reference and never validated or copied between steps.
+    """
 
     # Input parameters
     quiz_id: UUID
@@ -43,43 +84,153 @@ class ModuleBatchState(BaseModel):
     template_manager: TemplateManager
 
     # Workflow state
-    generated_questions: list[Question] = Field(default_factory=list)
+    generated_questions: list[Question] = field(default_factory=list)
     retry_count: int = 0
-    max_retries: int = Field(default_factory=lambda: settings.MAX_GENERATION_RETRIES)
+    max_retries: int = field(default_factory=lambda: settings.MAX_GENERATION_RETRIES)
 
     # JSON correction state
     parsing_error: bool = False
     correction_attempts: int = 0
-    max_corrections: int = Field(default_factory=lambda: settings.MAX_JSON_CORRECTIONS)
+    max_corrections: int = field(default_factory=lambda: settings.MAX_JSON_CORRECTIONS)
 
     # Validation error state
     validation_error: bool = False
-    validation_error_details: list[str] = Field(default_factory=list)
+    validation_error_details: list[str] = field(default_factory=list)
     validation_correction_attempts: int = 0
-    max_validation_corrections: int = Field(
+    max_validation_corrections: int = field(
         default_factory=lambda: settings.MAX_JSON_CORRECTIONS
     )
 
     # Smart retry state for failed question tracking
-    failed_questions_data: list[dict[str, Any]] = Field(default_factory=list)
-    failed_questions_errors: list[str] = Field(default_factory=list)
-    successful_questions_preserved: list[Question] = Field(default_factory=list)
+    failed_questions_data: list[dict[str, Any]] = field(default_factory=list)
+    failed_questions_errors: list[str] = field(default_factory=list)
+    successful_questions_preserved: list[Question] = field(default_factory=list)
+    # Questions written to the database, without spares dropped by selection
+    saved_questions: list[Question] = field(default_factory=list)
+
+    # Questions validated while the response was streaming
+    streamed_questions: list[Question] | None = None
+    streamed_failed_data: list[dict[str, Any]] = field(default_factory=list)
+    streamed_failed_errors: list[str] = field(default_factory=list)
 
     # Current LLM interaction
     system_prompt: str = ""
     user_prompt: str = ""
+    chunk_prompts: list[dict[str, Any]] = field(default_factory=list)
+    # Chunks of the last full prompt, with how many questions each returned
+    content_chunks: list[dict[str, Any]] = field(default_factory=list)
     raw_response: str = ""
+    # Response share from a request packed with other small modules
+    packed_response: str | None = None
 
     # Error handling
     error_message: str | None = None
 
     # Metadata
-    workflow_metadata: dict[str, Any] = Field(default_factory=dict)
+    workflow_metadata: dict[str, Any] = field(default_factory=dict)
+
+
+# Awaited with (batch_key, questions, metadata) when a batch finishes
+BatchCompleteCallback = Callable[[str, list[Question], dict[str, Any]], Awaitable[None]]
+
+
+class _GraphState(TypedDict):
+    """Graph channels: a single reference to the mutable batch state."""
+
+    batch: ModuleBatchState
+
+
+def _node(method_name: str) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Graph node dispatching to the workflow passed in the run config."""
+
+    async def node(graph_state: _GraphState, config: RunnableConfig) -> dict[str, Any]:
+        workflow = config["configurable"]["workflow"]
+        state = await getattr(workflow, method_name)(graph_state["batch"])
+        return {"batch": state}
+
+    node.__name__ = method_name
+    return node
+
+
+def _router(method_name: str) -> Callable[..., str]:
+    """Conditional edge dispatching to the workflow passed in the run config."""
+
+    def route(graph_state: _GraphState, config: RunnableConfig) -> str:
+        workflow = config["configurable"]["workflow"]
+        route_name: str = getattr(workflow, method_name)(graph_state["batch"])
+        return route_name
+
+    route.__name__ = method_name
+    return route
+
 
-    class Config:
-        """Pydantic configuration."""
+@lru_cache(maxsize=1)
+def get_module_batch_graph() -> Any:
+    """
+    Get the compiled module batch workflow graph.
 
-        arbitrary_types_allowed = True
+    The graph is compiled once per process and shared by all workflows. Nodes
+    look up the workflow instance from ``config["configurable"]["workflow"]``.
+    """
+    workflow = StateGraph(_GraphState)
+
+    # Add nodes
+    for name in (
+        "prepare_prompt",
+        "generate_batch",
+        "validate_batch",
+        "check_completion",
+        "prepare_correction",
+        "prepare_validation_correction",
+        "retry_generation",
+        "prepare_top_up",
+        "save_questions",
+    ):
+        workflow.add_node(name, _node(name))
+
+    # Add edges
+    workflow.add_edge(START, "prepare_prompt")
+    workflow.add_edge("prepare_prompt", "generate_batch")
+    workflow.add_edge("generate_batch", "validate_batch")
+
+    # Conditional edge from validate_batch
+    workflow.add_conditional_edges(
+        "validate_batch",
+        _router("check_error_type"),
+        {
+            "needs_json_correction": "prepare_correction",
+            "needs_validation_correction": "prepare_validation_correction",
+            "continue": "check_completion",
+        },
+    )
+
+    workflow.add_edge("prepare_correction", "generate_batch")
+    workflow.add_edge("prepare_validation_correction", "generate_batch")
+
+    # Conditional edges from check_completion
+    workflow.add_conditional_edges(
+        "check_completion",
+        _router("should_retry"),
+        {
+            "retry": "retry_generation",
+            "complete": "save_questions",
+            "failed": END,
+        },
+    )
+
+    # Retries either ask for the missing questions only or start over
+    workflow.add_conditional_edges(
+        "retry_generation",
+        _router("retry_route"),
+        {
+            "top_up": "prepare_top_up",
+            "full": "prepare_prompt",
+        },
+    )
+    workflow.add_edge("prepare_top_up", "generate_batch")
+    workflow.add_edge("save_questions", END)
+
+    return workflow.compile()
 
 
 class ModuleBatchWorkflow:
@@ -101,63 +252,15 @@ class ModuleBatchWorkflow:
         template_manager: TemplateManager | None = None,
         language: QuizLanguage = QuizLanguage.ENGLISH,
         tone: str | None = None,
+        dedup_index: QuestionDedupIndex | None = None,
     ):
         self.llm_provider = llm_provider
         self.template_manager = template_manager or get_template_manager()
         self.language = language
         self.tone = tone
-        self.graph = self._build_graph()
-
-    def _build_graph(self) -> Any:
-        """Build the module batch workflow graph."""
-        workflow = StateGraph(ModuleBatchState)
-
-        # Add nodes
-        workflow.add_node("prepare_prompt", self.prepare_prompt)
-        workflow.add_node("generate_batch", self.generate_batch)
-        workflow.add_node("validate_batch", self.validate_batch)
-        workflow.add_node("check_completion", self.check_completion)
-        workflow.add_node("prepare_correction", self.prepare_correction)
-        workflow.add_node(
-            "prepare_validation_correction", self.prepare_validation_correction
-        )
-        workflow.add_node("retry_generation", self.retry_generation)
-        workflow.add_node("save_questions", self.save_questions)
-
-        # Add edges
-        workflow.add_edge(START, "prepare_prompt")
-        workflow.add_edge("prepare_prompt", "generate_batch")
-        workflow.add_edge("generate_batch", "validate_batch")
-
-        # Conditional edge from validate_batch
-        workflow.add_conditional_edges(
-            "validate_batch",
-            self.check_error_type,
-            {
-                "needs_json_correction": "prepare_correction",
-                "needs_validation_correction": "prepare_validation_correction",
-                "continue": "check_completion",
-            },
-        )
-
-        workflow.add_edge("prepare_correction", "generate_batch")
-        workflow.add_edge("prepare_validation_correction", "generate_batch")
-
-        # Conditional edges from check_completion
-        workflow.add_conditional_edges(
-            "check_completion",
-            self.should_retry,
-            {
-                "retry": "retry_generation",
-                "complete": "save_questions",
-                "failed": END,
-            },
-        )
-
-        workflow.add_edge("retry_generation", "prepare_prompt")
-        workflow.add_edge("save_questions", END)
-
-        return workflow.compile()
+        # Shared by all batches of a quiz so paraphrases are caught across them
+        self.dedup_index = dedup_index
+        self.graph = get_module_batch_graph()
 
     async def prepare_prompt(self, state: ModuleBatchState) -> ModuleBatchState:
         """Prepare the prompt for batch generation."""
@@ -168,12 +271,9 @@ class ModuleBatchWorkflow:
                 - len(state.generated_questions)
                 - len(state.successful_questions_preserved)
             )
-
-            # Create generation parameters
-            generation_parameters = GenerationParameters(
-                target_count=remaining_questions,
-                difficulty=state.difficulty,
-                language=self.language,
+            # Spare candidates let save_questions keep the best instead of retrying
+            requested_questions = remaining_questions + self._overgeneration_extra(
+                remaining_questions
             )
 
             # Debug: Log content being passed to template
@@ -185,35 +285,53 @@ class ModuleBatchWorkflow:
                 if state.module_content
                 else "EMPTY_CONTENT",
                 module_name=state.module_name,
-                question_count=remaining_questions,
+                question_count=requested_questions,
                 question_type=state.question_type.value,
             )
 
-            # Create messages using template
-            # Template will be automatically selected based on question type and language
-            messages = await self.template_manager.create_messages(
-                state.question_type,
-                state.module_content,
-                generation_parameters,
-                template_name=None,  # Let template manager select based on question type
-                language=self.language,
-                extra_variables={
-                    "module_name": state.module_name,
-                    "question_count": remaining_questions,
-                    "tone": state.tone or self.tone,
-                },
-            )
+            # Large modules are split so each prompt only carries one chunk
+            prompts: list[dict[str, Any]] = []
+            for chunk, question_count in self._plan_chunks(state, requested_questions):
+                messages, prompt_tokens, output_tokens = await self._build_prompt(
+                    state, chunk.content, question_count
+                )
+                prompts.append(
+                    {
+                        "title": chunk.title,
+                        "question_count": question_count,
+                        "system_prompt": messages[0].content,
+                        "user_prompt": messages[1].content,
+                        "estimated_prompt_tokens": prompt_tokens,
+                        "estimated_completion_tokens": output_tokens,
+                        "chunk": {
+                            "title": chunk.title,
+                            "content": chunk.content,
+                            "question_count": question_count,
+                            "questions_returned": 0,
+                        },
+                    }
+                )
 
             # Store system and user prompts separately
-            state.system_prompt = messages[0].content
-            state.user_prompt = messages[1].content
+            state.system_prompt = prompts[0]["system_prompt"]
+            state.user_prompt = prompts[0]["user_prompt"]
+            state.chunk_prompts = prompts if len(prompts) > 1 else []
+            state.content_chunks = [prompt["chunk"] for prompt in state.chunk_prompts]
+            state.workflow_metadata["estimated_prompt_tokens"] = sum(
+                prompt["estimated_prompt_tokens"] for prompt in prompts
+            )
+            state.workflow_metadata["estimated_completion_tokens"] = sum(
+                prompt["estimated_completion_tokens"] for prompt in prompts
+            )
 
             logger.info(
                 "module_batch_prompt_prepared",
                 module_id=state.module_id,
                 target_questions=state.target_question_count
                 - len(state.generated_questions),
+                requested_questions=requested_questions,
                 language=self.language.value,
+                prompt_chunks=len(prompts),
             )
 
         except Exception as e:
@@ -227,9 +345,134 @@ class ModuleBatchWorkflow:
 
         return state
 
+    def _overgeneration_extra(self, question_count: int) -> int:
+        """Number of spare questions to request on top of ``question_count``."""
+        ratio = settings.QUESTION_OVERGENERATION_RATIO
+        if ratio <= 0 or question_count <= 0:
+            return 0
+        return max(1, math.ceil(question_count * ratio))
+
+    def _plan_chunks(
+        self, state: ModuleBatchState, question_count: int
+    ) -> list[tuple[ContentChunk, int]]:
+        """Split module content into chunks and allocate questions across them."""
+        max_chunk_chars = settings.CONTENT_CHUNK_MAX_CHARS
+        if (
+            not max_chunk_chars
+            or question_count <= 0
+            or len(state.module_content) <= max_chunk_chars
+        ):
+            whole = ContentChunk(title=None, content=state.module_content)
+            return [(whole, question_count)]
+
+        chunks = chunk_module_content(state.module_content, max_chunk_chars)
+        allocation = allocate_questions(chunks, question_count)
+        plan = [
+            (chunk, count)
+            for chunk, count in zip(chunks, allocation, strict=True)
+            if count > 0
+        ]
+
+        logger.info(
+            "module_batch_content_chunked",
+            module_id=state.module_id,
+            content_length=len(state.module_content),
+            chunks=len(chunks),
+            chunks_used=len(plan),
+            question_allocation=[count for _, count in plan],
+        )
+        return plan
+
+    async def _build_prompt(
+        self, state: ModuleBatchState, content: str, question_count: int
+    ) -> tuple[list[LLMMessage], int, int]:
+        """
+        Render a generation prompt and fit it into the model's context window.
+
+        Headroom for the expected output (question count times the per-type
+        cost) is reserved from the context window, and content that would
+        overflow it is trimmed.
+
+        Returns:
+            Messages, estimated prompt tokens and estimated completion tokens
+
+        Raises:
+            PromptBudgetError: If the prompt without content already fills
+                the budget
+        """
+        generation_parameters = GenerationParameters(
+            target_count=question_count,
+            difficulty=state.difficulty,
+            language=self.language,
+        )
+        messages = await self._render_messages(state, content, generation_parameters)
+
+        model = self.llm_provider.configuration.model
+        counter = get_token_counter(model)
+        output_tokens = estimate_output_tokens(state.question_type, question_count)
+        prompt_tokens = await count_prompt_tokens(counter, messages)
+
+        model_info = self.llm_provider.get_model_info(model)
+        if model_info is not None:
+            budget = PromptBudget(model_info.max_tokens, output_tokens)
+            overflow = budget.overflow(prompt_tokens)
+            if overflow:
+                # Only oversized content gets here, so tokenize it off the loop
+                content_tokens = await asyncio.to_thread(counter.count, content)
+                trimmed_content = await asyncio.to_thread(
+                    trim_to_tokens, counter, content, content_tokens - overflow
+                )
+                messages = await self._render_messages(
+                    state, trimmed_content, generation_parameters
+                )
+                logger.warning(
+                    "module_batch_content_trimmed",
+                    module_id=state.module_id,
+                    prompt_tokens=prompt_tokens,
+                    max_prompt_tokens=budget.max_prompt_tokens,
+                    reserved_output_tokens=output_tokens,
+                    content_length=len(content),
+                    trimmed_length=len(trimmed_content),
+                )
+                prompt_tokens = await count_prompt_tokens(counter, messages)
+
+        return messages, prompt_tokens, output_tokens
+
+    async def _render_messages(
+        self,
+        state: ModuleBatchState,
+        content: str,
+        generation_parameters: GenerationParameters,
+    ) -> list[LLMMessage]:
+        """Render the generation prompt for the given module content."""
+        # Template will be automatically selected based on question type and language
+        return await self.template_manager.create_messages(
+            state.question_type,
+            content,
+            generation_parameters,
+            template_name=None,  # Let template manager select based on question type
+            language=self.language,
+            extra_variables={
+                "module_name": state.module_name,
+                "question_count": generation_parameters.target_count,
+                "tone": state.tone or self.tone,
+            },
+        )
+
     async def generate_batch(self, state: ModuleBatchState) -> ModuleBatchState:
         """Generate multiple questions in a single LLM call."""
         try:
+            if state.packed_response is not None:
+                # The first attempt was answered by a packed request
+                state.raw_response = state.packed_response
+                state.packed_response = None
+                state.workflow_metadata["packed_generation"] = True
+                return state
+
+            if state.chunk_prompts:
+                await self._generate_chunks(state)
+                return state
+
             # Create messages for LLM
             messages = [
                 LLMMessage(
@@ -239,10 +482,28 @@ class ModuleBatchWorkflow:
                 LLMMessage(role="user", content=state.user_prompt),
             ]
 
+            if self._should_stream():
+                await self._stream_batch(state, messages)
+                return state
+
             # Generate questions using LLM provider
-            response = await self.llm_provider.generate_with_retry(messages)
+            response = await self.llm_provider.generate_with_retry(
+                messages,
+                tenant=str(state.quiz_id),
+                **self._response_schema_kwargs(state),
+            )
 
             state.raw_response = response.content
+            response.metadata["estimated_completion_tokens"] = (
+                state.workflow_metadata.get("estimated_completion_tokens")
+            )
+
+            # Remember cache keys so rejected responses can be invalidated
+            cache_key = response.metadata.get("cache_key")
+            if cache_key:
+                state.workflow_metadata.setdefault("response_cache_keys", []).append(
+                    cache_key
+                )
 
             # Update metadata
             state.workflow_metadata.update(
@@ -252,6 +513,10 @@ class ModuleBatchWorkflow:
                         "total_tokens_used", 0
                     )
                     + (response.total_tokens or 0),
+                    "cached_tokens_used": state.workflow_metadata.get(
+                        "cached_tokens_used", 0
+                    )
+                    + (response.metadata.get("cached_tokens") or 0),
                     "last_model_used": response.model,
                 }
             )
@@ -261,6 +526,15 @@ class ModuleBatchWorkflow:
                 module_id=state.module_id,
                 response_length=len(state.raw_response),
                 response_time=response.response_time,
+                estimated_prompt_tokens=response.metadata.get(
+                    "estimated_prompt_tokens"
+                ),
+                prompt_tokens=response.prompt_tokens,
+                estimated_completion_tokens=response.metadata.get(
+                    "estimated_completion_tokens"
+                ),
+                completion_tokens=response.completion_tokens,
+                cached_tokens=response.metadata.get("cached_tokens"),
             )
 
         except Exception as e:
@@ -274,43 +548,308 @@ class ModuleBatchWorkflow:
 
         return state
 
+    async def _generate_chunks(self, state: ModuleBatchState) -> None:
+        """
+        Generate questions for every content chunk in parallel.
+
+        The question arrays of all chunk responses are merged into a single
+        ``raw_response`` for validation. Chunks whose call failed are left out;
+        the normal retry path tops up the missing questions.
+        """
+        chunk_prompts = state.chunk_prompts
+        # Corrections and retries re-enter generate_batch with a single prompt
+        state.chunk_prompts = []
+
+        responses = await asyncio.gather(
+            *(
+                self.llm_provider.generate_with_retry(
+                    [
+                        LLMMessage(role="system", content=prompt["system_prompt"]),
+                        LLMMessage(role="user", content=prompt["user_prompt"]),
+                    ],
+                    tenant=str(state.quiz_id),
+                    **self._response_schema_kwargs(state),
+                )
+                for prompt in chunk_prompts
+            ),
+            return_exceptions=True,
+        )
+
+        merged: list[Any] = []
+        unparsed: list[str] = []
+        errors: list[BaseException] = []
+        total_tokens = 0
+        cached_tokens = 0
+        response_time = 0.0
+
+        for prompt, response in zip(chunk_prompts, responses, strict=True):
+            if isinstance(response, BaseException):
+                errors.append(response)
+                logger.warning(
+                    "module_batch_chunk_generation_failed",
+                    module_id=state.module_id,
+                    chunk_title=prompt["title"],
+                    error=str(response),
+                )
+                continue
+
+            total_tokens += response.total_tokens or 0
+            cached_tokens += response.metadata.get("cached_tokens") or 0
+            response_time = max(response_time, response.response_time)
+            cache_key = response.metadata.get("cache_key")
+
+            try:
+                questions = self._parse_batch_response(response.content, state)
+                merged.extend(questions)
+                prompt["chunk"]["questions_returned"] = len(questions)
+            except ValueError:
+                unparsed.append(response.content)
+                if cache_key:
+                    await discard_cached_responses([cache_key])
+                continue
+
+            if cache_key:
+                state.workflow_metadata.setdefault("response_cache_keys", []).append(
+                    cache_key
+                )
+
+        if merged:
+            state.raw_response = json.dumps(merged)
+        elif unparsed:
+            # Nothing usable; let the JSON correction path handle one response
+            state.raw_response = unparsed[0]
+        else:
+            raise errors[0]
+
+        state.workflow_metadata.update(
+            {
+                "last_generation_time": response_time,
+                "total_tokens_used": state.workflow_metadata.get("total_tokens_used", 0)
+                + total_tokens,
+                "cached_tokens_used": state.workflow_metadata.get(
+                    "cached_tokens_used", 0
+                )
+                + cached_tokens,
+                "last_model_used": self.llm_provider.configuration.model,
+            }
+        )
+
+        logger.info(
+            "module_batch_chunks_generated",
+            module_id=state.module_id,
+            chunks=len(chunk_prompts),
+            chunks_failed=len(errors),
+            chunks_unparsed=len(unparsed),
+            questions_returned=len(merged),
+            cached_tokens=cached_tokens,
+            response_time=response_time,
+        )
+
+    async def _stream_batch(
+        self, state: ModuleBatchState, messages: list[LLMMessage]
+    ) -> None:
+        """
+        Stream the response and validate each question as soon as it is complete.
+
+        Questions that validated before a timeout (or a mid-stream provider
+        error) are kept; the retry path generates whatever is still missing.
+        Retryable provider errors raised before any element was parsed, such as
+        a rate limit on the first request, restart the stream with the
+        provider's usual backoff.
+        """
+        parser = IncrementalJSONArrayParser()
+        chunks: list[str] = []
+        questions: list[Question] = []
+        failed_data: list[dict[str, Any]] = []
+        failed_errors: list[str] = []
+        start_time = time.monotonic()
+        timed_out = False
+
+        async def consume_stream() -> None:
+            async for chunk in self.llm_provider.stream_with_admission(
+                messages, tenant=str(state.quiz_id)
+            ):
+                chunks.append(chunk)
+                for q_data in parser.feed(chunk):
+                    try:
+                        questions.append(self._validate_question_data(state, q_data))
+                    except Exception as e:
+                        failed_data.append(q_data)
+                        failed_errors.append(f"Question validation failed: {str(e)}")
+                        logger.warning(
+                            "module_batch_question_validation_failed",
+                            module_id=state.module_id,
+                            question_data=q_data,
+                            error=str(e),
+                        )
+
+        async def consume_stream_with_retry() -> None:
+            nonlocal parser
+            max_retries = self.llm_provider.configuration.max_retries
+            for attempt in range(max_retries + 1):
+                try:
+                    await consume_stream()
+                    return
+                except LLMError as e:
+                    if (
+                        not e.retryable
+                        or attempt == max_retries
+                        or parser.objects_parsed
+                        or parser.errors
+                    ):
+                        raise
+                    delay = self.llm_provider.retry_delay(attempt, e)
+                    logger.warning(
+                        "module_batch_stream_retrying",
+                        module_id=state.module_id,
+                        error_code=e.error_code,
+                        attempt=attempt + 1,
+                        retry_delay=delay,
+                    )
+                    # Nothing was parsed yet, so the partial output is discarded
+                    chunks.clear()
+                    parser = IncrementalJSONArrayParser()
+                    await asyncio.sleep(delay)
+
+        try:
+            await asyncio.wait_for(
+                consume_stream_with_retry(), timeout=settings.MODULE_GENERATION_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            timed_out = True
+            logger.warning(
+                "module_batch_stream_timed_out",
+                module_id=state.module_id,
+                timeout=settings.MODULE_GENERATION_TIMEOUT,
+                questions_validated=len(questions),
+            )
+        except LLMError as e:
+            if not questions:
+                raise
+            logger.warning(
+                "module_batch_stream_interrupted",
+                module_id=state.module_id,
+                error=str(e),
+                questions_validated=len(questions),
+            )
+
+        state.raw_response = "".join(chunks)
+        response_time = time.monotonic() - start_time
+
+        # If no array was recognised, validate_batch parses the full response
+        # so the usual JSON correction path applies
+        if parser.objects_parsed or parser.finished or timed_out or questions:
+            state.streamed_questions = questions
+            state.streamed_failed_data = failed_data
+            state.streamed_failed_errors = failed_errors
+
+        state.workflow_metadata.update(
+            {
+                "last_generation_time": response_time,
+                "last_model_used": self.llm_provider.configuration.model,
+                "streamed": True,
+                "stream_timed_out": timed_out,
+            }
+        )
+
+        logger.info(
+            "module_batch_stream_completed",
+            module_id=state.module_id,
+            response_length=len(state.raw_response),
+            response_time=response_time,
+            questions_validated=len(questions),
+            questions_failed=len(failed_data),
+            malformed_elements=len(parser.errors),
+            truncated=parser.has_partial_element or not parser.finished,
+        )
+
+    def _should_stream(self) -> bool:
+        """Stream only when enabled and the model streams natively."""
+        return settings.LLM_STREAMING_ENABLED and self.llm_provider.supports_streaming
+
+    def _response_schema_kwargs(self, state: ModuleBatchState) -> dict[str, Any]:
+        """
+        Generation parameters constraining the response to the batch's schema.
+
+        Providers without structured output get free-form JSON prompts and
+        rely on repair and correction instead. Streamed and packed requests
+        are never constrained.
+        """
+        if not (
+            settings.LLM_STRUCTURED_OUTPUT_ENABLED
+            and self.llm_provider.supports_structured_output
+        ):
+            return {}
+        return {"response_schema": question_batch_schema(state.question_type)}
+
+    def _validate_question_data(
+        self, state: ModuleBatchState, q_data: dict[str, Any]
+    ) -> Question:
+        """Validate one question object and build the Question for this batch."""
+        # Remove difficulty from question data if LLM provided it (we use batch difficulty instead)
+        q_data.pop("difficulty", None)
+
+        # Use dynamic validation based on question type
+        from ..types.registry import get_question_type_registry
+
+        registry = get_question_type_registry()
+        question_type_impl = registry.get_question_type(state.question_type)
+        validated_data = question_type_impl.validate_data(q_data)
+
+        # Create question object with validated data
+        # Always use batch difficulty (manually set, not from LLM)
+        return Question(
+            quiz_id=state.quiz_id,
+            question_type=state.question_type,
+            question_data=validated_data.model_dump(),
+            validation_stamp=question_type_impl.validation_engine.stamp_for(
+                validated_data
+            ),
+            difficulty=state.difficulty,
+            is_approved=False,
+        )
+
     async def validate_batch(self, state: ModuleBatchState) -> ModuleBatchState:
         """Validate and parse the generated questions with smart retry support."""
-        if not state.raw_response or state.error_message:
+        if state.error_message:
+            return state
+
+        if state.streamed_questions is not None:
+            # Questions were already validated while the response streamed
+            streamed_questions = state.streamed_questions
+            failed_questions = state.streamed_failed_data
+            failed_errors = state.streamed_failed_errors
+            state.streamed_questions = None
+            state.streamed_failed_data = []
+            state.streamed_failed_errors = []
+
+            await self._apply_validation_results(
+                state,
+                streamed_questions,
+                failed_questions,
+                failed_errors,
+                questions_parsed=len(streamed_questions) + len(failed_questions),
+            )
+            return state
+
+        if not state.raw_response:
             return state
 
         try:
             # Parse the response to extract individual questions
-            questions_data = self._parse_batch_response(state.raw_response)
+            questions_data = self._parse_batch_response(state.raw_response, state)
 
             # Track validation state for smart retry
-            questions_before_validation = len(state.generated_questions)
+            validated_questions = []
             failed_questions = []
             failed_errors = []
 
             # Validate and create question objects
             for q_data in questions_data:
                 try:
-                    # Remove difficulty from question data if LLM provided it (we use batch difficulty instead)
-                    q_data.pop("difficulty", None)
-
-                    # Use dynamic validation based on question type
-                    from ..types.registry import get_question_type_registry
-
-                    registry = get_question_type_registry()
-                    question_type_impl = registry.get_question_type(state.question_type)
-                    validated_data = question_type_impl.validate_data(q_data)
-
-                    # Create question object with validated data
-                    # Always use batch difficulty (manually set, not from LLM)
-                    question = Question(
-                        quiz_id=state.quiz_id,
-                        question_type=state.question_type,
-                        question_data=validated_data.model_dump(),
-                        difficulty=state.difficulty,
-                        is_approved=False,
+                    validated_questions.append(
+                        self._validate_question_data(state, q_data)
                     )
-                    state.generated_questions.append(question)
 
                 except Exception as e:
                     # Smart retry: Store failed question data and error for targeted retry
@@ -326,39 +865,12 @@ class ModuleBatchWorkflow:
                     )
                     continue
 
-            # Smart retry logic: Handle mixed success/failure scenarios
-            if failed_questions:
-                # Store failed question data for targeted retry
-                state.failed_questions_data = failed_questions
-                state.failed_questions_errors = failed_errors
-                state.validation_error = True
-
-                # Preserve newly successful questions for combination later
-                newly_successful = state.generated_questions[
-                    questions_before_validation:
-                ]
-                state.successful_questions_preserved.extend(newly_successful)
-
-                # Remove newly successful questions from generated_questions
-                # This ensures retry logic counts correctly
-                state.generated_questions = state.generated_questions[
-                    :questions_before_validation
-                ]
-
-                logger.warning(
-                    "module_batch_validation_errors_detected_smart_retry",
-                    module_id=state.module_id,
-                    failed_questions=len(failed_questions),
-                    successful_questions=len(newly_successful),
-                    total_questions_attempted=len(questions_data),
-                )
-
-            logger.info(
-                "module_batch_validation_completed",
-                module_id=state.module_id,
-                questions_validated=len(state.generated_questions),
+            await self._apply_validation_results(
+                state,
+                validated_questions,
+                failed_questions,
+                failed_errors,
                 questions_parsed=len(questions_data),
-                questions_preserved=len(state.successful_questions_preserved),
             )
 
         except ValueError as e:
@@ -373,6 +885,7 @@ class ModuleBatchWorkflow:
             )
             state.error_message = f"JSON_PARSE_ERROR: {str(e)}"
             state.parsing_error = True
+            await self._discard_last_cached_response(state)
 
         except Exception as e:
             logger.error(
@@ -385,6 +898,78 @@ class ModuleBatchWorkflow:
 
         return state
 
+    async def _apply_validation_results(
+        self,
+        state: ModuleBatchState,
+        validated_questions: list[Question],
+        failed_questions: list[dict[str, Any]],
+        failed_errors: list[str],
+        questions_parsed: int,
+    ) -> None:
+        """Record validated questions and set up smart retry for failed ones."""
+        if self.dedup_index is not None:
+            # Rejected duplicates leave a shortfall that the retry tops up
+            accepted = [
+                question
+                for question in validated_questions
+                if self.dedup_index.check_and_add(question)
+            ]
+            duplicates = len(validated_questions) - len(accepted)
+            if duplicates:
+                state.workflow_metadata["duplicates_rejected"] = (
+                    state.workflow_metadata.get("duplicates_rejected", 0) + duplicates
+                )
+                logger.info(
+                    "module_batch_duplicates_rejected",
+                    module_id=state.module_id,
+                    duplicates=duplicates,
+                    accepted=len(accepted),
+                )
+            validated_questions = accepted
+
+        if not validated_questions and not failed_questions:
+            # Every question was a duplicate (or none came back); the top-up
+            # retry reuses this prompt and must not get the same response
+            await self._discard_last_cached_response(state)
+
+        questions_before_validation = len(state.generated_questions)
+        state.generated_questions.extend(validated_questions)
+
+        # Smart retry logic: Handle mixed success/failure scenarios
+        if failed_questions:
+            await self._discard_last_cached_response(state)
+
+            # Store failed question data for targeted retry
+            state.failed_questions_data = failed_questions
+            state.failed_questions_errors = failed_errors
+            state.validation_error = True
+
+            # Preserve newly successful questions for combination later
+            newly_successful = state.generated_questions[questions_before_validation:]
+            state.successful_questions_preserved.extend(newly_successful)
+
+            # Remove newly successful questions from generated_questions
+            # This ensures retry logic counts correctly
+            state.generated_questions = state.generated_questions[
+                :questions_before_validation
+            ]
+
+            logger.warning(
+                "module_batch_validation_errors_detected_smart_retry",
+                module_id=state.module_id,
+                failed_questions=len(failed_questions),
+                successful_questions=len(newly_successful),
+                total_questions_attempted=questions_parsed,
+            )
+
+        logger.info(
+            "module_batch_validation_completed",
+            module_id=state.module_id,
+            questions_validated=len(state.generated_questions),
+            questions_parsed=questions_parsed,
+            questions_preserved=len(state.successful_questions_preserved),
+        )
+
     def check_error_type(self, state: ModuleBatchState) -> str:
         """Check what type of error we have and determine correction path."""
         # Check for JSON parsing errors first
@@ -583,18 +1168,141 @@ class ModuleBatchWorkflow:
         state.failed_questions_data = []
         state.failed_questions_errors = []
 
-        # Add exponential backoff
-        await asyncio.sleep(1 * state.retry_count)
+        delay = self._retry_delay(state.retry_count)
+        await asyncio.sleep(delay)
 
         logger.info(
             "module_batch_retry_generation_prepared",
             module_id=state.module_id,
             retry_count=state.retry_count,
+            retry_delay=delay,
             preserved_questions=len(state.successful_questions_preserved),
         )
 
         return state
 
+    def _retry_delay(self, retry_count: int) -> float:
+        """
+        Delay before a retry: full-jitter exponential backoff.
+
+        Any shared backoff requested by the provider for this model is waited
+        out first, and the jitter spreads out batches waking up together.
+        """
+        configuration = self.llm_provider.configuration
+        cap = min(
+            configuration.initial_retry_delay
+            * configuration.retry_backoff_factor ** max(retry_count - 1, 0),
+            configuration.max_retry_delay,
+        )
+        return self.llm_provider.backoff_remaining() + random.uniform(0, cap)
+
+    def retry_route(self, state: ModuleBatchState) -> str:
+        """Choose between a top-up request and a full regeneration."""
+        accepted = len(state.generated_questions) + len(
+            state.successful_questions_preserved
+        )
+        if settings.LLM_TOP_UP_RETRIES_ENABLED and accepted > 0:
+            return "top_up"
+        return "full"
+
+    async def prepare_top_up(self, state: ModuleBatchState) -> ModuleBatchState:
+        """
+        Prepare a prompt asking only for the questions still missing.
+
+        The prompt lists the stems of already accepted questions so the model
+        avoids duplicates. If the module was chunked, only the chunks that fell
+        furthest short are included instead of the full module content.
+        """
+        try:
+            missing = (
+                state.target_question_count
+                - len(state.generated_questions)
+                - len(state.successful_questions_preserved)
+            )
+            excerpt = self._top_up_excerpt(state)
+            messages, prompt_tokens, output_tokens = await self._build_prompt(
+                state, excerpt, missing
+            )
+            stems = self._accepted_stems(state)
+            accepted_list = "\n".join(f"- {stem}" for stem in stems)
+
+            state.system_prompt = messages[0].content
+            state.user_prompt = (
+                f"{messages[1].content}\n\n"
+                f"These questions have already been accepted for this module:\n"
+                f"{accepted_list}\n\n"
+                f"Generate exactly {missing} NEW questions. Do not repeat or "
+                f"closely paraphrase any of the accepted questions."
+            )
+            state.chunk_prompts = []
+            state.workflow_metadata["estimated_prompt_tokens"] = prompt_tokens
+            state.workflow_metadata["estimated_completion_tokens"] = output_tokens
+            state.workflow_metadata["top_up_requests"] = (
+                state.workflow_metadata.get("top_up_requests", 0) + 1
+            )
+
+            logger.info(
+                "module_batch_top_up_prepared",
+                module_id=state.module_id,
+                missing_questions=missing,
+                accepted_stems=len(stems),
+                excerpt_length=len(excerpt),
+                module_content_length=len(state.module_content),
+            )
+
+        except Exception as e:
+            logger.error(
+                "module_batch_top_up_preparation_failed",
+                module_id=state.module_id,
+                error=str(e),
+                exc_info=True,
+            )
+            state.error_message = f"Failed to prepare top-up: {str(e)}"
+
+        return state
+
+    def _top_up_excerpt(self, state: ModuleBatchState) -> str:
+        """Content for a top-up prompt, favouring chunks that fell short."""
+        if not state.content_chunks:
+            return state.module_content
+
+        ranked = sorted(
+            state.content_chunks,
+            key=lambda chunk: (
+                chunk["question_count"] - chunk["questions_returned"],
+                len(chunk["content"]),
+            ),
+            reverse=True,
+        )
+        parts: list[str] = []
+        size = 0
+        for chunk in ranked:
+            if (
+                parts
+                and size + len(chunk["content"]) > settings.CONTENT_CHUNK_MAX_CHARS
+            ):
+                break
+            parts.append(chunk["content"])
+            size += len(chunk["content"])
+        return "\n\n".join(parts)
+
+    def _accepted_stems(self, state: ModuleBatchState) -> list[str]:
+        """Question texts of the questions accepted so far, shortened."""
+        stems = []
+        for question in [
+            *state.successful_questions_preserved,
+            *state.generated_questions,
+        ]:
+            question_data = getattr(question, "question_data", None)
+            text = (
+                question_data.get("question_text")
+                if isinstance(question_data, dict)
+                else None
+            )
+            if isinstance(text, str) and text.strip():
+                stems.append(" ".join(text.split())[:TOP_UP_STEM_MAX_CHARS])
+        return stems[-TOP_UP_MAX_STEMS:]
+
     async def save_questions(self, state: ModuleBatchState) -> ModuleBatchState:
         """Save questions with proper truncation for over-generation."""
         # Combine preserved successful questions with newly generated ones
@@ -606,19 +1314,22 @@ class ModuleBatchWorkflow:
         # Truncate if we have too many questions
         if len(all_questions) > state.target_question_count:
             excess_count = len(all_questions) - state.target_question_count
+
+            # Keep the best candidates rather than the first N
+            all_questions, dropped = select_best_questions(
+                all_questions, state.target_question_count
+            )
+
             logger.info(
                 "module_batch_truncating_excess_questions",
                 module_id=state.module_id,
                 initial_questions=initial_count,
                 target_questions=state.target_question_count,
                 excess_questions=excess_count,
+                dropped_scores=[round(scored.score, 2) for scored in dropped],
+                dropped_warnings=[scored.warnings for scored in dropped],
             )
-
-            # Truncate to exact target count (keep first N questions)
-            # We use first-N strategy for deterministic behavior and simplicity.
-            # Alternative approaches (random selection, quality-based) would require
-            # additional complexity and metadata that isn't currently available.
-            all_questions = all_questions[: state.target_question_count]
+            self._forget_questions(scored.question for scored in dropped)
 
         # Calculate success rate after truncation
         total_questions = len(all_questions)
@@ -654,12 +1365,9 @@ class ModuleBatchWorkflow:
 
         try:
             async with get_async_session() as session:
-                # Add all questions to session
-                for question in all_questions:
-                    session.add(question)
-
-                # Commit all questions
+                await bulk_insert_questions(session, all_questions)
                 await session.commit()
+                state.saved_questions = all_questions
 
                 logger.info(
                     "module_batch_questions_saved",
@@ -681,12 +1389,22 @@ class ModuleBatchWorkflow:
 
         return state
 
-    def _parse_batch_response(self, response: str) -> list[dict[str, Any]]:
+    async def _discard_last_cached_response(self, state: ModuleBatchState) -> None:
+        """Invalidate the cached copy of a response that was rejected."""
+        cache_keys = state.workflow_metadata.get("response_cache_keys")
+        if cache_keys:
+            await discard_cached_responses(cache_keys[-1:])
+
+    def _parse_batch_response(
+        self, response: str, state: ModuleBatchState | None = None
+    ) -> list[dict[str, Any]]:
         """
         Parse the LLM response to extract multiple questions.
 
-        IMPORTANT: This method ONLY accepts valid JSON arrays.
-        No fallbacks to text parsing to ensure reliability.
+        IMPORTANT: This method ONLY accepts JSON arrays. Malformed JSON goes
+        through deterministic local repair before it is rejected, so the LLM
+        correction round trip is only spent on responses that cannot be
+        recovered mechanically.
         """
         try:
             # Clean the response - remove any markdown code blocks if present
@@ -701,6 +1419,12 @@ class ModuleBatchWorkflow:
             # Parse as JSON - this is the ONLY accepted format
             parsed = json.loads(cleaned_response)
 
+            if isinstance(parsed, dict) and isinstance(
+                parsed.get(RESPONSE_ARRAY_KEY), list
+            ):
+                # Structured output wraps the array and sends omitted fields as null
+                parsed = drop_nulls(parsed[RESPONSE_ARRAY_KEY])
+
             # Validate it's an array
             if not isinstance(parsed, list):
                 raise ValueError("Response must be a JSON array")
@@ -708,6 +1432,22 @@ class ModuleBatchWorkflow:
             return parsed
 
         except json.JSONDecodeError as e:
+            repaired = repair_json_array(response)
+            if repaired is not None:
+                if state is not None:
+                    state.workflow_metadata["json_corrections_avoided"] = (
+                        state.workflow_metadata.get("json_corrections_avoided", 0) + 1
+                    )
+                logger.info(
+                    "module_batch_json_repaired",
+                    module_id=state.module_id if state else None,
+                    strategy=repaired.strategy,
+                    questions_recovered=len(repaired.data),
+                    dropped_elements=repaired.dropped_elements,
+                    error=str(e),
+                )
+                return repaired.data
+
             logger.error(
                 "module_batch_json_decode_error",
                 error=str(e),
@@ -722,6 +1462,89 @@ class ModuleBatchWorkflow:
             )
             raise
 
+    async def generate_packed_responses(
+        self,
+        quiz_id: UUID,
+        members: list[PackMember],
+        question_type: QuestionType,
+        difficulty: QuestionDifficulty | None = None,
+    ) -> dict[str, str]:
+        """
+        Generate the first response for several small modules in one LLM call.
+
+        Every module gets a labelled section of the prompt and the response
+        objects carry the id of their module. The per-module JSON arrays are
+        then validated, retried and saved by each module's own batch.
+
+        Args:
+            quiz_id: Quiz identifier
+            members: Module batches sharing the request
+            question_type: Question type of all members
+            difficulty: Difficulty of all members
+
+        Returns:
+            Mapping of module ID to its JSON question array, empty on failure
+            so that members fall back to generating on their own
+        """
+        total_questions = sum(member.question_count for member in members)
+        state = ModuleBatchState(
+            quiz_id=quiz_id,
+            module_id="+".join(member.module_id for member in members),
+            module_name=", ".join(member.module_name for member in members),
+            module_content=build_packed_content(members),
+            target_question_count=total_questions,
+            language=self.language,
+            question_type=question_type,
+            difficulty=difficulty,
+            tone=self.tone,
+            llm_provider=self.llm_provider,
+            template_manager=self.template_manager,
+        )
+
+        try:
+            messages, _, _ = await self._build_prompt(
+                state, state.module_content, total_questions
+            )
+            messages[-1] = LLMMessage(
+                role=messages[-1].role,
+                content=messages[-1].content + packing_instructions(members),
+            )
+
+            response = await self.llm_provider.generate_with_retry(
+                messages, tenant=str(quiz_id)
+            )
+            split = split_packed_response(
+                self._parse_batch_response(response.content), members
+            )
+        except Exception as e:
+            logger.warning(
+                "module_batch_packed_generation_failed",
+                quiz_id=str(quiz_id),
+                module_ids=[member.module_id for member in members],
+                error=str(e),
+            )
+            return {}
+
+        logger.info(
+            "module_batch_packed_generation_completed",
+            quiz_id=str(quiz_id),
+            modules=len(members),
+            questions_requested=total_questions,
+            questions_per_module={
+                module_id: len(questions) for module_id, questions in split.items()
+            },
+            total_tokens=response.total_tokens,
+        )
+        return {
+            module_id: json.dumps(questions) for module_id, questions in split.items()
+        }
+
+    def _forget_questions(self, questions: Iterable[Question]) -> None:
+        """Remove questions that will not be saved from the dedup index."""
+        if self.dedup_index is not None:
+            for question in questions:
+                self.dedup_index.discard(question)
+
     async def process_module(
         self,
         quiz_id: UUID,
@@ -731,8 +1554,9 @@ class ModuleBatchWorkflow:
         question_count: int,
         question_type: QuestionType,  # Now passed as parameter
         difficulty: QuestionDifficulty | None = None,  # Difficulty for this batch
+        packed_response: str | None = None,
     ) -> list[Question]:
-        """Process a single module to generate questions."""
+        """Process a single module and return the questions it saved."""
         initial_state = ModuleBatchState(
             quiz_id=quiz_id,
             module_id=module_id,
@@ -745,6 +1569,7 @@ class ModuleBatchWorkflow:
             tone=self.tone,
             llm_provider=self.llm_provider,
             template_manager=self.template_manager,
+            packed_response=packed_response,
         )
 
         logger.info(
@@ -756,10 +1581,21 @@ class ModuleBatchWorkflow:
         )
 
         try:
-            final_state_dict = await self.graph.ainvoke(initial_state)
+            result = await self.graph.ainvoke(
+                {"batch": initial_state}, config={"configurable": {"workflow": self}}
+            )
+            final_state: ModuleBatchState = result["batch"]
 
-            # Convert dict result back to ModuleBatchState for type safety
-            final_state = ModuleBatchState(**final_state_dict)
+            # A failed batch must not replay its cached responses on regeneration
+            if final_state.error_message:
+                await discard_cached_responses(
+                    final_state.workflow_metadata.get("response_cache_keys", [])
+                )
+                # Unsaved questions must not block paraphrases in other batches
+                self._forget_questions(
+                    final_state.successful_questions_preserved
+                    + final_state.generated_questions
+                )
 
             # Calculate total questions (preserved + newly generated)
             total_questions = len(final_state.successful_questions_preserved) + len(
@@ -772,16 +1608,14 @@ class ModuleBatchWorkflow:
                 questions_generated=total_questions,
                 questions_preserved=len(final_state.successful_questions_preserved),
                 questions_newly_generated=len(final_state.generated_questions),
+                questions_saved=len(final_state.saved_questions),
                 target_questions=question_count,
                 success=final_state.error_message is None,
             )
 
-            # Return all questions (preserved + newly generated)
-            all_questions = (
-                final_state.successful_questions_preserved
-                + final_state.generated_questions
-            )
-            return list(all_questions)
+            # Return only the saved questions; unsaved and dropped spares are
+            # not part of the quiz
+            return list(final_state.saved_questions)
 
         except Exception as e:
             logger.error(
@@ -812,10 +1646,18 @@ class ParallelModuleProcessor:
         self,
         quiz_id: UUID,
         modules_data: dict[str, dict[str, Any]],
+        on_batch_complete: BatchCompleteCallback | None = None,
     ) -> tuple[dict[str, list[Question]], dict[str, list[str]]]:
         """
         Process all modules with their batches in parallel.
 
+        Batches run through a ``BatchScheduler`` in order of expected cost,
+        at most ``MAX_CONCURRENT_MODULES`` at a time. With the Batch API
+        provider all batches start at once, so their prompts are collected
+        into one batch job. Generation can be
+        cancelled with ``cancel_quiz_generation``; batches that did not finish
+        are reported as failed.
+
         Args:
             quiz_id: The quiz identifier
             modules_data: Dictionary with module data including batches:
@@ -829,13 +1671,34 @@ class ParallelModuleProcessor:
                         ]
                     }
                 }
+            on_batch_complete: Awaited with (batch_key, questions, metadata)
+                as soon as each batch finishes
 
         Returns:
             Dictionary mapping module IDs to lists of generated questions
         """
-        # Create tasks for all batches across all modules
-        tasks = []
-        batch_info_map = {}  # Track which task belongs to which module/batch
+        from ..config import get_configuration_service
+
+        # One dedup index per quiz, seeded with questions saved by earlier runs
+        dedup_index = None
+        if get_configuration_service().get_config().enable_duplicate_detection:
+            dedup_index = await load_quiz_dedup_index(quiz_id)
+
+        # Batches of small modules share one request for their first attempt,
+        # started by whichever member the scheduler runs first
+        pack_tasks: list[asyncio.Task[dict[str, str]]] = []
+        packed_calls: dict[int, Callable[[], asyncio.Task[dict[str, str]]]] = {}
+        for pack in plan_module_packs(
+            modules_data,
+            settings.MODULE_PACKING_MAX_CHARS,
+            settings.MODULE_PACKING_MAX_MODULES,
+        ):
+            packed_call = self._shared_pack_call(quiz_id, pack, pack_tasks)
+            for member in pack:
+                packed_calls[id(member.batch)] = packed_call
+
+        scheduled_batches = []
+        batch_info_map = {}  # Track which scheduled batch belongs to which module
 
         for module_id, module_info in modules_data.items():
             module_name = module_info["name"]
@@ -853,50 +1716,44 @@ class ParallelModuleProcessor:
                     template_manager=self.template_manager,
                     language=self.language,
                     tone=self.tone,
+                    dedup_index=dedup_index,
                 )
 
-                # Create task for this batch
-                task = asyncio.create_task(
-                    self._process_single_batch(
-                        workflow,
-                        module_id,
-                        module_name,
-                        module_content,
-                        quiz_id,
-                        count,
-                        question_type,
-                        difficulty,
-                        batch_key,
+                scheduled_batches.append(
+                    ScheduledBatch(
+                        key=batch_key,
+                        cost=estimate_batch_cost(
+                            question_type, count, len(module_content)
+                        ),
+                        run=partial(
+                            self._process_single_batch,
+                            workflow,
+                            module_id,
+                            module_name,
+                            module_content,
+                            quiz_id,
+                            count,
+                            question_type,
+                            difficulty,
+                            batch_key,
+                            packed_call=packed_calls.get(id(batch)),
+                        ),
                     )
                 )
-
-                tasks.append(task)
-                batch_info_map[id(task)] = {
+                batch_info_map[batch_key] = {
                     "module_id": module_id,
                     "batch_key": batch_key,
                     "question_type": question_type,
                 }
 
-        # Execute all batch tasks in parallel
-        logger.info(
-            "parallel_batch_processing_started",
-            quiz_id=str(quiz_id),
-            total_batches=len(tasks),
-            modules_count=len(modules_data),
-        )
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results and organize by module
         final_results: dict[str, list[Question]] = {}
-        successful_batches = []
-        failed_batches = []
+        successful_batches: list[str] = []
+        failed_batches: list[str] = []
 
-        for task_idx, result in enumerate(results):
-            task = tasks[task_idx]
-            batch_info = batch_info_map[id(task)]
-            module_id = batch_info["module_id"]
-            batch_key = batch_info["batch_key"]
+        async def record_batch(scheduled: ScheduledBatch, result: Any) -> None:
+            """Account for a batch as soon as it finishes."""
+            module_id = batch_info_map[scheduled.key]["module_id"]
+            batch_key = scheduled.key
 
             if isinstance(result, BaseException):
                 logger.error(
@@ -907,39 +1764,71 @@ class ParallelModuleProcessor:
                     error=str(result),
                 )
                 failed_batches.append(batch_key)
+                return
+
+            questions, metadata = result
+
+            # Add questions from this batch
+            final_results.setdefault(module_id, []).extend(questions)
+
+            # Check if batch was successful based on metadata
+            if metadata.get("success", False):
+                successful_batches.append(batch_key)
+                logger.info(
+                    "parallel_batch_processing_batch_completed",
+                    quiz_id=str(quiz_id),
+                    module_id=module_id,
+                    batch_key=batch_key,
+                    questions_generated=len(questions),
+                )
             else:
-                questions, metadata = result
-
-                # Initialize module results if needed
-                if module_id not in final_results:
-                    final_results[module_id] = []
-
-                # Add questions from this batch
-                final_results[module_id].extend(questions)
-
-                # Check if batch was successful based on metadata
-                batch_success = metadata.get("success", False)
-
-                if batch_success:
-                    successful_batches.append(batch_key)
-                    logger.info(
-                        "parallel_batch_processing_batch_completed",
-                        quiz_id=str(quiz_id),
-                        module_id=module_id,
-                        batch_key=batch_key,
-                        questions_generated=len(questions),
-                    )
-                else:
-                    failed_batches.append(batch_key)
-                    logger.warning(
-                        "parallel_batch_processing_batch_failed_partial",
-                        quiz_id=str(quiz_id),
-                        module_id=module_id,
-                        batch_key=batch_key,
-                        questions_generated=len(questions),
-                        target_count=metadata.get("target_count", 0),
-                        reason="Batch did not meet target question count",
-                    )
+                failed_batches.append(batch_key)
+                logger.warning(
+                    "parallel_batch_processing_batch_failed_partial",
+                    quiz_id=str(quiz_id),
+                    module_id=module_id,
+                    batch_key=batch_key,
+                    questions_generated=len(questions),
+                    target_count=metadata.get("target_count", 0),
+                    reason="Batch did not meet target question count",
+                )
+
+            if on_batch_complete is not None:
+                await on_batch_complete(batch_key, questions, metadata)
+
+        # Capping batch mode would split the quiz into one Batch API job per
+        # wave, each of which can take up to the completion window
+        if self.llm_provider.provider_name == LLMProvider.OPENAI_BATCH:
+            max_concurrency = len(scheduled_batches)
+        else:
+            max_concurrency = settings.MAX_CONCURRENT_MODULES
+
+        scheduler = BatchScheduler(
+            max_concurrency=max_concurrency,
+            order=settings.BATCH_SCHEDULING_ORDER,
+        )
+
+        logger.info(
+            "parallel_batch_processing_started",
+            quiz_id=str(quiz_id),
+            total_batches=len(scheduled_batches),
+            modules_count=len(modules_data),
+            max_concurrency=scheduler.max_concurrency,
+            scheduling_order=scheduler.order,
+        )
+
+        register_quiz_scheduler(quiz_id, scheduler)
+        try:
+            results = await scheduler.run(scheduled_batches, on_complete=record_batch)
+        finally:
+            unregister_quiz_scheduler(quiz_id, scheduler)
+            for pack_task in pack_tasks:
+                pack_task.cancel()
+
+        # Batches that never ran because generation was cancelled
+        for scheduled, result in zip(scheduled_batches, results, strict=True):
+            if isinstance(result, asyncio.CancelledError):
+                failed_batches.append(scheduled.key)
 
         # Note: Metadata update moved to orchestrator's transaction context
         # to ensure atomicity with quiz status updates
@@ -950,6 +1839,7 @@ class ParallelModuleProcessor:
             successful_batches=len(successful_batches),
             failed_batches=len(failed_batches),
             total_questions=sum(len(q) for q in final_results.values()),
+            cancelled=scheduler.cancelled,
         )
 
         # Return results with batch tracking information
@@ -958,6 +1848,37 @@ class ParallelModuleProcessor:
             "failed_batches": failed_batches,
         }
 
+    def _shared_pack_call(
+        self,
+        quiz_id: UUID,
+        pack: list[PackMember],
+        pack_tasks: list[asyncio.Task[dict[str, str]]],
+    ) -> Callable[[], asyncio.Task[dict[str, str]]]:
+        """Start a pack's request on first use and share it with its members."""
+        task: asyncio.Task[dict[str, str]] | None = None
+
+        def start() -> asyncio.Task[dict[str, str]]:
+            nonlocal task
+            if task is None:
+                workflow = ModuleBatchWorkflow(
+                    llm_provider=self.llm_provider,
+                    template_manager=self.template_manager,
+                    language=self.language,
+                    tone=self.tone,
+                )
+                task = asyncio.create_task(
+                    workflow.generate_packed_responses(
+                        quiz_id,
+                        pack,
+                        pack[0].batch["question_type"],
+                        pack[0].batch["difficulty"],
+                    )
+                )
+                pack_tasks.append(task)
+            return task
+
+        return start
+
     async def _process_single_batch(
         self,
         workflow: ModuleBatchWorkflow,
@@ -969,10 +1890,15 @@ class ParallelModuleProcessor:
         question_type: QuestionType,
         difficulty: QuestionDifficulty,
         batch_key: str,
+        packed_call: Callable[[], asyncio.Task[dict[str, str]]] | None = None,
     ) -> tuple[list[Question], dict[str, Any]]:
         """
         Process a single batch for a module.
 
+        Args:
+            packed_call: Starts or joins the packed request answering this
+                batch's first attempt
+
         Returns:
             Tuple of (questions, metadata)
         """
@@ -986,6 +1912,10 @@ class ParallelModuleProcessor:
                 target_count=target_count,
             )
 
+            packed_response = None
+            if packed_call is not None:
+                packed_response = (await packed_call()).get(module_id)
+
             questions = await workflow.process_module(
                 module_id=module_id,
                 module_name=module_name,
@@ -994,14 +1924,17 @@ class ParallelModuleProcessor:
                 question_count=target_count,
                 question_type=question_type,
                 difficulty=difficulty,
+                packed_response=packed_response,
             )
 
-            # Determine if batch was successful based on question count vs target
+            # Only saved questions are returned, so a batch whose save failed
+            # has none and counts as failed
             success = len(questions) >= target_count
 
             metadata = {
                 "batch_key": batch_key,
                 "questions_generated": len(questions),
+                "questions_saved": len(questions),
                 "target_count": target_count,
                 "question_type": question_type.value,
                 "success": success,
@@ -0,0 +1,126 @@
+"""Packing of small module batches into a single generation request."""
+
+from dataclasses import dataclass
+from typing import Any
+
+PACKED_MODULE_HEADER = "[MODULE {module_id}] {module_name}"
+
+PACKING_INSTRUCTIONS = (
+    "\n\nThe module content above contains {module_count} separate modules, each "
+    "starting with a [MODULE <id>] header. Write each question only from the "
+    "section of its own module and generate exactly:\n"
+    "{allocation}\n\n"
+    'Add a "module_id" field to every question object containing the id from '
+    "the header of its module. Return all {total} questions in one JSON array."
+)
+
+
+@dataclass
+class PackMember:
+    """One module batch taking part in a packed request."""
+
+    module_id: str
+    module_name: str
+    module_content: str
+    question_count: int
+    batch: dict[str, Any]
+
+
+def plan_module_packs(
+    modules_data: dict[str, dict[str, Any]],
+    max_module_chars: int,
+    max_modules: int,
+) -> list[list[PackMember]]:
+    """
+    Group the batches of small modules that can share one request.
+
+    Only batches with the same question type and difficulty are packed, and
+    every pack covers distinct modules so responses can be keyed by module id.
+
+    Args:
+        modules_data: Module data with batches, as passed to the processor
+        max_module_chars: Modules with longer content are never packed
+        max_modules: Maximum number of modules per pack
+
+    Returns:
+        Packs of at least two members; unlisted batches run on their own
+    """
+    if max_module_chars <= 0 or max_modules < 2:
+        return []
+
+    groups: dict[tuple[Any, Any], list[list[PackMember]]] = {}
+    for module_id, module_info in modules_data.items():
+        content = module_info["content"]
+        if not content or len(content) > max_module_chars:
+            continue
+
+        for batch in module_info["batches"]:
+            packs = groups.setdefault(
+                (batch["question_type"], batch["difficulty"]), [[]]
+            )
+            member = PackMember(
+                module_id=module_id,
+                module_name=module_info["name"],
+                module_content=content,
+                question_count=batch["count"],
+                batch=batch,
+            )
+            # A module with two batches of one kind goes to the next open pack
+            pack = next(
+                (
+                    pack
+                    for pack in packs
+                    if len(pack) < max_modules
+                    and all(other.module_id != module_id for other in pack)
+                ),
+                None,
+            )
+            if pack is None:
+                pack = []
+                packs.append(pack)
+            pack.append(member)
+
+    return [pack for packs in groups.values() for pack in packs if len(pack) > 1]
+
+
+def build_packed_content(members: list[PackMember]) -> str:
+    """Concatenate the members' content under labelled module headers."""
+    return "\n\n".join(
+        PACKED_MODULE_HEADER.format(
+            module_id=member.module_id, module_name=member.module_name
+        )
+        + f"\n{member.module_content}"
+        for member in members
+    )
+
+
+def packing_instructions(members: list[PackMember]) -> str:
+    """Per-module question counts and the keyed response format."""
+    allocation = "\n".join(
+        f"- {member.question_count} questions for module {member.module_id}"
+        for member in members
+    )
+    return PACKING_INSTRUCTIONS.format(
+        module_count=len(members),
+        allocation=allocation,
+        total=sum(member.question_count for member in members),
+    )
+
+
+def split_packed_response(
+    questions_data: list[dict[str, Any]], members: list[PackMember]
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    Demultiplex a packed response into per-module question lists.
+
+    Questions without a known ``module_id`` are dropped; the affected batches
+    top up the shortfall through their normal retry path.
+    """
+    split: dict[str, list[dict[str, Any]]] = {
+        member.module_id: [] for member in members
+    }
+    for question_data in questions_data:
+        module_id = str(question_data.pop("module_id", ""))
+        if module_id in split:
+            split[module_id].append(question_data)
+    return split
@@ -0,0 +1,86 @@
+"""Context-window budgeting for question generation prompts."""
+
+from dataclasses import dataclass
+
+from ..providers.tokens import TokenCounter
+from ..types import QuestionType
+from ..utils import truncate_at_boundary
+
+# Typical completion tokens for one generated question in the JSON output
+OUTPUT_TOKENS_PER_QUESTION: dict[QuestionType, int] = {
+    QuestionType.MULTIPLE_CHOICE: 200,
+    QuestionType.TRUE_FALSE: 120,
+    QuestionType.FILL_IN_BLANK: 180,
+    QuestionType.MATCHING: 400,
+    QuestionType.CATEGORIZATION: 450,
+}
+DEFAULT_OUTPUT_TOKENS_PER_QUESTION = 250
+
+# Array framing, code fences and slack for verbose explanations
+OUTPUT_OVERHEAD_TOKENS = 200
+
+# Left unused to absorb tokenizer estimation error
+SAFETY_MARGIN_TOKENS = 256
+
+
+def estimate_output_tokens(question_type: QuestionType, question_count: int) -> int:
+    """
+    Estimate completion tokens needed for a batch of questions.
+
+    Args:
+        question_type: Type of the questions generated
+        question_count: Number of questions requested
+
+    Returns:
+        Expected completion tokens, including output framing
+    """
+    per_question = OUTPUT_TOKENS_PER_QUESTION.get(
+        question_type, DEFAULT_OUTPUT_TOKENS_PER_QUESTION
+    )
+    return max(question_count, 0) * per_question + OUTPUT_OVERHEAD_TOKENS
+
+
+class PromptBudgetError(ValueError):
+    """Raised when a prompt's fixed parts leave no room for module content."""
+
+
+@dataclass(frozen=True)
+class PromptBudget:
+    """Token budget for one request against a model's context window."""
+
+    context_window: int
+    output_tokens: int
+
+    @property
+    def max_prompt_tokens(self) -> int:
+        """Prompt tokens available once the output headroom is reserved."""
+        return max(0, self.context_window - self.output_tokens - SAFETY_MARGIN_TOKENS)
+
+    def overflow(self, prompt_tokens: int) -> int:
+        """Tokens by which a prompt exceeds the budget (0 if it fits)."""
+        return max(0, prompt_tokens - self.max_prompt_tokens)
+
+
+def trim_to_tokens(counter: TokenCounter, text: str, max_tokens: int) -> str:
+    """
+    Trim text to fit in ``max_tokens``, cutting at a natural boundary.
+
+    Args:
+        counter: Token counter for the target model
+        text: Text to trim
+        max_tokens: Token limit for the result
+
+    Returns:
+        The text itself if it fits, otherwise a trimmed prefix
+
+    Raises:
+        PromptBudgetError: If ``max_tokens`` leaves no room for any text
+    """
+    if max_tokens <= 0:
+        raise PromptBudgetError(
+            f"No room for module content in the prompt ({max_tokens} tokens left)"
+        )
+    prefix = counter.truncate(text, max_tokens)
+    if len(prefix) == len(text):
+        return text
+    return truncate_at_boundary(text, len(prefix))
@@ -0,0 +1,155 @@
+"""Cheap quality scoring and selection of generated question candidates."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..types import Question, QuestionType
+
+# Stems outside this range are usually truncated or overloaded
+MIN_STEM_CHARS = 20
+MAX_STEM_CHARS = 400
+
+# Score lost per warning
+WARNING_PENALTY = 0.2
+
+# Stems at least this similar to a kept question count as near-duplicates
+DUPLICATE_SIMILARITY = 0.7
+DUPLICATE_PENALTY = 1.0
+
+_WORD = re.compile(r"\w+")
+_CATCH_ALL_OPTIONS = ("all of the above", "none of the above")
+
+
+@dataclass(eq=False)
+class ScoredQuestion:
+    """A question candidate with its standalone quality score."""
+
+    question: Question
+    index: int
+    score: float
+    warnings: list[str] = field(default_factory=list)
+    tokens: frozenset[str] = frozenset()
+
+
+def _normalize(text: Any) -> str:
+    return " ".join(str(text).lower().split())
+
+
+def _answer_options(question_type: QuestionType, data: dict[str, Any]) -> list[str]:
+    """The texts a student chooses between, for distinctness checks."""
+    if question_type == QuestionType.MULTIPLE_CHOICE:
+        return [data.get(f"option_{letter}", "") for letter in "abcd"]
+    if question_type == QuestionType.MATCHING:
+        answers = [pair.get("answer", "") for pair in data.get("pairs") or []]
+        return answers + list(data.get("distractors") or [])
+    if question_type == QuestionType.CATEGORIZATION:
+        items = [*(data.get("items") or []), *(data.get("distractors") or [])]
+        return [item.get("text", "") for item in items]
+    return []
+
+
+def question_warnings(question_type: QuestionType, data: dict[str, Any]) -> list[str]:
+    """
+    Heuristic warnings for a question that already passed validation.
+
+    Args:
+        question_type: Type of the question
+        data: Validated question data
+
+    Returns:
+        Warning codes, empty for a question with no detected issues
+    """
+    warnings = []
+    stem = _normalize(data.get("question_text", ""))
+
+    if len(stem) < MIN_STEM_CHARS:
+        warnings.append("stem_too_short")
+    elif len(stem) > MAX_STEM_CHARS:
+        warnings.append("stem_too_long")
+
+    if not _normalize(data.get("explanation") or ""):
+        warnings.append("missing_explanation")
+
+    options = [_normalize(option) for option in _answer_options(question_type, data)]
+    if len(set(options)) < len(options):
+        warnings.append("duplicate_options")
+    if any(option in _CATCH_ALL_OPTIONS for option in options):
+        warnings.append("catch_all_option")
+
+    if question_type == QuestionType.MULTIPLE_CHOICE:
+        correct = _normalize(
+            data.get(f"option_{str(data.get('correct_answer', '')).lower()}", "")
+        )
+        # A correct answer quoted in the stem gives the question away
+        if len(correct) > 3 and correct in stem:
+            warnings.append("answer_in_stem")
+
+    return warnings
+
+
+def stem_tokens(question: Question) -> frozenset[str]:
+    """Word set of a question's stem, for similarity comparisons."""
+    text = (question.question_data or {}).get("question_text", "")
+    return frozenset(_WORD.findall(str(text).lower()))
+
+
+def jaccard_similarity(first: frozenset[str], second: frozenset[str]) -> float:
+    """Jaccard similarity of two word sets."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def score_question(question: Question, index: int = 0) -> ScoredQuestion:
+    """Score a single candidate without regard to the others."""
+    warnings = question_warnings(question.question_type, question.question_data or {})
+    return ScoredQuestion(
+        question=question,
+        index=index,
+        score=1.0 - WARNING_PENALTY * len(warnings),
+        warnings=warnings,
+        tokens=stem_tokens(question),
+    )
+
+
+def select_best_questions(
+    questions: list[Question], keep: int
+) -> tuple[list[Question], list[ScoredQuestion]]:
+    """
+    Keep the ``keep`` best candidates.
+
+    Candidates are picked greedily by standalone score. A candidate whose stem
+    nearly duplicates an already kept question is penalised, so distinct
+    questions win over rephrasings. Ties keep generation order.
+
+    Args:
+        questions: Validated candidates
+        keep: Number of questions to keep
+
+    Returns:
+        Tuple of (kept questions in generation order, dropped candidates)
+    """
+    if len(questions) <= keep:
+        return list(questions), []
+
+    remaining = [
+        score_question(question, index) for index, question in enumerate(questions)
+    ]
+    kept: list[ScoredQuestion] = []
+
+    def rank(candidate: ScoredQuestion) -> tuple[float, int]:
+        similarity = max(
+            (jaccard_similarity(candidate.tokens, other.tokens) for other in kept),
+            default=0.0,
+        )
+        penalty = DUPLICATE_PENALTY if similarity >= DUPLICATE_SIMILARITY else 0.0
+        return candidate.score - penalty, -candidate.index
+
+    while remaining and len(kept) < keep:
+        best = max(remaining, key=rank)
+        remaining.remove(best)
+        kept.append(best)
+
+    kept.sort(key=lambda scored: scored.index)
+    return [scored.question for scored in kept], remaining
@@ -0,0 +1,205 @@
+"""Bounded, cost-ordered scheduling of the generation batches of a quiz."""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+from uuid import UUID
+
+from src.config import get_logger
+
+from ..types import QuestionType
+from .prompt_budget import estimate_output_tokens
+
+logger = get_logger("batch_scheduler")
+
+SchedulingOrder = Literal["longest_first", "shortest_first"]
+
+# Prompt tokens are processed far faster than completion tokens are decoded
+PROMPT_TOKEN_COST = 0.1
+CHARS_PER_TOKEN = 4
+
+
+def estimate_batch_cost(
+    question_type: QuestionType, question_count: int, content_length: int
+) -> float:
+    """
+    Expected relative processing time of a batch.
+
+    Args:
+        question_type: Question type of the batch
+        question_count: Number of questions to generate
+        content_length: Length of the module content in characters
+
+    Returns:
+        Cost in completion-token equivalents
+    """
+    prompt_tokens = content_length / CHARS_PER_TOKEN
+    return (
+        estimate_output_tokens(question_type, question_count)
+        + prompt_tokens * PROMPT_TOKEN_COST
+    )
+
+
+@dataclass
+class ScheduledBatch:
+    """A unit of work for the scheduler."""
+
+    key: str
+    cost: float
+    run: Callable[[], Awaitable[Any]]
+
+
+BatchCallback = Callable[[ScheduledBatch, Any], Awaitable[None]]
+
+
+class BatchScheduler:
+    """
+    Run batches with bounded parallelism in order of expected cost.
+
+    Longest-first keeps the slowest batches from starting last and
+    stretching the quiz's total time; shortest-first gets the first
+    questions to the user sooner. A scheduler can be cancelled from any
+    thread, e.g. when its quiz is deleted.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        order: SchedulingOrder = "longest_first",
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.order = order
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the scheduler was cancelled."""
+        return self._cancelled
+
+    async def run(
+        self,
+        batches: list[ScheduledBatch],
+        on_complete: BatchCallback | None = None,
+    ) -> list[Any]:
+        """
+        Run all batches and return their results.
+
+        A batch that raised, or did not run because the scheduler was
+        cancelled, has its exception as result. ``on_complete`` is awaited as
+        soon as each batch finishes; errors in it are logged, not raised.
+
+        Args:
+            batches: Batches to run
+            on_complete: Callback receiving each batch and its result
+
+        Returns:
+            Results in the order of ``batches``
+        """
+        queue = deque(
+            sorted(
+                enumerate(batches),
+                key=lambda item: item[1].cost,
+                reverse=self.order == "longest_first",
+            )
+        )
+        results: list[Any] = [asyncio.CancelledError() for _ in batches]
+
+        async def worker() -> None:
+            while queue and not self._cancelled:
+                index, batch = queue.popleft()
+                try:
+                    result = await batch.run()
+                except Exception as e:
+                    result = e
+                results[index] = result
+
+                if on_complete is not None:
+                    try:
+                        await on_complete(batch, result)
+                    except Exception as e:
+                        logger.error(
+                            "batch_scheduler_callback_failed",
+                            batch_key=batch.key,
+                            error=str(e),
+                            exc_info=True,
+                        )
+
+        self._loop = asyncio.get_running_loop()
+        self._workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrency, len(queue)))
+        ]
+        try:
+            # Worker cancellations are expected when the scheduler is cancelled
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        finally:
+            for task in self._workers:
+                task.cancel()
+            self._workers = []
+
+        if self._cancelled:
+            logger.warning(
+                "batch_scheduler_cancelled",
+                completed_batches=sum(
+                    not isinstance(result, BaseException) for result in results
+                ),
+                total_batches=len(batches),
+            )
+        return results
+
+    def cancel(self) -> None:
+        """Stop starting batches and cancel running ones; safe from any thread."""
+        self._cancelled = True
+        if self._loop is None or self._loop.is_closed():
+            return
+
+        def cancel_workers() -> None:
+            for task in self._workers:
+                task.cancel()
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            cancel_workers()
+        else:
+            self._loop.call_soon_threadsafe(cancel_workers)
+
+
+_active_schedulers: dict[UUID, BatchScheduler] = {}
+
+
+def register_quiz_scheduler(quiz_id: UUID, scheduler: BatchScheduler) -> None:
+    """Make a quiz's running scheduler reachable for cancellation."""
+    _active_schedulers[quiz_id] = scheduler
+
+
+def unregister_quiz_scheduler(quiz_id: UUID, scheduler: BatchScheduler) -> None:
+    """Forget a finished scheduler."""
+    if _active_schedulers.get(quiz_id) is scheduler:
+        del _active_schedulers[quiz_id]
+
+
+def cancel_quiz_generation(quiz_id: UUID) -> bool:
+    """
+    Cancel the running question generation of a quiz.
+
+    Args:
+        quiz_id: Quiz identifier
+
+    Returns:
+        True if a running generation was cancelled
+    """
+    scheduler = _active_schedulers.pop(quiz_id, None)
+    if scheduler is None:
+        return False
+
+    scheduler.cancel()
+    logger.info("quiz_generation_cancelled", quiz_id=str(quiz_id))
+    return True
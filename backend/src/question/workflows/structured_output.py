@@ -0,0 +1,128 @@
+"""JSON schemas constraining generation responses to the question data models."""
+
+from functools import cache
+from typing import Any
+
+from ..types import QuestionType
+
+# Structured output requires an object at the root, so the array is wrapped
+RESPONSE_ARRAY_KEY = "questions"
+
+# Keywords strict structured output accepts; the data models still enforce
+# everything else (string lengths, cross-field rules) during validation
+_SUPPORTED_KEYWORDS = frozenset(
+    {
+        "type",
+        "description",
+        "properties",
+        "required",
+        "additionalProperties",
+        "items",
+        "anyOf",
+        "enum",
+        "const",
+        "$ref",
+        "$defs",
+        "pattern",
+        "minItems",
+        "maxItems",
+        "minimum",
+        "maximum",
+    }
+)
+
+
+def _is_nullable(schema: dict[str, Any]) -> bool:
+    return schema.get("type") == "null" or any(
+        option.get("type") == "null" for option in schema.get("anyOf", [])
+    )
+
+
+def strict_json_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a Pydantic JSON schema to the strict structured-output subset.
+
+    Every object property becomes required and closed to extra keys. Optional
+    properties are made nullable instead, so an omitted value comes back as
+    null.
+
+    Args:
+        schema: JSON schema as produced by ``model_json_schema()``
+
+    Returns:
+        Schema using only keywords supported by strict structured output
+    """
+    strict: dict[str, Any] = {}
+    for keyword, value in schema.items():
+        if keyword not in _SUPPORTED_KEYWORDS:
+            continue
+        if keyword in ("properties", "$defs"):
+            strict[keyword] = {
+                name: strict_json_schema(subschema) for name, subschema in value.items()
+            }
+        elif keyword == "items":
+            strict[keyword] = strict_json_schema(value)
+        elif keyword == "anyOf":
+            strict[keyword] = [strict_json_schema(option) for option in value]
+        else:
+            strict[keyword] = value
+
+    if "$ref" in strict:
+        # Referenced definitions carry their own annotations
+        return {"$ref": strict["$ref"]}
+
+    if "properties" in strict:
+        required = set(schema.get("required", []))
+        for name, subschema in strict["properties"].items():
+            if name not in required and not _is_nullable(subschema):
+                strict["properties"][name] = {"anyOf": [subschema, {"type": "null"}]}
+        strict["required"] = list(strict["properties"])
+        strict["additionalProperties"] = False
+
+    return strict
+
+
+@cache
+def question_batch_schema(question_type: QuestionType) -> dict[str, Any]:
+    """
+    Response schema for a batch of questions of one type.
+
+    Derived from the question type's data model, so prompts and validation
+    cannot drift apart. The result is cached and must not be modified.
+
+    Args:
+        question_type: Question type of the batch
+
+    Returns:
+        Strict JSON schema of ``{"questions": [<question data>, ...]}``
+    """
+    from ..types.registry import get_question_type_registry
+
+    data_model = (
+        get_question_type_registry().get_question_type(question_type).data_model
+    )
+    item_schema = strict_json_schema(data_model.model_json_schema())
+    definitions = item_schema.pop("$defs", {})
+
+    schema: dict[str, Any] = {
+        "title": f"{question_type.value}_batch",
+        "type": "object",
+        "properties": {RESPONSE_ARRAY_KEY: {"type": "array", "items": item_schema}},
+        "required": [RESPONSE_ARRAY_KEY],
+        "additionalProperties": False,
+    }
+    if definitions:
+        # References in the item schema resolve against the root
+        schema["$defs"] = definitions
+    return schema
+
+
+def drop_nulls(value: Any) -> Any:
+    """Remove null object members, which strict responses use for omitted fields."""
+    if isinstance(value, dict):
+        return {
+            key: drop_nulls(item) for key, item in value.items() if item is not None
+        }
+    if isinstance(value, list):
+        return [drop_nulls(item) for item in value]
+    return value
@@ -50,6 +50,7 @@ TRANSACTION_RETRIES = 3
 OPERATION_TIMEOUTS = {
     "content_extraction": 900,  # 15 minutes timeout for content extraction
     "question_generation": 1800,  # 30 minutes timeout for question generation
+    "batch_question_generation": 90000,  # 25 hours for Batch API generation
     "canvas_export": 600,  # 10 minutes timeout for Canvas export
 }
 
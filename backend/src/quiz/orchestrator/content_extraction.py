@@ -185,7 +185,6 @@ async def _execute_content_extraction_workflow(
         return None, "failed", selected_modules
 
 
-@timeout_operation(OPERATION_TIMEOUTS["content_extraction"])
 async def orchestrate_content_extraction(
     quiz_id: UUID,
     canvas_course_id: int,
@@ -207,6 +206,30 @@ async def orchestrate_content_extraction(
         content_extractor: Function to extract content from Canvas
         content_summarizer: Function to generate content summary
     """
+    quiz_settings = await _extract_and_save_content(
+        quiz_id, canvas_course_id, canvas_token, content_extractor, content_summarizer
+    )
+
+    # Generation runs under its own timeout, which grows in batch mode
+    if quiz_settings:
+        await _auto_trigger_question_generation(quiz_id, quiz_settings)
+
+
+@timeout_operation(OPERATION_TIMEOUTS["content_extraction"])
+async def _extract_and_save_content(
+    quiz_id: UUID,
+    canvas_course_id: int,
+    canvas_token: str,
+    content_extractor: ContentExtractorFunc,
+    content_summarizer: ContentSummaryFunc,
+) -> dict[str, Any] | None:
+    """
+    Reserve the extraction job, extract the content and save the result.
+
+    Returns:
+        The quiz settings if extraction completed and generation should start,
+        otherwise None
+    """
     logger.info(
         "content_extraction_orchestration_started",
         quiz_id=str(quiz_id),
@@ -235,7 +258,7 @@ async def orchestrate_content_extraction(
             quiz_id=str(quiz_id),
             reason="job_already_running_or_complete",
         )
-        return
+        return None
 
     # Get selected_modules from quiz settings
     selected_modules = quiz_settings.get("selected_modules", {})
@@ -305,43 +328,51 @@ async def orchestrate_content_extraction(
         retries=3,
     )
 
-    # If extraction was successful, trigger question generation
-    if final_status == "completed" and quiz_settings:
+    # If extraction was successful, hand the settings on to question generation
+    if final_status == "completed":
+        return quiz_settings
+    if final_status == "no_content":
         logger.info(
-            "auto_triggering_question_generation",
+            "skipping_question_generation_no_content",
             quiz_id=str(quiz_id),
-            target_questions=quiz_settings["target_questions"],
+            reason="no_meaningful_content_extracted",
+        )
+    return None
+
+
+async def _auto_trigger_question_generation(
+    quiz_id: UUID, quiz_settings: dict[str, Any]
+) -> None:
+    """Start question generation after a successful extraction."""
+    logger.info(
+        "auto_triggering_question_generation",
+        quiz_id=str(quiz_id),
+        target_questions=quiz_settings["target_questions"],
+        llm_model=quiz_settings["llm_model"],
+    )
+    try:
+        # Import here to avoid circular imports
+        from .question_generation import orchestrate_quiz_question_generation
+
+        await orchestrate_quiz_question_generation(
+            quiz_id=quiz_id,
+            target_question_count=quiz_settings["target_questions"],
             llm_model=quiz_settings["llm_model"],
+            llm_temperature=quiz_settings["llm_temperature"],
+            language=quiz_settings["language"],
         )
-        try:
-            # Import here to avoid circular imports
-            from .question_generation import orchestrate_quiz_question_generation
-
-            await orchestrate_quiz_question_generation(
-                quiz_id=quiz_id,
-                target_question_count=quiz_settings["target_questions"],
-                llm_model=quiz_settings["llm_model"],
-                llm_temperature=quiz_settings["llm_temperature"],
-                language=quiz_settings["language"],
-            )
-        except Exception as auto_trigger_error:
-            logger.error(
-                "auto_trigger_question_generation_failed",
-                quiz_id=str(quiz_id),
-                error=str(auto_trigger_error),
-                error_type=type(auto_trigger_error).__name__,
-                exc_info=True,
-            )
-            # Rollback: Reset status to allow manual retry but keep extracted content
-            await rollback_quiz_to_status(
-                quiz_id=quiz_id,
-                target_status=QuizStatus.EXTRACTING_CONTENT,
-                error=auto_trigger_error,
-                operation_context="auto_trigger_question_generation",
-            )
-    elif final_status == "no_content":
-        logger.info(
-            "skipping_question_generation_no_content",
+    except Exception as auto_trigger_error:
+        logger.error(
+            "auto_trigger_question_generation_failed",
             quiz_id=str(quiz_id),
-            reason="no_meaningful_content_extracted",
+            error=str(auto_trigger_error),
+            error_type=type(auto_trigger_error).__name__,
+            exc_info=True,
+        )
+        # Rollback: Reset status to allow manual retry but keep extracted content
+        await rollback_quiz_to_status(
+            quiz_id=quiz_id,
+            target_status=QuizStatus.EXTRACTING_CONTENT,
+            error=auto_trigger_error,
+            operation_context="auto_trigger_question_generation",
         )
@@ -237,13 +237,14 @@ async def rollback_quiz_to_status(
 
 
 def timeout_operation(
-    timeout_seconds: int,
+    timeout_seconds: int | Callable[[], int],
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator to add timeout to orchestration operations.
 
     Args:
-        timeout_seconds: Maximum time to wait before timing out
+        timeout_seconds: Maximum time to wait before timing out, or a callable
+            returning it when the timeout depends on runtime settings
 
     Raises:
         OrchestrationTimeoutError: If operation times out
@@ -252,10 +253,11 @@ def timeout_operation(
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            timeout = (
+                timeout_seconds() if callable(timeout_seconds) else timeout_seconds
+            )
             try:
-                return await asyncio.wait_for(
-                    func(*args, **kwargs), timeout=timeout_seconds
-                )
+                return await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
             except asyncio.TimeoutError:
                 # Extract quiz_id from args if available for better logging
                 quiz_id = None
@@ -267,13 +269,13 @@ def timeout_operation(
                 logger.error(
                     "orchestration_operation_timeout",
                     operation=func.__name__,
-                    timeout_seconds=timeout_seconds,
+                    timeout_seconds=timeout,
                     quiz_id=quiz_id,
                 )
 
                 raise OrchestrationTimeoutError(
                     operation=func.__name__,
-                    timeout_seconds=timeout_seconds,
+                    timeout_seconds=timeout,
                     quiz_id=quiz_id,
                 )
 
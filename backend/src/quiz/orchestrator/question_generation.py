@@ -19,6 +19,37 @@ from .core import timeout_operation
 logger = get_logger("quiz_orchestrator_question_generation")
 
 
+def get_generation_provider_name() -> str:
+    """Provider used for quiz generation: synchronous OpenAI or the Batch API."""
+    from src.config import settings
+
+    return "openai_batch" if settings.LLM_BATCH_MODE_ENABLED else "openai"
+
+
+def question_generation_timeout() -> int:
+    """Timeout for question generation; Batch API jobs may take up to a day."""
+    from src.config import settings
+
+    if settings.LLM_BATCH_MODE_ENABLED:
+        return OPERATION_TIMEOUTS["batch_question_generation"]
+    return OPERATION_TIMEOUTS["question_generation"]
+
+
+def cancel_question_generation(quiz_id: UUID) -> bool:
+    """
+    Cancel a quiz's question generation running in this process.
+
+    Batches that already finished keep their saved questions; the rest are
+    reported as failed.
+
+    Returns:
+        True if a running generation was cancelled
+    """
+    from src.question.workflows.scheduler import cancel_quiz_generation
+
+    return cancel_quiz_generation(quiz_id)
+
+
 async def _execute_generation_workflow(
     quiz_id: UUID,
     _target_question_count: int,
@@ -75,7 +106,7 @@ async def _execute_generation_workflow(
         )
 
         # Generate questions using module-based service with batch tracking
-        provider_name = "openai"  # Use default provider
+        provider_name = get_generation_provider_name()
         (
             batch_results,
             batch_status,
@@ -188,7 +219,7 @@ async def _execute_generation_workflow(
         return "failed", str(e), e, None
 
 
-@timeout_operation(OPERATION_TIMEOUTS["question_generation"])
+@timeout_operation(question_generation_timeout)
 async def orchestrate_quiz_question_generation(
     quiz_id: UUID,
     target_question_count: int,
@@ -287,8 +318,9 @@ async def orchestrate_quiz_question_generation(
         existing_failed.update(failed_batches)  # Add new failures from current run
         existing_failed -= existing_successful  # Remove batches that succeeded in any run (current + historical)
 
-        # Create completely new metadata object
+        # Create completely new metadata object, keeping per-batch progress
         new_metadata = {
+            **quiz.generation_metadata,
             "successful_batches": list(existing_successful),
             "failed_batches": list(existing_failed),
         }
@@ -329,6 +361,10 @@ async def orchestrate_quiz_question_generation(
         if batch_status:
             await _update_generation_metadata_in_session(session, quiz_id, batch_status)
 
+        from ..progress import publish_progress
+
+        await publish_progress(session, quiz_id, "generation_finished", outcome=status)
+
     await execute_in_transaction(
         _save_generation_result,
         quiz_id,
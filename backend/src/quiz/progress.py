@@ -0,0 +1,145 @@
+"""
+Live quiz progress events.
+
+Events are published with ``pg_notify`` inside the transaction that records
+the progress, so listeners only hear about committed changes and every API
+process receives them. Each process keeps one LISTEN connection and fans
+events out to the server-sent-event streams of its clients.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_logger, settings
+
+logger = get_logger("quiz_progress")
+
+PROGRESS_CHANNEL = "quiz_progress"
+
+# Events that end a quiz's generation progress stream
+TERMINAL_EVENTS = frozenset({"generation_finished"})
+
+# Buffered events per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Seconds between keepalive comments on an idle event stream
+KEEPALIVE_SECONDS = 15
+
+
+async def publish_progress(
+    session: AsyncSession, quiz_id: UUID, event: str, **data: Any
+) -> None:
+    """
+    Publish a progress event when the session's transaction commits.
+
+    Args:
+        session: Async database session
+        quiz_id: Quiz the event belongs to
+        event: Event name
+        **data: JSON-serialisable event data
+    """
+    payload = json.dumps({"quiz_id": str(quiz_id), "event": event, **data})
+    await session.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": PROGRESS_CHANNEL, "payload": payload},
+    )
+
+
+def format_sse(event: dict[str, Any]) -> str:
+    """Format a progress event as a server-sent event."""
+    return f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+
+
+class QuizProgressListener:
+    """Process-wide LISTEN connection fanning events out to subscribers."""
+
+    def __init__(self, dsn: str | None = None):
+        self._dsn = dsn or str(settings.SQLALCHEMY_DATABASE_URI)
+        self._connection: Any = None
+        self._lock = asyncio.Lock()
+        self._subscribers: dict[UUID, set[asyncio.Queue[dict[str, Any]]]] = {}
+
+    @asynccontextmanager
+    async def subscribe(
+        self, quiz_id: UUID
+    ) -> AsyncIterator[asyncio.Queue[dict[str, Any]]]:
+        """
+        Receive the progress events of a quiz for the duration of the context.
+
+        Args:
+            quiz_id: Quiz identifier
+
+        Yields:
+            Queue receiving event dictionaries
+        """
+        await self._ensure_listening()
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(quiz_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(quiz_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[quiz_id]
+
+    async def _ensure_listening(self) -> None:
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+
+            import asyncpg  # type: ignore[import-untyped]
+
+            self._connection = await asyncpg.connect(self._dsn)
+            await self._connection.add_listener(PROGRESS_CHANNEL, self._dispatch)
+            logger.info("quiz_progress_listener_started", channel=PROGRESS_CHANNEL)
+
+    def _dispatch(
+        self, _connection: Any, _pid: int, _channel: str, payload: str
+    ) -> None:
+        try:
+            event = json.loads(payload)
+            quiz_id = UUID(event["quiz_id"])
+        except (ValueError, KeyError) as e:
+            logger.warning("quiz_progress_event_invalid", error=str(e))
+            return
+
+        for queue in self._subscribers.get(quiz_id, ()):
+            if queue.full():
+                # A stalled client loses its oldest events, not the newest
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def aclose(self) -> None:
+        """Close the LISTEN connection."""
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                await self._connection.close()
+            self._connection = None
+
+
+_progress_listener: QuizProgressListener | None = None
+
+
+def get_progress_listener() -> QuizProgressListener:
+    """Get the global progress listener instance."""
+    global _progress_listener
+    if _progress_listener is None:
+        _progress_listener = QuizProgressListener()
+    return _progress_listener
+
+
+async def reset_progress_listener() -> None:
+    """Close and drop the global progress listener."""
+    global _progress_listener
+    if _progress_listener is not None:
+        await _progress_listener.aclose()
+    _progress_listener = None
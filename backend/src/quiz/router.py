@@ -1,6 +1,9 @@
+import asyncio
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
 
 from src.auth.dependencies import CurrentUser
 from src.canvas.dependencies import CanvasToken
@@ -20,12 +23,13 @@ from .dependencies import (
 from .manual import create_manual_module
 from .models import Quiz
 from .orchestrator import (
+    cancel_question_generation,
     orchestrate_content_extraction,
     orchestrate_quiz_export_to_canvas,
     orchestrate_quiz_question_generation,
     safe_background_orchestration,
 )
-from .schemas import ManualModuleCreate, ManualModuleResponse, QuizCreate
+from .schemas import ManualModuleCreate, ManualModuleResponse, QuizCreate, QuizStatus
 from .service import (
     create_quiz,
     delete_quiz,
@@ -528,6 +532,9 @@ def delete_quiz_endpoint(
                 status_code=404, detail=ERROR_MESSAGES["quiz_not_found"]
             )
 
+        # Stop spending LLM calls on a quiz that no longer exists
+        cancel_question_generation(quiz_id)
+
         logger.info(
             "quiz_deletion_completed",
             user_id=str(current_user.id),
@@ -713,6 +720,88 @@ async def get_quiz_question_stats(
         )
 
 
+@router.get("/{quiz_id}/events")
+async def stream_quiz_progress(
+    quiz: QuizOwnership,
+    current_user: CurrentUser,
+) -> StreamingResponse:
+    """
+    Stream live question generation progress as server-sent events.
+
+    Replaces polling `GET /quiz/{quiz_id}` while questions are generated.
+
+    **Parameters:**
+        quiz_id (UUID): The UUID of the quiz to follow
+
+    **Returns:**
+        StreamingResponse: `text/event-stream` with these events:
+        - `snapshot`: current status and batch counts, sent first
+        - `batch_completed`: a batch finished, with cumulative counts
+        - `generation_finished`: generation ended; the stream closes
+
+    **Authentication:**
+        Requires valid JWT token in Authorization header
+
+    **Raises:**
+        HTTPException: 404 if quiz not found or user doesn't own it
+
+    **Note:**
+    The stream closes after the snapshot if the quiz is not generating
+    questions.
+    """
+    from .progress import (
+        KEEPALIVE_SECONDS,
+        TERMINAL_EVENTS,
+        format_sse,
+        get_progress_listener,
+    )
+
+    logger.info(
+        "quiz_progress_stream_opened",
+        user_id=str(current_user.id),
+        quiz_id=str(quiz.id),
+    )
+
+    from src.database import get_async_session
+
+    from .service import get_generation_progress
+
+    quiz_id = quiz.id
+
+    async def events() -> AsyncIterator[str]:
+        # Subscribe before reading the snapshot so no committed event is missed
+        async with get_progress_listener().subscribe(quiz_id) as queue:
+            async with get_async_session() as async_session:
+                progress = await get_generation_progress(async_session, quiz_id)
+
+            if progress is None:
+                return
+
+            yield format_sse({"quiz_id": str(quiz_id), "event": "snapshot", **progress})
+            if progress["status"] != QuizStatus.GENERATING_QUESTIONS:
+                return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    # Comment lines keep proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+                    continue
+
+                yield format_sse(event)
+                if event["event"] in TERMINAL_EVENTS:
+                    return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/{quiz_id}/export")
 async def export_quiz_to_canvas(
     quiz: QuizOwnership,
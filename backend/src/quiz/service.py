@@ -212,6 +212,96 @@ async def get_quiz_for_update(
     return result.scalar_one_or_none()
 
 
+async def record_generation_batch(
+    session: AsyncSession,
+    quiz_id: UUID,
+    batch_key: str,
+    success: bool,
+    questions_saved: int,
+) -> None:
+    """
+    Record a finished generation batch and publish a progress event.
+
+    Runs as soon as a batch finishes, so the batch lists in
+    generation_metadata and the generated question counter are current
+    while the rest of the quiz is still generating.
+
+    Args:
+        session: Async database session
+        quiz_id: Quiz ID
+        batch_key: Key of the finished batch
+        success: Whether the batch reached its target question count
+        questions_saved: Number of questions the batch saved
+    """
+    from .progress import publish_progress
+
+    # The row lock serialises concurrent batches of the same quiz
+    quiz = await get_quiz_for_update(session, quiz_id)
+    if not quiz:
+        logger.warning("quiz_not_found_during_batch_update", quiz_id=str(quiz_id))
+        return
+
+    metadata = dict(quiz.generation_metadata or {})
+    successful_batches = set(metadata.get("successful_batches", []))
+    failed_batches = set(metadata.get("failed_batches", []))
+
+    if success:
+        successful_batches.add(batch_key)
+        failed_batches.discard(batch_key)
+    elif batch_key not in successful_batches:
+        failed_batches.add(batch_key)
+
+    questions_generated = metadata.get("questions_generated", 0) + questions_saved
+    quiz.generation_metadata = {
+        **metadata,
+        "successful_batches": list(successful_batches),
+        "failed_batches": list(failed_batches),
+        "questions_generated": questions_generated,
+    }
+
+    await publish_progress(
+        session,
+        quiz_id,
+        "batch_completed",
+        batch_key=batch_key,
+        success=success,
+        questions_saved=questions_saved,
+        questions_generated=questions_generated,
+        successful_batches=len(successful_batches),
+        failed_batches=len(failed_batches),
+    )
+
+
+async def get_generation_progress(
+    session: AsyncSession, quiz_id: UUID
+) -> dict[str, Any] | None:
+    """
+    Read the current question generation progress of a quiz.
+
+    Args:
+        session: Async database session
+        quiz_id: Quiz ID
+
+    Returns:
+        Status, generated question count and batch counts, or None if the
+        quiz does not exist
+    """
+    result = await session.execute(
+        select(Quiz.status, Quiz.generation_metadata).where(Quiz.id == quiz_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    metadata = row.generation_metadata or {}
+    return {
+        "status": row.status,
+        "questions_generated": metadata.get("questions_generated", 0),
+        "successful_batches": len(metadata.get("successful_batches", [])),
+        "failed_batches": len(metadata.get("failed_batches", [])),
+    }
+
+
 async def get_content_from_quiz(
     session: AsyncSession, quiz_id: UUID, include_deleted: bool = False
 ) -> dict[str, Any] | None:
@@ -462,6 +552,14 @@ async def reserve_quiz_job(
             quiz.failure_reason = None
             quiz.last_status_update = datetime.now(timezone.utc)
 
+        # Restart the progress counter from the questions the quiz still has,
+        # so a regeneration does not add to the previous run's total
+        question_counts = await get_question_counts(session, quiz_id)
+        quiz.generation_metadata = {
+            **(quiz.generation_metadata or {}),
+            "questions_generated": question_counts["total"],
+        }
+
         settings = {}
 
     elif job_type == "export":
@@ -18,6 +18,7 @@ os.environ["ENVIRONMENT"] = "test"
 from src.auth.models import User
 from src.database import get_session_dep
 from src.main import app
+from src.question.providers.circuit_breaker import reset_circuit_breakers
 from tests.database import (
     create_test_database,
     drop_test_database,
@@ -71,6 +72,14 @@ def reset_database() -> Generator[None, None, None]:
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_llm_circuit_breakers() -> Generator[None, None, None]:
+    """Start each test with closed LLM circuit breakers."""
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
 @pytest.fixture
 def session() -> Generator[Session, None, None]:
     """Provide a database session for testing."""
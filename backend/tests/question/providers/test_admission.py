@@ -0,0 +1,241 @@
+"""Tests for the LLM admission controller."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_global_in_flight_cap_is_enforced():
+    """Test that no more than max_in_flight requests run concurrently."""
+    from src.question.providers.admission import LLMAdmissionController
+
+    controller = LLMAdmissionController(max_in_flight=3)
+    running = 0
+    peak = 0
+
+    async def request(tenant: str) -> None:
+        nonlocal running, peak
+        async with controller.admit("mock:model", 10, tenant=tenant):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(request(f"quiz-{i % 4}") for i in range(20)))
+
+    assert peak == 3
+    stats = controller.get_stats()
+    assert stats["admitted"] == 20
+    assert stats["in_flight"] == 0
+    assert stats["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_per_tenant_cap_is_enforced():
+    """Test that a single quiz cannot exceed its own in-flight cap."""
+    from src.question.providers.admission import LLMAdmissionController
+
+    controller = LLMAdmissionController(max_in_flight=10, max_in_flight_per_tenant=2)
+    running = 0
+    peak = 0
+
+    async def request() -> None:
+        nonlocal running, peak
+        async with controller.admit("mock:model", 10, tenant="quiz-1"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(request() for _ in range(8)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_waiting_tenants_are_served_round_robin():
+    """Test that a late quiz is not starved by a quiz with many queued requests."""
+    from src.question.providers.admission import LLMAdmissionController
+
+    controller = LLMAdmissionController(max_in_flight=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def blocker() -> None:
+        async with controller.admit("mock:model", 10, tenant="blocker"):
+            await release.wait()
+
+    async def request(tenant: str) -> None:
+        async with controller.admit("mock:model", 10, tenant=tenant):
+            order.append(tenant)
+
+    blocking_task = asyncio.create_task(blocker())
+    await asyncio.sleep(0)
+
+    tasks = [asyncio.create_task(request("big-quiz")) for _ in range(4)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(request("small-quiz")))
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(blocking_task, *tasks)
+
+    # small-quiz is served right after the first big-quiz request
+    assert order.index("small-quiz") == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    """Test that cancelling a queued request leaves the controller consistent."""
+    from src.question.providers.admission import LLMAdmissionController
+
+    controller = LLMAdmissionController(max_in_flight=1)
+    release = asyncio.Event()
+
+    async def holder() -> None:
+        async with controller.admit("mock:model", 10):
+            await release.wait()
+
+    async def waiter() -> None:
+        async with controller.admit("mock:model", 10, tenant="quiz-2"):
+            pass
+
+    holding_task = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiting_task = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+
+    waiting_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_task
+
+    release.set()
+    await holding_task
+
+    stats = controller.get_stats()
+    assert stats["in_flight"] == 0
+    assert stats["waiting"] == 0
+    assert stats["waiting_tenants"] == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_per_minute_budget_delays_requests():
+    """Test that an exhausted request budget delays admission."""
+    from unittest.mock import AsyncMock, patch
+
+    from src.question.providers.admission import (
+        LLMAdmissionController,
+        ModelRateLimits,
+    )
+
+    controller = LLMAdmissionController(
+        max_in_flight=5,
+        default_limits=ModelRateLimits(requests_per_minute=2),
+    )
+
+    with patch(
+        "src.question.providers.admission.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        # Let refill happen "instantly" by draining the bucket only once
+        async def fake_sleep(_delay: float) -> None:
+            bucket = controller._buckets["mock:model"].requests
+            bucket.tokens = bucket.capacity
+
+        mock_sleep.side_effect = fake_sleep
+
+        for _ in range(3):
+            async with controller.admit("mock:model", 10):
+                pass
+
+    assert mock_sleep.call_count == 1
+    delay = mock_sleep.call_args[0][0]
+    assert 29.0 < delay <= 30.0  # One request refills every 30 seconds
+    assert controller.get_stats()["rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_waiters_do_not_hold_slots():
+    """Test that a rate-limited model does not block models with budget left."""
+    from src.question.providers.admission import (
+        LLMAdmissionController,
+        ModelRateLimits,
+    )
+
+    controller = LLMAdmissionController(max_in_flight=1)
+    limited = ModelRateLimits(requests_per_minute=1)
+
+    async def request(model_key: str, tenant: str, limits=None) -> None:
+        async with controller.admit(model_key, 10, tenant=tenant, limits=limits):
+            pass
+
+    # Spend the limited model's budget; the next request waits about a minute
+    await request("mock:limited", "quiz-1", limited)
+    waiting = asyncio.create_task(request("mock:limited", "quiz-1", limited))
+    await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(request("mock:other", "quiz-2"), timeout=1)
+
+    assert not waiting.done()
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert controller.get_stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_budget_is_reconciled_with_actual_usage():
+    """Test that actual usage replaces the estimate in the token bucket."""
+    from src.question.providers.admission import (
+        LLMAdmissionController,
+        ModelRateLimits,
+    )
+
+    controller = LLMAdmissionController(
+        max_in_flight=5,
+        default_limits=ModelRateLimits(tokens_per_minute=10_000),
+    )
+
+    async with controller.admit("mock:model", 1_000) as ticket:
+        ticket.record_usage(4_000)
+
+    bucket = controller._buckets["mock:model"].tokens
+    assert bucket.tokens == pytest.approx(6_000, abs=5)
+
+
+@pytest.mark.asyncio
+async def test_generate_with_retry_goes_through_admission():
+    """Test that provider calls are admitted and use provider rate overrides."""
+    from unittest.mock import patch
+
+    from src.question.providers.admission import LLMAdmissionController
+    from src.question.providers.base import (
+        LLMConfiguration,
+        LLMMessage,
+        LLMProvider,
+    )
+    from src.question.providers.mock_provider import MockProvider
+
+    controller = LLMAdmissionController(max_in_flight=2)
+    provider = MockProvider(
+        LLMConfiguration(
+            provider=LLMProvider.MOCK,
+            model="mock-model",
+            max_retries=0,
+            provider_settings={"requests_per_minute": 60},
+        )
+    )
+
+    with patch(
+        "src.question.providers.base.get_admission_controller",
+        return_value=controller,
+    ):
+        response = await provider.generate_with_retry(
+            [LLMMessage(role="user", content="Hello")], tenant="quiz-1"
+        )
+
+    assert response.content
+    assert controller.get_stats()["admitted"] == 1
+    buckets = controller._buckets["mock:mock-model"]
+    assert buckets.requests is not None
+    assert buckets.requests.capacity == 60
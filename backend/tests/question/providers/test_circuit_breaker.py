@@ -0,0 +1,144 @@
+"""Tests for LLM circuit breakers and shared backoff."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+
+def _temporary_error():
+    from src.question.providers.base import LLMError
+
+    return LLMError("upstream 503", error_code="temporary_error", retryable=True)
+
+
+async def _fail(breaker, error):
+    with pytest.raises(type(error)):
+        async with breaker.guard():
+            raise error
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_threshold_and_fails_fast():
+    """Test that consecutive transient failures open the circuit."""
+    from src.question.providers.base import CircuitOpenError
+    from src.question.providers.circuit_breaker import CircuitBreaker, CircuitState
+
+    breaker = CircuitBreaker("mock:model", failure_threshold=2, recovery_timeout=30)
+
+    await _fail(breaker, _temporary_error())
+    assert breaker.state == CircuitState.CLOSED
+    await _fail(breaker, _temporary_error())
+    assert breaker.state == CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        async with breaker.guard():
+            pass  # pragma: no cover
+
+    assert 0 < exc_info.value.retry_after <= 30
+    assert breaker.get_stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_do_not_trip_circuit():
+    """Test that caller errors are not counted against the provider."""
+    from src.question.providers.base import AuthenticationError
+    from src.question.providers.circuit_breaker import CircuitBreaker, CircuitState
+
+    breaker = CircuitBreaker("mock:model", failure_threshold=1)
+    await _fail(breaker, AuthenticationError("bad key"))
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_or_reopens_circuit():
+    """Test half-open probing and open-time accounting."""
+    from src.question.providers.base import CircuitOpenError
+    from src.question.providers.circuit_breaker import CircuitBreaker, CircuitState
+
+    with (
+        patch("src.question.providers.circuit_breaker.time.monotonic") as clock,
+        patch("src.question.providers.circuit_breaker.logger") as logger,
+    ):
+        clock.return_value = 100.0
+        breaker = CircuitBreaker("mock:model", failure_threshold=1, recovery_timeout=10)
+        await _fail(breaker, _temporary_error())
+
+        clock.return_value = 111.0
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        # The failed probe reopens the circuit
+        await _fail(breaker, _temporary_error())
+        assert breaker.state == CircuitState.OPEN
+
+        clock.return_value = 125.0
+        async with breaker.guard():
+            # Only one probe may run while half-open
+            with pytest.raises(CircuitOpenError):
+                async with breaker.guard():
+                    pass  # pragma: no cover
+
+        assert breaker.state == CircuitState.CLOSED
+        stats = breaker.get_stats()
+
+    assert stats["opened"] == 2
+    assert stats["open_seconds_total"] == 25.0
+    # The whole outage, reopening included, is reported when the circuit closes
+    logger.info.assert_any_call(
+        "llm_circuit_closed",
+        circuit="mock:model",
+        outage_seconds=25.0,
+        open_seconds_total=25.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_sets_shared_backoff():
+    """Test that Retry-After from one task pauses every other task."""
+    from src.question.providers.base import RateLimitError
+    from src.question.providers.circuit_breaker import CircuitBreaker
+
+    breaker = CircuitBreaker("mock:model", failure_threshold=10)
+    await _fail(breaker, RateLimitError("slow down", retry_after=0.05))
+
+    assert breaker.backoff_remaining() > 0
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with breaker.guard():
+        pass
+
+    assert loop.time() - started >= 0.04
+    assert breaker.get_stats()["backoff_waits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_with_retry_fails_fast_when_circuit_open():
+    """Test that an open circuit short-circuits provider calls."""
+    from unittest.mock import AsyncMock
+
+    from src.question.providers.base import (
+        CircuitOpenError,
+        LLMConfiguration,
+        LLMError,
+        LLMMessage,
+        LLMProvider,
+    )
+    from src.question.providers.circuit_breaker import get_circuit_breakers
+    from src.question.providers.mock_provider import MockProvider
+
+    provider = MockProvider(
+        LLMConfiguration(provider=LLMProvider.MOCK, model="mock-model", max_retries=0)
+    )
+    provider.generate = AsyncMock(side_effect=_temporary_error())
+    breaker = get_circuit_breakers().get("mock:mock-model")
+    breaker.failure_threshold = 1
+
+    with pytest.raises(LLMError):
+        await provider.generate_with_retry([LLMMessage(role="user", content="a")])
+    with pytest.raises(CircuitOpenError):
+        await provider.generate_with_retry([LLMMessage(role="user", content="b")])
+
+    assert provider.generate.call_count == 1
+    assert "mock:mock-model" in get_circuit_breakers().get_stats()
@@ -0,0 +1,152 @@
+"""Tests for single-flight coalescing of identical LLM requests."""
+
+import asyncio
+
+import pytest
+
+
+def _response(content: str = "shared content"):
+    from src.question.providers.base import LLMProvider, LLMResponse
+
+    return LLMResponse(
+        content=content,
+        model="mock-model",
+        provider=LLMProvider.MOCK,
+        total_tokens=42,
+        response_time=1.5,
+    )
+
+
+@pytest.fixture
+def mock_provider():
+    """Create a mock provider without retries."""
+    from src.question.providers.base import LLMConfiguration, LLMProvider
+    from src.question.providers.mock_provider import MockProvider
+
+    return MockProvider(
+        LLMConfiguration(provider=LLMProvider.MOCK, model="mock-model", max_retries=0)
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_call(mock_provider):
+    """Test that concurrent identical requests make a single upstream call."""
+    from src.question.providers.base import LLMMessage
+    from src.question.providers.coalescing import get_request_coalescer
+
+    calls = 0
+    release = asyncio.Event()
+
+    async def generate(_messages, **_kwargs):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return _response()
+
+    mock_provider.generate = generate
+    messages = [LLMMessage(role="user", content="Generate questions")]
+    coalesced_before = get_request_coalescer().get_stats()["coalesced"]
+
+    tasks = [
+        asyncio.create_task(mock_provider.generate_with_retry(messages))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert all(response == responses[0] for response in responses)
+
+    # Each waiter owns its response, so per-batch metadata does not leak
+    responses[0].metadata["estimated_completion_tokens"] = 10
+    assert "estimated_completion_tokens" not in responses[1].metadata
+    assert get_request_coalescer().get_stats()["coalesced"] - coalesced_before == 2
+    assert get_request_coalescer().get_stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_different_or_bypassed_requests_are_not_coalesced(mock_provider):
+    """Test that distinct prompts and cache bypass calls run separately."""
+    from src.question.providers.base import LLMMessage
+
+    calls = 0
+
+    async def generate(messages, **_kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return _response(messages[0].content)
+
+    mock_provider.generate = generate
+    first = [LLMMessage(role="user", content="first")]
+    second = [LLMMessage(role="user", content="second")]
+
+    responses = await asyncio.gather(
+        mock_provider.generate_with_retry(first),
+        mock_provider.generate_with_retry(second),
+        mock_provider.generate_with_retry(first, cache_bypass=True),
+    )
+
+    assert calls == 3
+    assert [response.content for response in responses] == ["first", "second", "first"]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_by_all_waiters():
+    """Test that a failing leader propagates its error to every waiter."""
+    from src.question.providers.coalescing import RequestCoalescer
+
+    coalescer = RequestCoalescer()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        coalescer.run("key", failing),
+        coalescer.run("key", failing),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert coalescer.get_stats() == {"leaders": 1, "coalesced": 1, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_request_for_others():
+    """Test that the upstream call is cancelled only when every waiter leaves."""
+    from src.question.providers.coalescing import RequestCoalescer
+
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+    cancelled = False
+
+    async def request():
+        nonlocal cancelled
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return _response()
+
+    first = asyncio.create_task(coalescer.run("key", request))
+    second = asyncio.create_task(coalescer.run("key", request))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled
+
+    release.set()
+    assert (await second).content == "shared content"
+
+    lone = asyncio.create_task(coalescer.run("other", request))
+    release.clear()
+    await asyncio.sleep(0)
+    lone.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await lone
+    await asyncio.sleep(0)
+    assert cancelled
@@ -0,0 +1,371 @@
+"""Tests for the OpenAI Batch API provider against a local stand-in server."""
+
+import json
+import uuid
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from src.question.providers.base import DEFAULT_OPENAI_MODEL
+
+
+class FakeBatchAPI:
+    """Minimal in-process stand-in for the OpenAI files and batches endpoints."""
+
+    def __init__(self, final_status: str = "completed"):
+        self.final_status = final_status
+        self.batches: dict[str, dict] = {}
+        self.files: dict[str, str] = {}
+        self.polls = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+
+        if request.method == "POST" and path == "/v1/files":
+            lines = [
+                line
+                for line in request.content.decode().splitlines()
+                if line.startswith('{"custom_id"')
+            ]
+            file_id = f"file-in-{len(self.files)}"
+            self.files[file_id] = "\n".join(lines)
+            return httpx.Response(200, json=self._file(file_id))
+
+        if request.method == "POST" and path == "/v1/batches":
+            payload = json.loads(request.content)
+            batch_id = f"batch_{len(self.batches)}"
+            self.batches[batch_id] = self._batch(
+                batch_id, payload["input_file_id"], "validating"
+            )
+            return httpx.Response(200, json=self.batches[batch_id])
+
+        if request.method == "POST" and path.endswith("/cancel"):
+            batch = self.batches[path.split("/")[3]]
+            batch["status"] = "cancelled"
+            return httpx.Response(200, json=batch)
+
+        if request.method == "GET" and path.startswith("/v1/batches/"):
+            batch = self.batches[path.rsplit("/", 1)[1]]
+            self.polls += 1
+            if batch["status"] == "validating":
+                batch["status"] = "in_progress"
+            elif batch["status"] == "in_progress":
+                self._finish(batch)
+            return httpx.Response(200, json=batch)
+
+        if request.method == "GET" and path.endswith("/content"):
+            return httpx.Response(200, text=self.files[path.split("/")[3]])
+
+        return httpx.Response(404, json={"error": {"message": "not found"}})
+
+    def _finish(self, batch: dict) -> None:
+        batch["status"] = self.final_status
+        if self.final_status != "completed":
+            return
+
+        output, errors = [], []
+        for line in self.files[batch["input_file_id"]].splitlines():
+            request = json.loads(line)
+            prompt = request["body"]["messages"][-1]["content"]
+            if prompt == "fail":
+                errors.append(
+                    {
+                        "custom_id": request["custom_id"],
+                        "response": {
+                            "status_code": 400,
+                            "body": {"error": {"message": "bad", "code": "invalid"}},
+                        },
+                        "error": None,
+                    }
+                )
+                continue
+            output.append(
+                {
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "model": request["body"]["model"],
+                            "choices": [
+                                {"message": {"role": "assistant", "content": prompt}}
+                            ],
+                            "usage": {
+                                "prompt_tokens": 3,
+                                "completion_tokens": 2,
+                                "total_tokens": 5,
+                            },
+                        },
+                    },
+                    "error": None,
+                }
+            )
+
+        batch["output_file_id"] = "file-out"
+        self.files["file-out"] = "\n".join(json.dumps(line) for line in output)
+        if errors:
+            batch["error_file_id"] = "file-err"
+            self.files["file-err"] = "\n".join(json.dumps(line) for line in errors)
+
+    @staticmethod
+    def _file(file_id: str) -> dict:
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": 0,
+            "created_at": 0,
+            "filename": "batch_input.jsonl",
+            "purpose": "batch",
+            "status": "processed",
+        }
+
+    @staticmethod
+    def _batch(batch_id: str, input_file_id: str, status: str) -> dict:
+        return {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": input_file_id,
+            "completion_window": "24h",
+            "status": status,
+            "created_at": 0,
+        }
+
+
+@pytest.fixture
+def batch_provider():
+    """Create a batch provider with fast collection and polling."""
+    from src.question.providers.base import LLMConfiguration, LLMProvider
+    from src.question.providers.openai_batch_provider import OpenAIBatchProvider
+
+    return OpenAIBatchProvider(
+        LLMConfiguration(
+            provider=LLMProvider.OPENAI_BATCH,
+            model=DEFAULT_OPENAI_MODEL,
+            max_retries=0,
+            provider_settings={
+                "api_key": "test_api_key",
+                "base_url": "https://batch.test/v1",
+                "batch_collect_window": 0.01,
+                "batch_poll_interval": 0,
+            },
+        )
+    )
+
+
+def _serve(api: FakeBatchAPI):
+    shared = MagicMock()
+    shared.get_client.return_value = httpx.AsyncClient(
+        transport=httpx.MockTransport(api.handler)
+    )
+    return patch(
+        "src.question.providers.openai_batch_provider.get_shared_http_client",
+        return_value=shared,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch(batch_provider):
+    """Test that a burst of requests is submitted as one batch job."""
+    import asyncio
+
+    from src.question.providers.base import LLMMessage, LLMProvider
+
+    api = FakeBatchAPI()
+    with _serve(api):
+        responses = await asyncio.gather(
+            *(
+                batch_provider.generate_with_retry(
+                    [LLMMessage(role="user", content=f"prompt {index}")]
+                )
+                for index in range(3)
+            )
+        )
+
+    assert len(api.batches) == 1
+    assert [response.content for response in responses] == [
+        "prompt 0",
+        "prompt 1",
+        "prompt 2",
+    ]
+    assert responses[0].provider == LLMProvider.OPENAI_BATCH
+    assert responses[0].total_tokens == 5
+    assert responses[0].metadata["batch_id"] == "batch_0"
+
+
+@pytest.mark.asyncio
+async def test_failed_lines_raise_for_their_caller_only(batch_provider):
+    """Test that per-request errors from the error file are isolated."""
+    import asyncio
+
+    from src.question.providers.base import LLMError, LLMMessage
+
+    api = FakeBatchAPI()
+    with _serve(api):
+        ok, failed = await asyncio.gather(
+            batch_provider.generate([LLMMessage(role="user", content="ok")]),
+            batch_provider.generate([LLMMessage(role="user", content="fail")]),
+            return_exceptions=True,
+        )
+
+    assert ok.content == "ok"
+    assert isinstance(failed, LLMError)
+    assert failed.error_code == "invalid"
+    assert not failed.retryable
+
+
+@pytest.mark.asyncio
+async def test_expired_batch_is_retryable(batch_provider):
+    """Test that requests left unfinished by an expired batch can be retried."""
+    from src.question.providers.base import LLMError, LLMMessage
+
+    api = FakeBatchAPI(final_status="expired")
+    with _serve(api):
+        with pytest.raises(LLMError) as exc_info:
+            await batch_provider.generate([LLMMessage(role="user", content="late")])
+
+    assert exc_info.value.error_code == "batch_expired"
+    assert exc_info.value.retryable
+
+
+@pytest.mark.asyncio
+async def test_batch_is_cancelled_when_its_last_caller_is(batch_provider):
+    """Test that a job nobody waits for any more is cancelled at OpenAI."""
+    import asyncio
+
+    from src.question.providers.base import LLMMessage
+
+    api = FakeBatchAPI()
+    batch_provider.poll_interval = 60
+    with _serve(api):
+        task = asyncio.create_task(
+            batch_provider.generate([LLMMessage(role="user", content="gone")])
+        )
+        while not api.polls:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.gather(*batch_provider._batch_tasks, return_exceptions=True)
+
+    assert api.batches["batch_0"]["status"] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_running_for_remaining_callers(batch_provider):
+    """Test that cancelling one caller leaves a shared job running."""
+    import asyncio
+
+    from src.question.providers.base import LLMMessage
+
+    api = FakeBatchAPI()
+    batch_provider.poll_interval = 0.05
+    with _serve(api):
+        gone = asyncio.create_task(
+            batch_provider.generate([LLMMessage(role="user", content="gone")])
+        )
+        kept = asyncio.create_task(
+            batch_provider.generate([LLMMessage(role="user", content="kept")])
+        )
+        while not api.polls:
+            await asyncio.sleep(0.01)
+        gone.cancel()
+        response = await kept
+
+    assert response.content == "kept"
+    assert api.batches["batch_0"]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_aclose_cancels_outstanding_batches(batch_provider):
+    """Test that closing the provider cancels running jobs and queued requests."""
+    import asyncio
+
+    from src.question.providers.base import LLMMessage
+
+    api = FakeBatchAPI()
+    batch_provider.poll_interval = 60
+    with _serve(api):
+        submitted = asyncio.create_task(
+            batch_provider.generate([LLMMessage(role="user", content="running")])
+        )
+        while not api.polls:
+            await asyncio.sleep(0.01)
+        batch_provider.collect_window = 60
+        queued = asyncio.create_task(
+            batch_provider.generate([LLMMessage(role="user", content="queued")])
+        )
+        await asyncio.sleep(0)
+
+        await batch_provider.aclose()
+        results = await asyncio.gather(submitted, queued, return_exceptions=True)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert api.batches["batch_0"]["status"] == "cancelled"
+    assert len(api.batches) == 1
+
+
+def test_generation_provider_follows_batch_mode_setting():
+    """Test that the orchestrator selects the batch provider in batch mode."""
+    from src.quiz.orchestrator.question_generation import (
+        get_generation_provider_name,
+        question_generation_timeout,
+    )
+
+    with patch("src.config.settings.LLM_BATCH_MODE_ENABLED", True):
+        assert get_generation_provider_name() == "openai_batch"
+        assert question_generation_timeout() > 24 * 3600
+
+    assert get_generation_provider_name() == "openai"
+
+
+@pytest.mark.asyncio
+async def test_multi_batch_quiz_is_submitted_as_one_batch(batch_provider):
+    """Test that batch mode is not split into waves by the quiz scheduler."""
+    from unittest.mock import AsyncMock
+
+    from src.config import settings
+    from src.question.providers.base import LLMMessage
+    from src.question.types import QuestionDifficulty, QuestionType
+    from src.question.workflows.module_batch_workflow import ParallelModuleProcessor
+
+    batch_count = settings.MAX_CONCURRENT_MODULES * 2 + 1
+    modules_data = {
+        f"module_{index}": {
+            "name": f"Module {index}",
+            "content": "Content " * 200,
+            "batches": [
+                {
+                    "question_type": QuestionType.MULTIPLE_CHOICE,
+                    "count": 5,
+                    "difficulty": QuestionDifficulty.MEDIUM,
+                    "batch_key": f"module_{index}_multiple_choice_5",
+                }
+            ],
+        }
+        for index in range(batch_count)
+    }
+
+    async def generate_batch(self, _workflow, module_id, *_args, **_kwargs):
+        await self.llm_provider.generate([LLMMessage(role="user", content=module_id)])
+        return [], {"success": True}
+
+    api = FakeBatchAPI()
+    processor = ParallelModuleProcessor(
+        llm_provider=batch_provider, template_manager=MagicMock()
+    )
+    with (
+        _serve(api),
+        patch(
+            "src.question.workflows.module_batch_workflow.load_quiz_dedup_index",
+            new=AsyncMock(return_value=None),
+        ),
+        patch.object(ParallelModuleProcessor, "_process_single_batch", generate_batch),
+    ):
+        _, batch_status = await processor.process_all_modules_with_batches(
+            uuid.uuid4(), modules_data
+        )
+
+    assert len(api.batches) == 1
+    assert len(api.files["file-in-0"].splitlines()) == batch_count
+    assert len(batch_status["successful_batches"]) == batch_count
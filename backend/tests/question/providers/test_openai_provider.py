@@ -451,3 +451,255 @@ def test_provider_equality(config):
     )
     provider3 = OpenAIProvider(different_config)
     assert provider1.configuration != provider3.configuration
+
+
+@pytest.mark.asyncio
+async def test_client_uses_shared_http_client(provider):
+    """Test that the LangChain client is built on the shared pooled HTTP client."""
+    from unittest.mock import AsyncMock
+
+    from src.question.providers.http_client import get_shared_http_client
+
+    with patch("src.question.providers.openai_provider.ChatOpenAI") as mock_chat_openai:
+        mock_chat_openai.return_value = AsyncMock()
+
+        await provider.initialize()
+
+    call_kwargs = mock_chat_openai.call_args[1]
+    assert call_kwargs["http_async_client"] is get_shared_http_client().get_client()
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_content_chunks(provider):
+    """Test that streaming yields non-empty content chunks in order."""
+    from src.question.providers.base import LLMMessage
+
+    async def fake_astream(_messages):
+        for content in ["[{", "", '"a": 1}]']:
+            chunk = MagicMock()
+            chunk.content = content
+            yield chunk
+
+    with patch("src.question.providers.openai_provider.ChatOpenAI") as mock_chat_openai:
+        mock_client = MagicMock()
+        mock_client.astream = fake_astream
+        mock_chat_openai.return_value = mock_client
+
+        chunks = [
+            chunk
+            async for chunk in provider.stream([LLMMessage(role="user", content="Hi")])
+        ]
+
+    assert chunks == ["[{", '"a": 1}]']
+
+
+@pytest.mark.asyncio
+async def test_stream_maps_errors(provider):
+    """Test that streaming errors are mapped to LLM error types."""
+    from src.question.providers.base import LLMMessage, RateLimitError
+
+    async def failing_astream(_messages):
+        raise Exception("Rate limit exceeded")
+        yield  # pragma: no cover
+
+    with patch("src.question.providers.openai_provider.ChatOpenAI") as mock_chat_openai:
+        mock_client = MagicMock()
+        mock_client.astream = failing_astream
+        mock_chat_openai.return_value = mock_client
+
+        with pytest.raises(RateLimitError):
+            async for _ in provider.stream([LLMMessage(role="user", content="Hi")]):
+                pass
+
+
+def _openai_status_error(error_class, status_code, headers=None, body=None):
+    import httpx
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return error_class("API error", response=response, body=body)
+
+
+def test_map_error_uses_typed_rate_limit_headers(provider):
+    """Test that typed rate limit errors take retry_after from headers."""
+    import openai
+
+    from src.question.providers.base import AuthenticationError, RateLimitError
+
+    error = provider._map_error(
+        _openai_status_error(openai.RateLimitError, 429, {"retry-after-ms": "1500"})
+    )
+    assert isinstance(error, RateLimitError)
+    assert error.retry_after == 1.5
+
+    error = provider._map_error(
+        _openai_status_error(
+            openai.RateLimitError,
+            429,
+            {
+                "x-ratelimit-remaining-requests": "10",
+                "x-ratelimit-reset-requests": "1s",
+                "x-ratelimit-remaining-tokens": "0",
+                "x-ratelimit-reset-tokens": "6m0.5s",
+            },
+        )
+    )
+    assert error.retry_after == 360.5
+
+    quota = provider._map_error(
+        _openai_status_error(
+            openai.RateLimitError,
+            429,
+            body={"code": "insufficient_quota", "message": "quota"},
+        )
+    )
+    assert isinstance(quota, AuthenticationError)
+
+
+def test_map_error_classifies_typed_openai_errors(provider):
+    """Test status-based classification of OpenAI SDK exceptions."""
+    import httpx
+    import openai
+
+    from src.question.providers.base import AuthenticationError, ModelNotFoundError
+
+    assert isinstance(
+        provider._map_error(_openai_status_error(openai.AuthenticationError, 401)),
+        AuthenticationError,
+    )
+    assert isinstance(
+        provider._map_error(_openai_status_error(openai.NotFoundError, 404)),
+        ModelNotFoundError,
+    )
+
+    server_error = provider._map_error(
+        _openai_status_error(openai.InternalServerError, 503)
+    )
+    assert server_error.retryable
+    assert server_error.error_code == "temporary_error"
+
+    timeout = provider._map_error(
+        openai.APITimeoutError(request=httpx.Request("POST", "https://example.com"))
+    )
+    assert timeout.retryable
+
+    bad_request = provider._map_error(_openai_status_error(openai.BadRequestError, 400))
+    assert not bad_request.retryable
+    assert bad_request.error_code == "unknown_error"
+
+
+def test_cached_tokens_from_usage():
+    """Test reading prompt cache hits from API and LangChain usage."""
+    from src.question.providers.openai_provider import cached_tokens_from_usage
+
+    assert (
+        cached_tokens_from_usage(
+            {"prompt_tokens": 2048, "prompt_tokens_details": {"cached_tokens": 1920}}
+        )
+        == 1920
+    )
+    assert (
+        cached_tokens_from_usage(
+            {"input_tokens": 2048, "input_token_details": {"cache_read": 1024}}
+        )
+        == 1024
+    )
+    assert cached_tokens_from_usage({"prompt_tokens": 20}) is None
+    assert cached_tokens_from_usage(None) is None
+
+
+@pytest.mark.asyncio
+async def test_generate_sends_response_schema_and_falls_back(provider):
+    """Test strict structured output and the fallback when a model rejects it."""
+    from unittest.mock import AsyncMock
+
+    import openai
+
+    from src.question.providers.base import LLMMessage
+
+    schema = {
+        "title": "true_false_batch",
+        "type": "object",
+        "properties": {"questions": {"type": "array", "items": {"type": "object"}}},
+        "required": ["questions"],
+        "additionalProperties": False,
+    }
+    mock_response = MagicMock()
+    mock_response.content = '{"questions": []}'
+    mock_response.usage = DEFAULT_OPENAI_RESPONSE["usage"]
+    messages = [LLMMessage(role="user", content="Generate questions")]
+
+    with patch("src.question.providers.openai_provider.ChatOpenAI") as mock_chat_openai:
+        mock_client = AsyncMock()
+        mock_client.ainvoke.return_value = mock_response
+        mock_chat_openai.return_value = mock_client
+
+        assert provider.supports_structured_output
+        response = await provider.generate(messages, response_schema=schema)
+
+        response_format = mock_client.ainvoke.call_args.kwargs["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["name"] == "true_false_batch"
+        assert response_format["json_schema"]["strict"] is True
+        assert "title" not in response_format["json_schema"]["schema"]
+        assert response.metadata["structured_output"] is True
+        assert "response_schema" not in response.metadata
+
+        mock_client.ainvoke.reset_mock()
+        mock_client.ainvoke.side_effect = [
+            _openai_status_error(
+                openai.BadRequestError,
+                400,
+                body={
+                    "message": "Invalid schema for response_format",
+                    "param": "response_format",
+                    "code": "invalid_value",
+                },
+            ),
+            mock_response,
+        ]
+        response = await provider.generate(messages, response_schema=schema)
+
+        assert mock_client.ainvoke.call_count == 2
+        assert "response_format" not in mock_client.ainvoke.call_args.kwargs
+        assert response.metadata["structured_output"] is False
+        assert not provider.supports_structured_output
+
+
+@pytest.mark.asyncio
+async def test_generate_raises_bad_requests_unrelated_to_response_schema(provider):
+    """Test that other 400s neither fall back nor disable structured output."""
+    from unittest.mock import AsyncMock
+
+    import openai
+
+    from src.question.providers.base import LLMError, LLMMessage
+
+    schema = {
+        "title": "true_false_batch",
+        "type": "object",
+        "properties": {"questions": {"type": "array", "items": {"type": "object"}}},
+        "required": ["questions"],
+        "additionalProperties": False,
+    }
+    messages = [LLMMessage(role="user", content="Generate questions")]
+
+    with patch("src.question.providers.openai_provider.ChatOpenAI") as mock_chat_openai:
+        mock_client = AsyncMock()
+        mock_client.ainvoke.side_effect = _openai_status_error(
+            openai.BadRequestError,
+            400,
+            body={
+                "message": "This model's maximum context length is 128000 tokens",
+                "param": "messages",
+                "code": "context_length_exceeded",
+            },
+        )
+        mock_chat_openai.return_value = mock_client
+
+        with pytest.raises(LLMError):
+            await provider.generate(messages, response_schema=schema)
+
+        assert mock_client.ainvoke.call_count == 1
+        assert "response_format" in mock_client.ainvoke.call_args.kwargs
+        assert provider.supports_structured_output
@@ -0,0 +1,117 @@
+"""Tests for LLM provider registry instance caching and shared HTTP client."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with only the mock provider registered."""
+    from src.question.providers.base import LLMConfiguration, LLMProvider
+    from src.question.providers.mock_provider import MockProvider
+    from src.question.providers.registry import LLMProviderRegistry
+
+    registry = LLMProviderRegistry()
+    registry._initialized = True
+    registry.register_provider(
+        LLMProvider.MOCK,
+        MockProvider,
+        LLMConfiguration(provider=LLMProvider.MOCK, model="mock-model"),
+    )
+    return registry
+
+
+def test_get_provider_reuses_instance_for_same_configuration(registry):
+    """Test that equal configurations share one cached instance."""
+    from src.question.providers.base import LLMConfiguration, LLMProvider
+
+    first = registry.get_provider(LLMProvider.MOCK)
+    second = registry.get_provider(LLMProvider.MOCK)
+    explicit = registry.get_provider(
+        LLMProvider.MOCK,
+        LLMConfiguration(provider=LLMProvider.MOCK, model="mock-model"),
+    )
+
+    assert first is second
+    assert first is explicit
+
+
+def test_get_provider_creates_instance_for_different_configuration(registry):
+    """Test that any configuration change yields a separate instance."""
+    from src.question.providers.base import LLMConfiguration, LLMProvider
+
+    default = registry.get_provider(LLMProvider.MOCK)
+    warmer = registry.get_provider(
+        LLMProvider.MOCK,
+        LLMConfiguration(
+            provider=LLMProvider.MOCK, model="mock-model", temperature=0.2
+        ),
+    )
+
+    assert default is not warmer
+    assert warmer.configuration.temperature == 0.2
+
+
+def test_idle_instances_are_evicted(registry):
+    """Test that instances unused past the idle timeout are rebuilt."""
+    from src.question.providers.base import LLMProvider
+
+    with patch("src.question.providers.registry.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 1000.0
+        first = registry.get_provider(LLMProvider.MOCK)
+
+        mock_monotonic.return_value = 1000.0 + 10_000
+        second = registry.get_provider(LLMProvider.MOCK)
+
+    assert first is not second
+    assert len(registry._instances) == 1
+
+
+def test_set_default_configuration_drops_cached_instances(registry):
+    """Test that changing the default configuration invalidates cached instances."""
+    from src.question.providers.base import LLMConfiguration, LLMProvider
+
+    first = registry.get_provider(LLMProvider.MOCK)
+    registry.set_default_configuration(
+        LLMProvider.MOCK,
+        LLMConfiguration(provider=LLMProvider.MOCK, model="mock-model"),
+    )
+
+    assert registry.get_provider(LLMProvider.MOCK) is not first
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_reused_and_closed():
+    """Test that the shared HTTP client is pooled and closed on shutdown."""
+    from src.question.providers.http_client import SharedHTTPClient
+
+    shared = SharedHTTPClient()
+    client = shared.get_client()
+
+    assert shared.get_client() is client
+    assert shared.is_open
+
+    await shared.aclose()
+
+    assert client.is_closed
+    assert not shared.is_open
+    assert shared.get_client() is not client
+    await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registry_aclose_clears_instances(registry):
+    """Test that closing the registry drops cached providers and the HTTP client."""
+    from src.question.providers.base import LLMProvider
+    from src.question.providers.http_client import get_shared_http_client
+
+    provider = registry.get_provider(LLMProvider.MOCK)
+    client = get_shared_http_client().get_client()
+
+    with patch.object(provider, "aclose", new=AsyncMock()) as provider_aclose:
+        await registry.aclose()
+
+    provider_aclose.assert_awaited_once()
+    assert registry._instances == {}
+    assert client.is_closed
@@ -0,0 +1,252 @@
+"""Tests for the LLM response cache."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+
+def _response(content: str = "cached content"):
+    from src.question.providers.base import LLMProvider, LLMResponse
+
+    return LLMResponse(
+        content=content,
+        model="mock-model",
+        provider=LLMProvider.MOCK,
+        total_tokens=42,
+        response_time=1.5,
+    )
+
+
+@pytest.fixture
+def mock_provider():
+    """Create a mock provider without retries."""
+    from src.question.providers.base import LLMConfiguration, LLMProvider
+    from src.question.providers.mock_provider import MockProvider
+
+    return MockProvider(
+        LLMConfiguration(provider=LLMProvider.MOCK, model="mock-model", max_retries=0)
+    )
+
+
+@pytest.fixture
+def memory_cache():
+    """Install an in-memory response cache for the duration of a test."""
+    from src.question.providers.cache import (
+        InMemoryCacheBackend,
+        ResponseCache,
+        reset_response_cache,
+        set_response_cache,
+    )
+
+    cache = ResponseCache(InMemoryCacheBackend(max_entries=10), ttl_seconds=60)
+    set_response_cache(cache)
+    yield cache
+    reset_response_cache()
+
+
+def test_cache_key_depends_on_model_temperature_and_messages():
+    """Test that every keyed input changes the cache key."""
+    from src.question.providers.base import LLMMessage
+    from src.question.providers.cache import ResponseCache
+
+    messages = [
+        LLMMessage(role="system", content="system prompt"),
+        LLMMessage(role="user", content="user prompt"),
+    ]
+    key = ResponseCache.make_key("openai", "gpt", 1.0, messages)
+
+    assert key == ResponseCache.make_key("openai", "gpt", 1.0, list(messages))
+    assert key != ResponseCache.make_key("openai", "other", 1.0, messages)
+    assert key != ResponseCache.make_key("openai", "gpt", 0.5, messages)
+    assert key != ResponseCache.make_key(
+        "openai", "gpt", 1.0, [messages[0], LLMMessage(role="user", content="x")]
+    )
+    assert len(key) == 64
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_evicts_least_recently_used():
+    """Test size-based LRU eviction."""
+    from src.question.providers.cache import InMemoryCacheBackend
+
+    backend = InMemoryCacheBackend(max_entries=2)
+    await backend.set("a", {"v": 1}, ttl=60)
+    await backend.set("b", {"v": 2}, ttl=60)
+    await backend.get("a")  # "b" becomes least recently used
+    await backend.set("c", {"v": 3}, ttl=60)
+
+    assert await backend.get("a") == {"v": 1}
+    assert await backend.get("b") is None
+    assert await backend.get("c") == {"v": 3}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_returns_copies():
+    """Test that editing a returned payload leaves the cached entry intact."""
+    from src.question.providers.cache import InMemoryCacheBackend
+
+    backend = InMemoryCacheBackend(max_entries=10)
+    await backend.set("a", {"metadata": {"cached_tokens": 1}}, ttl=60)
+
+    (await backend.get("a"))["metadata"]["cached_tokens"] = 99
+
+    assert await backend.get("a") == {"metadata": {"cached_tokens": 1}}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_expires_entries():
+    """Test TTL-based expiry."""
+    from src.question.providers.cache import InMemoryCacheBackend
+
+    backend = InMemoryCacheBackend(max_entries=10)
+    with patch("src.question.providers.cache.time.time", return_value=1000.0):
+        await backend.set("a", {"v": 1}, ttl=60)
+    with patch("src.question.providers.cache.time.time", return_value=1061.0):
+        assert await backend.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_backend_round_trip_and_eviction(tmp_path):
+    """Test that the disk backend persists entries and enforces its size."""
+    import os
+
+    from src.question.providers.cache import DiskCacheBackend
+
+    backend = DiskCacheBackend(tmp_path / "cache", max_entries=2)
+    await backend.set("a", {"v": 1}, ttl=60)
+    await backend.set("b", {"v": 2}, ttl=60)
+    # Make "a" clearly the oldest file
+    os.utime(tmp_path / "cache" / "a.json", (1, 1))
+    await backend.set("c", {"v": 3}, ttl=60)
+
+    assert await backend.get("a") is None
+    assert await backend.get("b") == {"v": 2}
+
+    reopened = DiskCacheBackend(tmp_path / "cache", max_entries=2)
+    assert await reopened.get("c") == {"v": 3}
+
+    await reopened.delete("c")
+    assert await reopened.get("c") is None
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_round_trip(async_session):
+    """Test that the Postgres backend stores, refreshes and deletes entries."""
+    from src.question.providers.cache import PostgresCacheBackend
+
+    @asynccontextmanager
+    async def session_factory():
+        yield async_session
+
+    backend = PostgresCacheBackend(max_entries=10, session_factory=session_factory)
+    await backend.set("key-1", {"model": "mock-model", "content": "a"}, ttl=60)
+    await backend.set("key-1", {"model": "mock-model", "content": "b"}, ttl=60)
+
+    assert await backend.get("key-1") == {"model": "mock-model", "content": "b"}
+
+    await backend.delete("key-1")
+    assert await backend.get("key-1") is None
+
+    await backend.set("key-2", {"model": "mock-model"}, ttl=-1)
+    assert await backend.get("key-2") is None
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_evicts_beyond_max_entries(async_session):
+    """Test that eviction keeps only the most recently used rows."""
+    from sqlmodel import select
+
+    from src.question.providers.cache import (
+        LLMResponseCacheEntry,
+        PostgresCacheBackend,
+    )
+
+    @asynccontextmanager
+    async def session_factory():
+        yield async_session
+
+    backend = PostgresCacheBackend(max_entries=2, session_factory=session_factory)
+    backend.EVICTION_INTERVAL = 1
+    for index in range(4):
+        await backend.set(f"key-{index}", {"model": "mock-model"}, ttl=60)
+
+    result = await async_session.execute(select(LLMResponseCacheEntry.key))
+    assert sorted(result.scalars().all()) == ["key-2", "key-3"]
+
+
+@pytest.mark.asyncio
+async def test_generate_with_retry_serves_identical_requests_from_cache(
+    mock_provider, memory_cache
+):
+    """Test cache hits, per-call bypass and hit/miss counters."""
+    from unittest.mock import AsyncMock
+
+    from src.question.providers.base import LLMMessage
+
+    messages = [LLMMessage(role="user", content="Generate questions")]
+    mock_provider.generate = AsyncMock(return_value=_response())
+
+    first = await mock_provider.generate_with_retry(messages)
+    second = await mock_provider.generate_with_retry(messages)
+    bypassed = await mock_provider.generate_with_retry(messages, cache_bypass=True)
+
+    assert mock_provider.generate.call_count == 2
+    assert second.content == first.content
+    assert second.metadata["cache_hit"] is True
+    assert second.metadata["cache_key"] == first.metadata["cache_key"]
+    assert "cache_hit" not in bypassed.metadata
+
+    stats = memory_cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["writes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_discarded_response_is_regenerated(mock_provider, memory_cache):
+    """Test that rejected responses are not replayed from the cache."""
+    from unittest.mock import AsyncMock
+
+    from src.question.providers.base import LLMMessage
+    from src.question.providers.cache import discard_cached_responses
+
+    messages = [LLMMessage(role="user", content="Generate questions")]
+    mock_provider.generate = AsyncMock(return_value=_response())
+
+    first = await mock_provider.generate_with_retry(messages)
+    await discard_cached_responses([first.metadata["cache_key"]])
+    await mock_provider.generate_with_retry(messages)
+
+    assert mock_provider.generate.call_count == 2
+    assert memory_cache.get_stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_backend_errors_fall_through_to_provider(mock_provider):
+    """Test that a failing backend never fails generation."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.question.providers.base import LLMMessage
+    from src.question.providers.cache import (
+        ResponseCache,
+        reset_response_cache,
+        set_response_cache,
+    )
+
+    backend = MagicMock()
+    backend.get = AsyncMock(side_effect=RuntimeError("backend down"))
+    backend.set = AsyncMock(side_effect=RuntimeError("backend down"))
+    cache = ResponseCache(backend, ttl_seconds=60)
+    set_response_cache(cache)
+    mock_provider.generate = AsyncMock(return_value=_response())
+
+    try:
+        response = await mock_provider.generate_with_retry(
+            [LLMMessage(role="user", content="Hi")]
+        )
+    finally:
+        reset_response_cache()
+
+    assert response.content == "cached content"
+    assert cache.get_stats()["errors"] == 2
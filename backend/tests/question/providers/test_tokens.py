@@ -0,0 +1,95 @@
+"""Tests for token counting used in prompt budgeting."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+class _FakeEncoding:
+    """Whitespace tokenizer standing in for a tiktoken encoding."""
+
+    def encode(self, text, disallowed_special=()):
+        return text.split(" ")
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+def test_heuristic_counter_when_encoding_unavailable():
+    """Test the chars-per-token fallback."""
+    from src.question.providers.base import LLMMessage
+    from src.question.providers.tokens import MESSAGE_OVERHEAD_TOKENS, TokenCounter
+
+    with patch("src.question.providers.tokens._load_encoding", return_value=None):
+        counter = TokenCounter("unknown-model")
+
+    assert not counter.exact
+    assert counter.count("abcdefgh") == 2
+    assert counter.count("abcdefghi") == 3
+    assert counter.truncate("abcdefghij", 2) == "abcdefgh"
+    assert counter.count_messages([LLMMessage(role="user", content="abcd")]) == (
+        1 + MESSAGE_OVERHEAD_TOKENS
+    )
+
+
+def test_encoding_backed_counter_counts_and_truncates():
+    """Test that a loaded encoding is used for counting and truncation."""
+    from src.question.providers.tokens import TokenCounter
+
+    with patch(
+        "src.question.providers.tokens._load_encoding", return_value=_FakeEncoding()
+    ):
+        counter = TokenCounter("gpt-test")
+
+    assert counter.exact
+    assert counter.count("one two three") == 3
+    assert counter.truncate("one two three", 2) == "one two"
+    assert counter.truncate("one two", 5) == "one two"
+    assert counter.truncate("one two", 0) == ""
+
+
+def test_encoding_load_failure_falls_back():
+    """Test that tokenizer download failures do not break counting."""
+    import tiktoken
+
+    from src.question.providers.tokens import TokenCounter
+
+    with patch.object(
+        tiktoken, "encoding_for_model", side_effect=OSError("no network")
+    ):
+        counter = TokenCounter("gpt-test")
+
+    assert not counter.exact
+    assert counter.count("abcd") == 1
+
+
+@pytest.mark.asyncio
+async def test_long_prompts_are_counted_off_the_event_loop():
+    """Test that only long prompts are tokenized in a worker thread."""
+    import asyncio
+
+    from src.question.providers.base import LLMMessage
+    from src.question.providers.tokens import TokenCounter, count_prompt_tokens
+
+    with patch(
+        "src.question.providers.tokens._load_encoding", return_value=_FakeEncoding()
+    ):
+        counter = TokenCounter("gpt-test")
+    short = [LLMMessage(role="user", content="one two")]
+    long = [LLMMessage(role="user", content="one two " * 10)]
+
+    with (
+        patch("src.config.settings.LLM_TOKEN_COUNT_OFFLOAD_CHARS", 50),
+        patch(
+            "src.question.providers.tokens.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as to_thread,
+    ):
+        assert await count_prompt_tokens(counter, short) == (
+            counter.count_messages(short)
+        )
+        assert not to_thread.called
+        assert await count_prompt_tokens(counter, long) == (
+            counter.count_messages(long)
+        )
+        assert to_thread.called
@@ -1296,3 +1296,34 @@ async def test_generate_questions_batch_tracking_preserves_difficulty_metadata(
         # Verify other metadata is also preserved
         assert batch_details["module_1_multiple_choice_easy_5"]["count"] == 5
         assert batch_details["module_1_fill_in_blank_easy_3"]["type"] == "fill_in_blank"
+
+
+@pytest.mark.asyncio
+async def test_record_batch_progress_counts_saved_questions_only(
+    generation_service, mock_quiz
+):
+    """Test that batch progress records the saved count from batch metadata."""
+    with (
+        patch("src.question.services.generation_service.get_async_session"),
+        patch(
+            "src.quiz.service.record_generation_batch", new_callable=AsyncMock
+        ) as mock_record,
+    ):
+        await generation_service._record_batch_progress(
+            mock_quiz.id,
+            "module_1_multiple_choice_5",
+            [MagicMock()] * 5,
+            {"success": True, "questions_saved": 5},
+        )
+        # A batch whose save failed reports no saved questions
+        await generation_service._record_batch_progress(
+            mock_quiz.id,
+            "module_2_multiple_choice_10",
+            [],
+            {"success": False, "questions_saved": 0},
+        )
+
+    assert [call.kwargs for call in mock_record.call_args_list] == [
+        {"success": True, "questions_saved": 5},
+        {"success": False, "questions_saved": 0},
+    ]
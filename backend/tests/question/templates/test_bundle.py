@@ -0,0 +1,98 @@
+"""Tests for the precompiled template bundle."""
+
+import pytest
+
+
+@pytest.fixture
+def templates_dir():
+    """The application's template directory."""
+    from pathlib import Path
+
+    import src.question.templates.manager as manager_module
+
+    return Path(manager_module.__file__).parent / "files"
+
+
+@pytest.mark.asyncio
+async def test_bundle_loads_lazily_and_renders_like_files(templates_dir, tmp_path):
+    """Test that bundled templates load on first use and match the files."""
+    from src.question.templates.bundle import build_bundle
+    from src.question.templates.manager import TemplateManager
+    from src.question.types import GenerationParameters, QuestionType, QuizLanguage
+
+    bundle_path = tmp_path / "templates.bundle"
+    template_count = len(list(templates_dir.glob("*.json")))
+    assert build_bundle(templates_dir, bundle_path) == template_count
+
+    bundled = TemplateManager(
+        str(templates_dir), use_bundle=True, bundle_path=str(bundle_path)
+    )
+    from_files = TemplateManager(str(templates_dir), use_bundle=False)
+    bundled.initialize()
+
+    assert bundled._template_cache == {}
+    assert set(bundled._bundle.names(QuestionType.MATCHING)) == {
+        "batch_matching",
+        "batch_matching_no",
+    }
+
+    parameters = GenerationParameters(target_count=4, language=QuizLanguage.NORWEGIAN)
+    content = "Fotosyntese omdanner lys til kjemisk energi. " * 10
+    messages = await bundled.create_messages(
+        QuestionType.TRUE_FALSE, content, parameters, language=QuizLanguage.NORWEGIAN
+    )
+
+    assert set(bundled._template_cache) == {"batch_true_false_no"}
+    assert messages == await from_files.create_messages(
+        QuestionType.TRUE_FALSE, content, parameters, language=QuizLanguage.NORWEGIAN
+    )
+    assert len(bundled.list_templates()) == len(from_files.list_templates())
+
+
+def test_unusable_bundle_falls_back_to_template_files(templates_dir, tmp_path):
+    """Test that a corrupt bundle is ignored in favour of the template files."""
+    from src.question.templates.manager import TemplateManager
+    from src.question.types import QuestionType
+
+    bundle_path = tmp_path / "templates.bundle"
+    bundle_path.write_bytes(b"not a bundle")
+
+    manager = TemplateManager(
+        str(templates_dir), use_bundle=True, bundle_path=str(bundle_path)
+    )
+    manager.initialize()
+
+    assert manager._bundle is None
+    assert manager.get_template(QuestionType.MULTIPLE_CHOICE).name == (
+        "batch_multiple_choice"
+    )
+
+
+def test_stale_bundle_falls_back_to_template_files(templates_dir, tmp_path):
+    """Test that a bundle is ignored once a template file changes."""
+    import json
+    import shutil
+
+    from src.question.templates.bundle import build_bundle
+    from src.question.templates.manager import TemplateManager
+    from src.question.types import QuestionType
+
+    local_templates = tmp_path / "files"
+    shutil.copytree(templates_dir, local_templates)
+    bundle_path = tmp_path / "templates.bundle"
+    build_bundle(local_templates, bundle_path)
+
+    template_file = local_templates / "batch_multiple_choice.json"
+    data = json.loads(template_file.read_text(encoding="utf-8"))
+    data["description"] = "Edited after the bundle was built"
+    template_file.write_text(json.dumps(data), encoding="utf-8")
+
+    manager = TemplateManager(
+        str(local_templates), use_bundle=True, bundle_path=str(bundle_path)
+    )
+    manager.initialize()
+
+    assert manager._bundle is None
+    assert manager.get_template(QuestionType.MULTIPLE_CHOICE).description == (
+        "Edited after the bundle was built"
+    )
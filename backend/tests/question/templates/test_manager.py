@@ -360,3 +360,246 @@ async def test_create_messages_without_tone_defaults_gracefully(template_manager
     assert messages[0].role == "system"
     assert messages[1].role == "user"
     assert "3" in messages[1].content
+
+
+@pytest.mark.asyncio
+async def test_create_messages_enforces_max_content_length(template_manager):
+    """Test that content beyond the template's max_content_length is truncated."""
+    from src.question.types import GenerationParameters, QuestionType, QuizLanguage
+
+    template = template_manager.get_template(QuestionType.MULTIPLE_CHOICE)
+    template.max_content_length = 200
+    content = "Short paragraph. " * 10 + "\n\n" + "x" * 500
+
+    messages = await template_manager.create_messages(
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        content=content,
+        generation_parameters=GenerationParameters(
+            target_count=5, language=QuizLanguage.ENGLISH
+        ),
+    )
+
+    assert "x" * 100 not in messages[1].content
+    assert "Short paragraph." in messages[1].content
+
+
+@pytest.mark.asyncio
+async def test_prefix_cache_layout_shares_prefix_across_batches():
+    """Test that every batch for a module renders a byte-identical prefix."""
+    import hashlib
+
+    from src.question.templates.manager import PromptLayout, TemplateManager
+    from src.question.types import (
+        GenerationParameters,
+        QuestionDifficulty,
+        QuestionType,
+        QuizLanguage,
+    )
+
+    content = "## Photosynthesis\nPlants convert light into chemical energy. " * 20
+
+    async def render(layout, question_type, difficulty, count):
+        manager = TemplateManager(layout=layout)
+        return await manager.create_messages(
+            question_type=question_type,
+            content=content,
+            generation_parameters=GenerationParameters(
+                target_count=count,
+                difficulty=difficulty,
+                language=QuizLanguage.ENGLISH,
+            ),
+            extra_variables={
+                "module_name": "Biology",
+                "question_count": count,
+                "tone": "academic",
+            },
+        )
+
+    batches = [
+        (QuestionType.MULTIPLE_CHOICE, QuestionDifficulty.EASY, 10),
+        (QuestionType.MULTIPLE_CHOICE, QuestionDifficulty.HARD, 4),
+        (QuestionType.TRUE_FALSE, QuestionDifficulty.MEDIUM, 7),
+        (QuestionType.FILL_IN_BLANK, None, 3),
+    ]
+
+    def prefix_hashes(rendered):
+        return {
+            hashlib.sha256(messages[0].content.encode()).hexdigest()
+            for messages in rendered
+        }
+
+    cached = [await render(PromptLayout.PREFIX_CACHE, *batch) for batch in batches]
+    standard = [await render(PromptLayout.STANDARD, *batch) for batch in batches]
+
+    assert len(prefix_hashes(cached)) == 1
+    assert len(prefix_hashes(standard)) > 1
+    assert content in cached[0][0].content
+    assert all(content not in messages[1].content for messages in cached)
+    assert "EXACTLY 10" in cached[0][1].content
+    assert "Biology" in cached[0][1].content
+
+
+@pytest.mark.asyncio
+async def test_create_messages_renders_precompiled_templates(template_manager):
+    """Test that rendering reuses templates compiled at load time."""
+    from unittest.mock import patch
+
+    from src.question.types import GenerationParameters, QuestionType, QuizLanguage
+
+    assert ("batch_multiple_choice", "1.0") in template_manager._jinja_cache
+
+    with patch.object(
+        template_manager.jinja_env,
+        "from_string",
+        side_effect=AssertionError("template recompiled"),
+    ):
+        for _ in range(3):
+            messages = await template_manager.create_messages(
+                question_type=QuestionType.MULTIPLE_CHOICE,
+                content="Precompiled content",
+                generation_parameters=GenerationParameters(
+                    target_count=5, language=QuizLanguage.ENGLISH
+                ),
+            )
+
+    assert messages[0].content == "Generate MCQ questions from Precompiled content"
+
+
+def test_save_and_delete_invalidate_compiled_templates(template_manager):
+    """Test that saving a new version replaces and deleting drops compiled prompts."""
+    from src.question.templates.manager import PromptTemplate
+    from src.question.types import QuestionType
+
+    template = template_manager.get_template(QuestionType.MULTIPLE_CHOICE)
+    updated = PromptTemplate(
+        **{
+            **template.model_dump(),
+            "version": "2.0",
+            "system_prompt": "Updated {{ module_content }}",
+        }
+    )
+
+    template_manager.save_template(updated)
+
+    system_template, _ = template_manager._jinja_cache[("batch_multiple_choice", "2.0")]
+    assert ("batch_multiple_choice", "1.0") not in template_manager._jinja_cache
+    assert system_template.render(module_content="x") == "Updated x"
+
+    template_manager.delete_template("batch_multiple_choice")
+
+    assert not any(
+        name == "batch_multiple_choice" for name, _ in template_manager._jinja_cache
+    )
+
+
+def test_hot_reload_picks_up_modified_template_files(tmp_path):
+    """Test that hot reload recompiles templates whose file mtime changed."""
+    import os
+
+    from src.question.templates.manager import TemplateManager
+    from src.question.types import QuestionType
+
+    template_data = {
+        "name": "batch_true_false",
+        "question_type": "true_false",
+        "system_prompt": "Original {{ module_content }}",
+        "user_prompt": "Create {{ target_count }} questions",
+    }
+    filepath = tmp_path / "batch_true_false.json"
+    filepath.write_text(json.dumps(template_data))
+
+    manager = TemplateManager(str(tmp_path), hot_reload=True)
+    assert manager.get_template(QuestionType.TRUE_FALSE).system_prompt.startswith(
+        "Original"
+    )
+
+    filepath.write_text(
+        json.dumps({**template_data, "system_prompt": "Edited {{ module_content }}"})
+    )
+    stat = filepath.stat()
+    os.utime(filepath, (stat.st_atime, stat.st_mtime + 10))
+
+    template = manager.get_template(QuestionType.TRUE_FALSE)
+
+    assert template.system_prompt.startswith("Edited")
+    system_template, _ = manager._jinja_cache[("batch_true_false", "1.0")]
+    assert system_template.render(module_content="x") == "Edited x"
+
+
+@pytest.mark.asyncio
+async def test_static_fragments_match_full_render(tmp_path):
+    """Test that spliced static fragments render exactly like the full template."""
+    from src.question.templates.manager import PromptTemplate, TemplateManager
+    from src.question.types import GenerationParameters, QuestionType, QuizLanguage
+
+    spliced = TemplateManager(str(tmp_path), static_fragments=True)
+    full = TemplateManager(str(tmp_path), static_fragments=False)
+    for manager in (spliced, full):
+        manager.save_template(
+            PromptTemplate(
+                name="batch_true_false",
+                question_type=QuestionType.TRUE_FALSE,
+                system_prompt=(
+                    "{% if tone == 'casual' %}Relaxed{% else %}Formal{% endif %} "
+                    "questions from {{ module_content }} and again {{ module_content }}"
+                ),
+                user_prompt="Content in capitals: {{ module_content | upper }}",
+            )
+        )
+
+    async def render(manager, content, tone):
+        return await manager.create_messages(
+            question_type=QuestionType.TRUE_FALSE,
+            content=content,
+            generation_parameters=GenerationParameters(
+                target_count=3, language=QuizLanguage.ENGLISH
+            ),
+            extra_variables={"tone": tone},
+        )
+
+    for content, tone in [("alpha", "casual"), ("beta {{ x }}", "casual"), ("y", "")]:
+        assert await render(spliced, content, tone) == await render(full, content, tone)
+
+    system_fragments = [
+        fragments
+        for key, fragments in spliced._fragment_cache.items()
+        if key[2] == "system"
+    ]
+    user_fragments = [
+        fragments
+        for key, fragments in spliced._fragment_cache.items()
+        if key[2] == "user"
+    ]
+    assert len(system_fragments) == 2
+    assert all(len(fragments) == 3 for fragments in system_fragments)
+    assert user_fragments == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_large_content_is_rendered_in_a_worker_thread(template_manager):
+    """Test that renders above the offload threshold leave the event loop."""
+    import asyncio
+    from unittest.mock import patch
+
+    from src.question.types import GenerationParameters, QuestionType, QuizLanguage
+
+    parameters = GenerationParameters(target_count=2, language=QuizLanguage.ENGLISH)
+
+    with (
+        patch("src.config.settings.TEMPLATE_RENDER_OFFLOAD_CHARS", 1000),
+        patch(
+            "src.question.templates.manager.asyncio.to_thread",
+            side_effect=asyncio.to_thread,
+        ) as to_thread,
+    ):
+        await template_manager.create_messages(
+            QuestionType.MULTIPLE_CHOICE, "short", parameters
+        )
+        assert to_thread.call_count == 0
+
+        messages = await template_manager.create_messages(
+            QuestionType.MULTIPLE_CHOICE, "x" * 2000, parameters
+        )
+        assert to_thread.call_count == 1
+
+    assert "x" * 2000 in messages[1].content
@@ -44,6 +44,7 @@ async def test_save_questions_success(async_session):
 
     mock_question_impl = MagicMock()
     mock_question_impl.validate_data.return_value = mock_question_data
+    mock_question_impl.validation_engine.stamp_for.return_value = "stamp"
 
     mock_registry = MagicMock()
     mock_registry.get_question_type.return_value = mock_question_impl
@@ -493,6 +494,100 @@ async def test_update_question_success(async_session):
     assert result.updated_at is not None
 
 
+@pytest.mark.asyncio
+async def test_update_question_restamps_question_data(async_session):
+    """Test that updated question data is revalidated and restamped."""
+    from src.question.models import QuestionType
+    from src.question.service import update_question
+    from src.question.types import get_question_type_registry
+    from tests.conftest import create_question_in_async_session
+
+    engine = (
+        get_question_type_registry()
+        .get_question_type(QuestionType.MULTIPLE_CHOICE)
+        .validation_engine
+    )
+    valid_data = {
+        "question_text": "What is the capital of France?",
+        "option_a": "Paris",
+        "option_b": "London",
+        "option_c": "Berlin",
+        "option_d": "Madrid",
+        "correct_answer": "A",
+        "explanation": None,
+    }
+    question = await create_question_in_async_session(
+        async_session, question_data=valid_data, validation_stamp="stale"
+    )
+
+    updated_data = {**valid_data, "correct_answer": "B"}
+    result = await update_question(
+        async_session, question.id, {"question_data": updated_data}
+    )
+    assert result.validation_stamp == engine.stamp_for(engine.validate(updated_data))
+
+    result = await update_question(
+        async_session, question.id, {"question_data": {"question_text": "Invalid"}}
+    )
+    assert result.validation_stamp is None
+
+
+@pytest.mark.asyncio
+async def test_restamp_questions(async_session):
+    """Test that unstamped and stale questions are validated and stamped."""
+    from src.question.models import Question, QuestionType
+    from src.question.service import restamp_questions
+    from src.question.types import get_question_type_registry
+    from tests.conftest import create_question_in_async_session
+
+    engine = (
+        get_question_type_registry()
+        .get_question_type(QuestionType.TRUE_FALSE)
+        .validation_engine
+    )
+    valid_data = {
+        "question_text": "Paris is the capital of France.",
+        "correct_answer": True,
+        "explanation": None,
+    }
+    unstamped = await create_question_in_async_session(
+        async_session, question_type=QuestionType.TRUE_FALSE, question_data=valid_data
+    )
+    stale = await create_question_in_async_session(
+        async_session,
+        question_type=QuestionType.TRUE_FALSE,
+        question_data=valid_data,
+        validation_stamp="true_false:0",
+    )
+    # Stamps without a content digest were written by an earlier version
+    undigested = await create_question_in_async_session(
+        async_session,
+        question_type=QuestionType.TRUE_FALSE,
+        question_data=valid_data,
+        validation_stamp=engine.stamp,
+    )
+    invalid = await create_question_in_async_session(
+        async_session,
+        question_type=QuestionType.TRUE_FALSE,
+        question_data={"question_text": "Missing answer"},
+    )
+    unstamped_id, stale_id, invalid_id = unstamped.id, stale.id, invalid.id
+    undigested_id = undigested.id
+
+    assert await restamp_questions(async_session, batch_size=1) >= 3
+    stamp = engine.stamp_for(engine.validate(valid_data))
+
+    async_session.expire_all()
+    for question_id, expected in (
+        (unstamped_id, stamp),
+        (stale_id, stamp),
+        (undigested_id, stamp),
+        (invalid_id, None),
+    ):
+        question = await async_session.get(Question, question_id)
+        assert question.validation_stamp == expected
+
+
 @pytest.mark.asyncio
 async def test_update_question_not_found(async_session):
     """Test question update when question not found."""
@@ -781,6 +876,7 @@ async def test_question_lifecycle_save_to_export(async_session):
         mock_data.dict.return_value = {"validated": "data"}
         mock_impl = MagicMock()
         mock_impl.validate_data.return_value = mock_data
+        mock_impl.validation_engine.stamp_for.return_value = "stamp"
         mock_registry.return_value.get_question_type.return_value = mock_impl
 
         save_result = await save_questions(
@@ -924,6 +1020,7 @@ async def test_save_questions_with_norwegian_validation(async_session):
 
     mock_question_impl = MagicMock()
     mock_question_impl.validate_data.return_value = mock_question_data
+    mock_question_impl.validation_engine.stamp_for.return_value = "stamp"
 
     mock_registry = MagicMock()
     mock_registry.get_question_type.return_value = mock_question_impl
@@ -1528,3 +1625,56 @@ async def test_unapprove_question_updates_timestamp(async_session):
     assert updated_question.updated_at > old_updated_at
     assert updated_question.is_approved is False
     assert updated_question.approved_at is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("copy_threshold", [5_000, 1])
+async def test_bulk_insert_questions_matches_orm_insert(async_session, copy_threshold):
+    """Test that INSERT and COPY bulk paths store the same rows as session.add."""
+    from sqlmodel import select
+
+    from src.question.models import Question, QuestionDifficulty, QuestionType
+    from src.question.service import bulk_insert_questions
+    from tests.conftest import create_quiz_in_async_session
+
+    quiz = await create_quiz_in_async_session(async_session)
+    quiz_id = quiz.id
+
+    def make_question(text):
+        return Question(
+            quiz_id=quiz_id,
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            question_data={**DEFAULT_MCQ_DATA, "question_text": text},
+            difficulty=QuestionDifficulty.HARD,
+            tags=["bulk"],
+            is_approved=False,
+        )
+
+    orm_question = make_question("Added one by one")
+    async_session.add(orm_question)
+    bulk_questions = [make_question(f"Bulk question {n}") for n in range(3)]
+
+    with patch("src.question.service.BULK_INSERT_COPY_THRESHOLD", copy_threshold):
+        question_ids = await bulk_insert_questions(async_session, bulk_questions)
+    await async_session.commit()
+
+    assert question_ids == [question.id for question in bulk_questions]
+
+    result = await async_session.execute(
+        select(Question).where(Question.quiz_id == quiz_id)
+    )
+    stored = {question.id: question for question in result.scalars().all()}
+    assert set(stored) == {orm_question.id, *question_ids}
+
+    def columns(question):
+        return {
+            key: value
+            for key, value in question.model_dump().items()
+            if key not in ("id", "question_data", "created_at")
+        }
+
+    reference = stored[orm_question.id]
+    for question, inserted in zip(bulk_questions, question_ids, strict=True):
+        assert stored[inserted].question_data == question.question_data
+        assert columns(stored[inserted]) == columns(reference)
+        assert stored[inserted].created_at is not None
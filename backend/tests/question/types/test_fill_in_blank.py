@@ -875,3 +875,22 @@ def test_validate_blank_tags_match_positions_helper():
     is_valid, message = _validate_blank_tags_match_positions("", [1])
     assert is_valid is False
     assert "Question text is required when blank configurations are provided" in message
+
+
+def test_analyze_blank_tags_single_pass():
+    """Test that one scan finds unique sorted positions and duplicates."""
+    from src.question.types.fill_in_blank import (
+        _analyze_blank_tags,
+        _extract_blank_tags,
+        _find_duplicate_blank_tags,
+    )
+
+    text = "[blank_3] then [BLANK_1], [blank_3] and [blank_2] or [blank_1]"
+
+    positions, duplicates = _analyze_blank_tags(text)
+
+    assert positions == [1, 2, 3]
+    assert duplicates == [3, 1]
+    assert positions == sorted(set(_extract_blank_tags(text)))
+    assert sorted(duplicates) == sorted(_find_duplicate_blank_tags(text))
+    assert _analyze_blank_tags("") == ([], [])
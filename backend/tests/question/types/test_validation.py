@@ -0,0 +1,133 @@
+"""Tests for the question type validation engine."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.question.types import QuestionType
+
+SAMPLE_DATA = {
+    QuestionType.MULTIPLE_CHOICE: {
+        "question_text": "What is the capital of France?",
+        "option_a": "Paris",
+        "option_b": "London",
+        "option_c": "Berlin",
+        "option_d": "Madrid",
+        "correct_answer": "A",
+        "explanation": "Paris is the capital of France.",
+    },
+    QuestionType.TRUE_FALSE: {
+        "question_text": "Paris is the capital of France.",
+        "correct_answer": True,
+    },
+    QuestionType.FILL_IN_BLANK: {
+        "question_text": "The capital of [blank_2] is [blank_1].",
+        "blanks": [
+            {"position": 2, "correct_answer": "France"},
+            {"position": 1, "correct_answer": "Paris", "answer_variations": ["paris"]},
+        ],
+    },
+    QuestionType.MATCHING: {
+        "question_text": "Match countries to their capitals",
+        "pairs": [
+            {"question": "France", "answer": "Paris"},
+            {"question": "Germany", "answer": "Berlin"},
+            {"question": "Italy", "answer": "Rome"},
+        ],
+        "distractors": ["Madrid"],
+    },
+    QuestionType.CATEGORIZATION: {
+        "question_text": "Categorize these animals",
+        "categories": [
+            {"name": "Mammals", "correct_items": ["item1", "item2"]},
+            {"name": "Birds", "correct_items": ["item3", "item4"]},
+        ],
+        "items": [
+            {"id": "item1", "text": "Dolphin"},
+            {"id": "item2", "text": "Elephant"},
+            {"id": "item3", "text": "Eagle"},
+            {"id": "item4", "text": "Penguin"},
+        ],
+        "distractors": [{"id": "item5", "text": "Shark"}],
+    },
+}
+
+
+def _engine(question_type):
+    from src.question.types.registry import get_question_type_registry
+
+    return (
+        get_question_type_registry().get_question_type(question_type).validation_engine
+    )
+
+
+@pytest.mark.parametrize("question_type", list(QuestionType))
+def test_stamped_data_loads_like_full_validation(question_type):
+    """Test that trusted loads of validated data equal full validation."""
+    from unittest.mock import patch
+
+    engine = _engine(question_type)
+    validated = engine.validate(SAMPLE_DATA[question_type])
+
+    # JSONB returns keys in its own order
+    stored = dict(reversed(list(validated.model_dump().items())))
+    with patch.object(engine, "validate", wraps=engine.validate) as validate:
+        loaded = engine.load(stored, engine.stamp_for(validated))
+
+    assert validate.called != engine.question_type_impl.trusted_validators
+
+    assert loaded == validated
+    assert loaded.model_dump() == validated.model_dump()
+    assert engine.question_type_impl.format_for_display(loaded) == (
+        engine.question_type_impl.format_for_display(validated)
+    )
+
+
+def test_unstamped_or_stale_data_is_fully_validated():
+    """Test that data without the current stamp runs the validators."""
+    from src.question.types.validation import TRUSTED_CONTEXT
+
+    engine = _engine(QuestionType.FILL_IN_BLANK)
+    invalid = {
+        "question_text": "The capital of [blank_1] is [blank_1].",
+        "blanks": [{"position": 1, "correct_answer": "France"}],
+    }
+
+    for stamp in (None, "fill_in_blank:0", engine.stamp):
+        with pytest.raises(ValidationError):
+            engine.load(invalid, stamp)
+
+    # A matching stamp is trusted as is, so stamped data skips the tag checks
+    stamp = engine.stamp_for(
+        engine._adapter.validate_python(invalid, context=TRUSTED_CONTEXT)
+    )
+    assert stamp.startswith("fill_in_blank:1:")
+    assert engine.load(invalid, stamp).blanks[0].correct_answer == "France"
+
+
+def test_data_changed_after_stamping_is_fully_validated():
+    """Test that the stamp only trusts the exact data it was made for."""
+    engine = _engine(QuestionType.FILL_IN_BLANK)
+    validated = engine.validate(SAMPLE_DATA[QuestionType.FILL_IN_BLANK])
+    stored = validated.model_dump()
+    stamp = engine.stamp_for(validated)
+
+    # In-place edits, or edits made outside the ORM, keep the old stamp
+    stored["blanks"][0]["position"] = 7
+    with pytest.raises(ValidationError):
+        engine.load(stored, stamp)
+
+
+def test_stamp_if_valid_only_stamps_normalized_data():
+    """Test that data changed by validation or invalid data is not stamped."""
+    engine = _engine(QuestionType.FILL_IN_BLANK)
+    stored = engine.validate(SAMPLE_DATA[QuestionType.FILL_IN_BLANK]).model_dump()
+
+    assert engine.stamp_if_valid(stored) == engine.stamp_for(engine.validate(stored))
+    assert engine.stamp_if_valid({**stored, "question_text": "No blanks."}) is None
+    unnormalized = {
+        **stored,
+        "blanks": [
+            {**blank, "answer_variations": [" paris "]} for blank in stored["blanks"]
+        ],
+    }
+    assert engine.stamp_if_valid(unnormalized) is None
@@ -0,0 +1,66 @@
+"""Tests for module content chunking."""
+
+
+def _page(title: str, paragraphs: int, text: str = "Sentence about the topic. ") -> str:
+    body = "\n\n".join([text * 10] * paragraphs)
+    return f"## {title}\n{body}"
+
+
+def test_split_sections_on_page_headings():
+    """Test that content is split at each page heading."""
+    from src.question.workflows.chunking import split_sections
+
+    content = "Intro text\n\n" + _page("First", 1) + "\n\n" + _page("Second", 1)
+
+    sections = split_sections(content)
+
+    assert [section.title for section in sections] == [None, "First", "Second"]
+    assert sections[1].content.startswith("## First\n")
+    assert "## Second" not in sections[1].content
+
+
+def test_chunk_module_content_packs_pages_within_limit():
+    """Test that small pages are packed and every chunk fits the limit."""
+    from src.question.workflows.chunking import chunk_module_content
+
+    pages = [_page(f"Page {index}", 2) for index in range(6)]
+    content = "\n\n".join(pages)
+    max_chunk_chars = len(pages[0]) * 2 + 10
+
+    chunks = chunk_module_content(content, max_chunk_chars)
+
+    assert len(chunks) == 3
+    assert all(len(chunk.content) <= max_chunk_chars for chunk in chunks)
+    assert [chunk.title for chunk in chunks] == ["Page 0", "Page 2", "Page 4"]
+    assert chunk_module_content(content, len(content)) == [
+        chunks[0].__class__(title=None, content=content)
+    ]
+
+
+def test_oversized_page_is_split_with_heading_repeated():
+    """Test that a page longer than the limit is split on paragraphs."""
+    from src.question.workflows.chunking import chunk_module_content
+
+    content = _page("Long Page", 8)
+
+    chunks = chunk_module_content(content, 1000)
+
+    assert len(chunks) > 1
+    assert all(chunk.content.startswith("## Long Page\n") for chunk in chunks)
+    assert all(len(chunk.content) <= 1000 for chunk in chunks)
+
+
+def test_allocate_questions_is_proportional_and_exact():
+    """Test largest-remainder allocation across chunks."""
+    from src.question.workflows.chunking import ContentChunk, allocate_questions
+
+    chunks = [
+        ContentChunk("a", "x" * 600),
+        ContentChunk("b", "x" * 300),
+        ContentChunk("c", "x" * 100),
+    ]
+
+    assert allocate_questions(chunks, 10) == [6, 3, 1]
+    assert allocate_questions(chunks, 4) == [2, 1, 1]
+    assert sum(allocate_questions(chunks, 7)) == 7
+    assert allocate_questions(chunks, 0) == [0, 0, 0]
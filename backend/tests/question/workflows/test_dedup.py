@@ -0,0 +1,79 @@
+"""Tests for near-duplicate question detection."""
+
+import random
+import time
+from uuid import uuid4
+
+
+def _mcq(question_text: str, correct: str = "Mitochondria"):
+    from src.question.types import Question, QuestionType
+
+    return Question(
+        quiz_id=uuid4(),
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        question_data={
+            "question_text": question_text,
+            "option_a": correct,
+            "option_b": "Ribosome",
+            "option_c": "Nucleus",
+            "option_d": "Golgi apparatus",
+            "correct_answer": "A",
+            "explanation": "Explained.",
+        },
+        is_approved=False,
+    )
+
+
+def test_index_rejects_paraphrases_and_accepts_distinct_questions():
+    """Test that rephrasings of an indexed question are rejected."""
+    from src.question.workflows.dedup import QuestionDedupIndex
+
+    index = QuestionDedupIndex()
+    original = _mcq("Which organelle produces most of the ATP in a cell?")
+
+    assert index.check_and_add(original)
+    assert not index.check_and_add(
+        _mcq("Which organelle produces most of the ATP in the cell?")
+    )
+    assert index.check_and_add(
+        _mcq("Where in the cell does protein synthesis happen?", "Ribosome")
+    )
+    assert index.get_stats() == {"checks": 3, "duplicates": 1, "indexed": 2}
+
+    duplicate = index.find_duplicate(
+        _mcq("Which organelle produces most ATP in a cell?")
+    )
+    assert duplicate is not None
+    assert duplicate[0] == original.id
+
+    index.discard(original)
+    assert index.find_duplicate(original) is None
+    assert len(index) == 1
+
+
+def test_index_checks_stay_fast_with_thousands_of_questions():
+    """Test that checks only compare against bucketed candidates."""
+    from src.question.workflows.dedup import QuestionDedupIndex
+
+    rng = random.Random(7)
+    vocabulary = [f"term{number}" for number in range(2000)]
+
+    def random_question():
+        words = " ".join(rng.sample(vocabulary, 8))
+        return _mcq(
+            f"Which of the following describes {words}?", rng.choice(vocabulary)
+        )
+
+    index = QuestionDedupIndex()
+    questions = [random_question() for _ in range(3000)]
+    for question in questions:
+        index.add(question)
+
+    probes = [random_question() for _ in range(200)]
+    start = time.perf_counter()
+    results = [index.check_and_add(probe) for probe in probes]
+    per_check = (time.perf_counter() - start) / len(probes)
+
+    assert all(results)
+    assert per_check < 0.005
+    assert index.find_duplicate(questions[42]) is not None
@@ -0,0 +1,96 @@
+"""Tests for deterministic JSON response repair."""
+
+import json
+
+import pytest
+
+QUESTIONS = [
+    {"question_text": "What is 2 + 2?", "correct_answer": "B"},
+    {"question_text": "Which [bracket] is {this}?", "correct_answer": "A"},
+    {"question_text": "Last one?", "correct_answer": "C"},
+]
+
+
+@pytest.mark.parametrize(
+    "response,strategy,expected",
+    [
+        (
+            "Here are your questions:\n" + json.dumps(QUESTIONS) + "\nGood luck!",
+            "extracted",
+            QUESTIONS,
+        ),
+        (json.dumps(QUESTIONS)[:-1] + ",]", "normalised", QUESTIONS),
+        (
+            '[{“question_text”: “Why is the “sky” blue?”, "correct_answer": "A",}]',
+            "normalised",
+            [{"question_text": "Why is the “sky” blue?", "correct_answer": "A"}],
+        ),
+        (
+            '[{"question_text": "Line one\nline two", "correct_answer": "D"}]',
+            "normalised",
+            [{"question_text": "Line one\nline two", "correct_answer": "D"}],
+        ),
+        (json.dumps(QUESTIONS)[:-1] + ",", "balanced", QUESTIONS),
+        (
+            json.dumps(QUESTIONS)[:-20],
+            "prefix",
+            QUESTIONS[:2],
+        ),
+        (
+            json.dumps(QUESTIONS[:1])[:-1]
+            + ', {"question_text": oops}, '
+            + json.dumps(QUESTIONS[1:])[1:],
+            "salvaged",
+            [QUESTIONS[0], *QUESTIONS[1:]],
+        ),
+    ],
+)
+def test_repair_json_array_strategies(response, strategy, expected):
+    """Test that each class of mechanical damage is repaired by its stage."""
+    from src.question.workflows.json_repair import repair_json_array
+
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(response)
+
+    result = repair_json_array(response)
+
+    assert result is not None
+    assert result.strategy == strategy
+    assert result.data == expected
+
+
+def test_repair_json_array_drops_truncated_final_element():
+    """Test that an element cut off mid-object is dropped, not closed."""
+    from src.question.workflows.json_repair import repair_json_array
+
+    for response in (
+        json.dumps(QUESTIONS)[:-2],
+        json.dumps(QUESTIONS[:2])[:-1] + ', {"question_text": "Q3", "option_a": "x",',
+    ):
+        result = repair_json_array(response)
+
+        assert result is not None
+        assert result.strategy == "prefix"
+        assert result.data == QUESTIONS[:2]
+        assert result.dropped_elements == 1
+
+
+def test_repair_json_array_gives_up_and_counts():
+    """Test that unrecoverable responses return None and stats are tracked."""
+    from src.question.workflows.json_repair import (
+        get_repair_stats,
+        repair_json_array,
+        reset_repair_stats,
+    )
+
+    reset_repair_stats()
+
+    assert repair_json_array("I cannot generate questions for this.") is None
+    assert repair_json_array('There are [3] questions: [{"question_text":') is None
+    assert repair_json_array(json.dumps(QUESTIONS) + ",") is not None
+
+    stats = get_repair_stats()
+    assert stats["attempts"] == 3
+    assert stats["failed"] == 2
+    assert stats["repaired"] == 1
+    reset_repair_stats()
@@ -0,0 +1,65 @@
+"""Tests for incremental JSON array parsing."""
+
+import json
+
+
+def _feed_in_chunks(parser, text: str, size: int) -> list:
+    objects = []
+    for start in range(0, len(text), size):
+        objects.extend(parser.feed(text[start : start + size]))
+    return objects
+
+
+def test_parser_yields_objects_as_they_complete():
+    """Test that each object is returned by the chunk that closes it."""
+    from src.question.workflows.json_stream import IncrementalJSONArrayParser
+
+    parser = IncrementalJSONArrayParser()
+
+    assert parser.feed('[{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(": [1, 2]}") == [{"b": [1, 2]}]
+    assert not parser.finished
+    assert parser.feed("]") == []
+    assert parser.finished
+    assert parser.objects_parsed == 2
+
+
+def test_parser_handles_strings_with_brackets_and_escapes():
+    """Test that braces, brackets and escaped quotes inside strings are ignored."""
+    from src.question.workflows.json_stream import IncrementalJSONArrayParser
+
+    questions = [
+        {"question_text": 'Use "{" and "}" in [blank_1]', "answer": "a\\b"},
+        {"question_text": "Nested", "options": [{"x": "]"}, {"y": '\\"}'}]},
+        {"question_text": "Unicode ø æ å – ok"},
+    ]
+    text = json.dumps(questions, ensure_ascii=False)
+
+    for size in (1, 3, 7, len(text)):
+        parser = IncrementalJSONArrayParser()
+        assert _feed_in_chunks(parser, text, size) == questions
+        assert parser.finished
+
+
+def test_parser_ignores_code_fences_and_trailing_text():
+    """Test that text outside the array is skipped."""
+    from src.question.workflows.json_stream import IncrementalJSONArrayParser
+
+    parser = IncrementalJSONArrayParser()
+    objects = parser.feed('```json\n[\n  {"a": 1}\n]\n```\nDone {"b": 2}')
+
+    assert objects == [{"a": 1}]
+    assert parser.finished
+
+
+def test_parser_reports_truncated_and_malformed_elements():
+    """Test partial-element tracking and malformed element errors."""
+    from src.question.workflows.json_stream import IncrementalJSONArrayParser
+
+    parser = IncrementalJSONArrayParser()
+    objects = parser.feed('[{"a": 1,}, {"b": 2}, {"c": ')
+
+    assert objects == [{"b": 2}]
+    assert len(parser.errors) == 1
+    assert parser.has_partial_element
+    assert not parser.finished
@@ -629,6 +629,50 @@ async def test_validate_batch_workflow_node(
     assert q1.question_data["correct_answer"] == "C"
 
 
+@pytest.mark.asyncio
+async def test_validate_batch_repairs_json_without_correction(
+    test_llm_provider, test_template_manager, valid_mcq_response
+):
+    """Test that mechanically broken JSON is repaired instead of corrected."""
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    workflow = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+    )
+
+    # Prose around the array, a trailing comma and a truncated final element
+    broken_response = (
+        "Sure! Here are the questions:\n"
+        + valid_mcq_response.rstrip().rstrip("]")
+        + ',\n  {"question_text": "Cut off'
+    )
+
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="test-module",
+        module_name="Test Module",
+        module_content="Test content",
+        target_question_count=5,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        language=QuizLanguage.ENGLISH,
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+        raw_response=broken_response,
+    )
+
+    result = await workflow.validate_batch(state)
+
+    assert result.error_message is None
+    assert result.parsing_error is False
+    assert len(result.generated_questions) == 2
+    assert result.workflow_metadata["json_corrections_avoided"] == 1
+    assert workflow.check_error_type(result) != "needs_json_correction"
+
+
 @pytest.mark.asyncio
 async def test_validate_batch_invalid_json_workflow_node(
     test_llm_provider, test_template_manager
@@ -795,9 +839,12 @@ async def test_process_module_success(test_llm_provider, test_template_manager):
     )
 
     # Mock database operations
-    with patch(
-        "src.question.workflows.module_batch_workflow.get_async_session"
-    ) as mock_session_factory:
+    with (
+        patch(
+            "src.question.workflows.module_batch_workflow.get_async_session"
+        ) as mock_session_factory,
+        patch("src.question.workflows.module_batch_workflow.bulk_insert_questions"),
+    ):
         # Create a mock async context manager for the session
         mock_session = AsyncMock()
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
@@ -868,7 +915,10 @@ async def test_process_module_with_retry(test_llm_provider, test_template_manage
     )
 
     # Mock database operations
-    with patch("src.question.workflows.module_batch_workflow.get_async_session"):
+    with (
+        patch("src.question.workflows.module_batch_workflow.get_async_session"),
+        patch("src.question.workflows.module_batch_workflow.bulk_insert_questions"),
+    ):
         questions = await workflow.process_module(
             quiz_id=uuid4(),
             module_id="123",
@@ -1535,16 +1585,23 @@ async def test_save_questions_combines_preserved_and_new(test_template_manager):
     # Mock database session
     mock_session = AsyncMock()
 
-    with patch(
-        "src.question.workflows.module_batch_workflow.get_async_session"
-    ) as mock_get_session:
+    with (
+        patch(
+            "src.question.workflows.module_batch_workflow.get_async_session"
+        ) as mock_get_session,
+        patch(
+            "src.question.workflows.module_batch_workflow.bulk_insert_questions"
+        ) as mock_bulk_insert,
+    ):
         mock_get_session.return_value.__aenter__.return_value = mock_session
 
         # Execute save_questions
         result_state = await workflow.save_questions(state)
 
-        # Verify all questions were added to session (3 preserved + 2 new = 5 total)
-        assert mock_session.add.call_count == 5
+        # Verify all questions were inserted (3 preserved + 2 new = 5 total)
+        mock_bulk_insert.assert_called_once_with(
+            mock_session, preserved_questions + new_questions
+        )
 
         # Verify commit was called
         mock_session.commit.assert_called_once()
@@ -2044,9 +2101,12 @@ async def test_process_module_with_difficulty_success(
     )
 
     # Mock database operations
-    with patch(
-        "src.question.workflows.module_batch_workflow.get_async_session"
-    ) as mock_session_factory:
+    with (
+        patch(
+            "src.question.workflows.module_batch_workflow.get_async_session"
+        ) as mock_session_factory,
+        patch("src.question.workflows.module_batch_workflow.bulk_insert_questions"),
+    ):
         # Create a mock async context manager for the session
         mock_session = AsyncMock()
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
@@ -2102,7 +2162,10 @@ async def test_process_module_ignores_llm_difficulty(
     )
 
     # Mock database operations
-    with patch("src.question.workflows.module_batch_workflow.get_async_session"):
+    with (
+        patch("src.question.workflows.module_batch_workflow.get_async_session"),
+        patch("src.question.workflows.module_batch_workflow.bulk_insert_questions"),
+    ):
         questions = await workflow.process_module(
             quiz_id=uuid4(),
             module_id="123",
@@ -2187,3 +2250,781 @@ async def test_difficulty_flows_through_workflow_pipeline(
     # Verify final question has correct difficulty
     question = final_state.generated_questions[0]
     assert question.difficulty == QuestionDifficulty.MEDIUM
+
+
+class StreamingMockLLMProvider(MockLLMProvider):
+    """Mock provider that streams its response in fixed-size chunks."""
+
+    def __init__(
+        self,
+        response_content: str = "",
+        chunk_size: int = 16,
+        stall_after: int | None = None,
+        stream_errors: list[Exception] | None = None,
+    ):
+        super().__init__(response_content)
+        self.chunk_size = chunk_size
+        self.stall_after = stall_after
+        self.stream_errors = list(stream_errors or [])
+        self.stream_calls = 0
+
+    @property
+    def supports_streaming(self) -> bool:
+        return True
+
+    async def stream(self, messages: list[LLMMessage], **kwargs: Any):
+        import asyncio
+
+        self.stream_calls += 1
+        if self.stream_errors:
+            raise self.stream_errors.pop(0)
+
+        content = self.response_content
+        for index, start in enumerate(range(0, len(content), self.chunk_size)):
+            if self.stall_after is not None and index >= self.stall_after:
+                await asyncio.sleep(3600)
+            yield content[start : start + self.chunk_size]
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_streams_and_validates_incrementally(
+    test_template_manager, valid_mcq_response
+):
+    """Test that streamed questions are validated before validate_batch runs."""
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    provider = StreamingMockLLMProvider(valid_mcq_response)
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=test_template_manager
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="module_1",
+        module_name="Test Module",
+        module_content="Test content",
+        target_question_count=2,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=provider,
+        template_manager=test_template_manager,
+        system_prompt="System",
+        user_prompt="User",
+    )
+
+    with patch(
+        "src.question.workflows.module_batch_workflow.settings.LLM_STREAMING_ENABLED",
+        True,
+    ):
+        state = await workflow.generate_batch(state)
+
+    assert state.raw_response == valid_mcq_response
+    assert state.streamed_questions is not None
+    assert len(state.streamed_questions) == 2
+    assert state.workflow_metadata["streamed"] is True
+
+    state = await workflow.validate_batch(state)
+
+    assert len(state.generated_questions) == 2
+    assert state.streamed_questions is None
+    assert state.error_message is None
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_stream_timeout_keeps_validated_questions(
+    test_template_manager, valid_mcq_response
+):
+    """Test that questions validated before a stream timeout are kept."""
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    first_object_end = valid_mcq_response.index("},") + 2
+    provider = StreamingMockLLMProvider(
+        valid_mcq_response, chunk_size=first_object_end, stall_after=1
+    )
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=test_template_manager
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="module_1",
+        module_name="Test Module",
+        module_content="Test content",
+        target_question_count=2,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=provider,
+        template_manager=test_template_manager,
+        system_prompt="System",
+        user_prompt="User",
+    )
+
+    with (
+        patch(
+            "src.question.workflows.module_batch_workflow.settings.LLM_STREAMING_ENABLED",
+            True,
+        ),
+        patch(
+            "src.question.workflows.module_batch_workflow.settings.MODULE_GENERATION_TIMEOUT",
+            0.1,
+        ),
+    ):
+        state = await workflow.generate_batch(state)
+        state = await workflow.validate_batch(state)
+
+    assert state.workflow_metadata["stream_timed_out"] is True
+    assert state.error_message is None
+    assert len(state.generated_questions) == 1
+    assert workflow.should_retry(state) == "retry"
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_stream_retries_errors_before_first_element(
+    test_template_manager, valid_mcq_response
+):
+    """Test that a rate limit before any output restarts the stream."""
+    from src.question.providers.base import RateLimitError
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    provider = StreamingMockLLMProvider(
+        valid_mcq_response,
+        stream_errors=[RateLimitError("slow down", provider=LLMProvider.OPENAI)],
+    )
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=test_template_manager
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="module_1",
+        module_name="Test Module",
+        module_content="Test content",
+        target_question_count=2,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=provider,
+        template_manager=test_template_manager,
+        system_prompt="System",
+        user_prompt="User",
+    )
+
+    with (
+        patch(
+            "src.question.workflows.module_batch_workflow.settings.LLM_STREAMING_ENABLED",
+            True,
+        ),
+        patch.object(provider, "retry_delay", return_value=0) as retry_delay,
+    ):
+        state = await workflow.generate_batch(state)
+
+    assert provider.stream_calls == 2
+    retry_delay.assert_called_once()
+    assert state.error_message is None
+    assert state.raw_response == valid_mcq_response
+    assert len(state.streamed_questions) == 2
+
+
+class ChunkRecordingLLMProvider(MockLLMProvider):
+    """Mock provider answering each prompt with one question about its chunk."""
+
+    def __init__(self):
+        super().__init__()
+        self.prompts: list[str] = []
+
+    async def generate(self, messages: list[LLMMessage], **kwargs: Any) -> LLMResponse:
+        prompt = messages[-1].content
+        self.prompts.append(prompt)
+        title = "Page A" if "## Page A" in prompt else "Page B"
+        self.response_content = json.dumps(
+            [
+                {
+                    "question_text": f"What is covered in {title}?",
+                    "option_a": "One",
+                    "option_b": "Two",
+                    "option_c": "Three",
+                    "option_d": "Four",
+                    "correct_answer": "A",
+                }
+            ]
+        )
+        return await super().generate(messages, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_large_module_is_generated_in_parallel_chunks(test_template_manager):
+    """Test that chunk prompts are dispatched separately and merged."""
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    provider = ChunkRecordingLLMProvider()
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=test_template_manager
+    )
+    page = "Material for the page. " * 40
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="module_1",
+        module_name="Test Module",
+        module_content=f"## Page A\n{page}\n\n## Page B\n{page}",
+        target_question_count=2,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=provider,
+        template_manager=test_template_manager,
+    )
+
+    with patch("src.config.settings.CONTENT_CHUNK_MAX_CHARS", 1000):
+        state = await workflow.prepare_prompt(state)
+        assert [prompt["question_count"] for prompt in state.chunk_prompts] == [1, 1]
+
+        state = await workflow.generate_batch(state)
+        state = await workflow.validate_batch(state)
+
+    assert len(provider.prompts) == 2
+    assert "## Page B" not in provider.prompts[0]
+    assert state.chunk_prompts == []
+    assert state.workflow_metadata["total_tokens_used"] == 200
+    assert sorted(
+        q.question_data["question_text"] for q in state.generated_questions
+    ) == [
+        "What is covered in Page A?",
+        "What is covered in Page B?",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_workflows_share_one_compiled_graph(
+    test_llm_provider, test_template_manager
+):
+    """Test that the graph is compiled once and state is passed by reference."""
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    first = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider, template_manager=test_template_manager
+    )
+    second = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+        language=QuizLanguage.NORWEGIAN,
+    )
+    assert first.graph is second.graph
+
+    saved_states = []
+
+    async def record_save(state):
+        saved_states.append(state)
+        return state
+
+    first.save_questions = record_save
+    initial_state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="module_1",
+        module_name="Test Module",
+        module_content="Test content",
+        target_question_count=1,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+    )
+
+    result = await first.graph.ainvoke(
+        {"batch": initial_state}, config={"configurable": {"workflow": first}}
+    )
+
+    assert result["batch"] is initial_state
+    assert saved_states == [initial_state]
+    assert len(initial_state.generated_questions) == 1
+
+
+@pytest.mark.asyncio
+async def test_top_up_asks_for_missing_questions_only(test_template_manager):
+    """Test that a top-up prompt lists accepted stems and uses a chunk excerpt."""
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    provider = MockLLMProvider()
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=test_template_manager
+    )
+    accepted = [
+        Question(
+            quiz_id=uuid4(),
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            question_data={"question_text": f"Accepted question {i}?"},
+            is_approved=False,
+        )
+        for i in range(3)
+    ]
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="module_1",
+        module_name="Test Module",
+        module_content="## Page A\nCovered well\n\n## Page B\nCovered poorly",
+        target_question_count=5,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=provider,
+        template_manager=test_template_manager,
+        generated_questions=accepted,
+        retry_count=1,
+        content_chunks=[
+            {
+                "title": "Page A",
+                "content": "## Page A\nCovered well",
+                "question_count": 3,
+                "questions_returned": 3,
+            },
+            {
+                "title": "Page B",
+                "content": "## Page B\nCovered poorly",
+                "question_count": 2,
+                "questions_returned": 0,
+            },
+        ],
+    )
+
+    assert workflow.retry_route(state) == "top_up"
+
+    with patch("src.config.settings.CONTENT_CHUNK_MAX_CHARS", 30):
+        state = await workflow.prepare_top_up(state)
+
+    assert state.error_message is None
+    assert "Covered poorly" in state.user_prompt
+    assert "Covered well" not in state.user_prompt
+    assert "- Accepted question 0?" in state.user_prompt
+    assert "Generate exactly 2 NEW questions" in state.user_prompt
+    assert state.workflow_metadata["top_up_requests"] == 1
+
+    state.generated_questions = []
+    assert workflow.retry_route(state) == "full"
+
+
+def test_retry_delay_is_jittered_and_honours_shared_backoff(test_llm_provider):
+    """Test that retries back off with jitter on top of any provider backoff."""
+    from src.question.workflows.module_batch_workflow import ModuleBatchWorkflow
+
+    workflow = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider, template_manager=MockTemplateManager()
+    )
+
+    with patch(
+        "src.question.workflows.module_batch_workflow.random.uniform",
+        side_effect=lambda low, high: high,
+    ):
+        assert workflow._retry_delay(1) == 1.0
+        assert workflow._retry_delay(3) == 4.0
+        assert workflow._retry_delay(10) == 30.0
+
+        with patch.object(test_llm_provider, "backoff_remaining", return_value=12.0):
+            assert workflow._retry_delay(1) == 13.0
+
+
+@pytest.mark.asyncio
+async def test_overgeneration_requests_spares_and_saves_best(test_template_manager):
+    """Test that spare candidates are requested and the best N are saved."""
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    provider = MockLLMProvider()
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=test_template_manager
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="module_1",
+        module_name="Test Module",
+        module_content="Test content",
+        target_question_count=4,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=provider,
+        template_manager=test_template_manager,
+    )
+
+    with patch("src.config.settings.QUESTION_OVERGENERATION_RATIO", 0.5):
+        state = await workflow.prepare_prompt(state)
+
+    assert state.workflow_metadata["estimated_completion_tokens"] == 200 * 6 + 200
+
+    def question(text, explanation="Explained."):
+        return Question(
+            quiz_id=state.quiz_id,
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            question_data={
+                "question_text": text,
+                "option_a": "Alpha",
+                "option_b": "Beta",
+                "option_c": "Gamma",
+                "option_d": "Delta",
+                "correct_answer": "A",
+                "explanation": explanation,
+            },
+            is_approved=False,
+        )
+
+    good = [
+        question("Which planet is closest to the Sun?"),
+        question("What causes the seasons on Earth?"),
+        question("How long does light from the Sun take to reach Earth?"),
+        question("Which gas makes up most of Jupiter's atmosphere?"),
+    ]
+    weak = question("Short?", explanation=None)
+    state.generated_questions = [good[0], weak, *good[1:]]
+
+    with (
+        patch("src.question.workflows.module_batch_workflow.get_async_session"),
+        patch(
+            "src.question.workflows.module_batch_workflow.bulk_insert_questions"
+        ) as mock_bulk_insert,
+    ):
+        state = await workflow.save_questions(state)
+
+    assert mock_bulk_insert.call_args.args[1] == good
+
+
+@pytest.mark.asyncio
+async def test_process_module_returns_only_saved_questions(test_template_manager):
+    """Test that spares dropped by selection or unsaved batches are not returned."""
+    from src.question.workflows.module_batch_workflow import ModuleBatchWorkflow
+
+    texts = [
+        "Which planet is closest to the Sun?",
+        "What causes the seasons on Earth?",
+        "Short?",
+    ]
+    provider = MockLLMProvider(
+        json.dumps(
+            [
+                {
+                    "question_text": text,
+                    "option_a": "Alpha",
+                    "option_b": "Beta",
+                    "option_c": "Gamma",
+                    "option_d": "Delta",
+                    "correct_answer": "A",
+                    "explanation": "Explained." if text != "Short?" else None,
+                }
+                for text in texts
+            ]
+        )
+    )
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=test_template_manager
+    )
+
+    async def process_module():
+        return await workflow.process_module(
+            quiz_id=uuid4(),
+            module_id="module_1",
+            module_name="Test Module",
+            module_content="Test content",
+            question_count=2,
+            question_type=QuestionType.MULTIPLE_CHOICE,
+        )
+
+    with (
+        patch("src.config.settings.QUESTION_OVERGENERATION_RATIO", 0.5),
+        patch("src.question.workflows.module_batch_workflow.get_async_session"),
+        patch(
+            "src.question.workflows.module_batch_workflow.bulk_insert_questions"
+        ) as mock_bulk_insert,
+    ):
+        questions = await process_module()
+
+    assert questions == mock_bulk_insert.call_args.args[1]
+    assert [question.question_data["question_text"] for question in questions] == (
+        texts[:2]
+    )
+
+    with (
+        patch("src.question.workflows.module_batch_workflow.get_async_session"),
+        patch(
+            "src.question.workflows.module_batch_workflow.bulk_insert_questions",
+            side_effect=RuntimeError("database unavailable"),
+        ),
+    ):
+        assert await process_module() == []
+
+
+@pytest.mark.asyncio
+async def test_duplicates_across_batches_are_rejected_and_topped_up(
+    test_llm_provider, test_template_manager, valid_mcq_response
+):
+    """Test that a shared dedup index rejects paraphrases from another batch."""
+    from src.question.workflows.dedup import QuestionDedupIndex
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    dedup_index = QuestionDedupIndex()
+
+    def batch(raw_response):
+        workflow = ModuleBatchWorkflow(
+            llm_provider=test_llm_provider,
+            template_manager=test_template_manager,
+            dedup_index=dedup_index,
+        )
+        state = ModuleBatchState(
+            quiz_id=uuid4(),
+            module_id="test-module",
+            module_name="Test Module",
+            module_content="Test content",
+            target_question_count=2,
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            llm_provider=test_llm_provider,
+            template_manager=test_template_manager,
+            raw_response=raw_response,
+        )
+        return workflow, state
+
+    workflow, state = batch(valid_mcq_response)
+    state = await workflow.validate_batch(state)
+    assert len(state.generated_questions) == 2
+
+    paraphrase = {
+        **json.loads(valid_mcq_response)[0],
+        "question_text": "What is the capital city of France?",
+    }
+    distinct = {
+        **json.loads(valid_mcq_response)[1],
+        "question_text": "Which planet is closest to the Sun?",
+        "option_b": "Mercury",
+    }
+    workflow, state = batch(json.dumps([paraphrase, distinct]))
+    state = await workflow.validate_batch(state)
+
+    assert [q.question_data["question_text"] for q in state.generated_questions] == [
+        "Which planet is closest to the Sun?"
+    ]
+    assert state.workflow_metadata["duplicates_rejected"] == 1
+    assert workflow.should_retry(state) == "retry"
+
+
+@pytest.mark.asyncio
+async def test_response_without_accepted_questions_leaves_the_cache(
+    test_llm_provider, test_template_manager, valid_mcq_response
+):
+    """Test that an all-duplicate response is not replayed to the top-up retry."""
+    from src.question.workflows.dedup import QuestionDedupIndex
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+
+    dedup_index = QuestionDedupIndex()
+    for question_data in json.loads(valid_mcq_response):
+        dedup_index.check_and_add(
+            Question(
+                quiz_id=uuid4(),
+                question_type=QuestionType.MULTIPLE_CHOICE,
+                question_data=question_data,
+            )
+        )
+
+    workflow = ModuleBatchWorkflow(
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+        dedup_index=dedup_index,
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="test-module",
+        module_name="Test Module",
+        module_content="Test content",
+        target_question_count=2,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=test_llm_provider,
+        template_manager=test_template_manager,
+        raw_response=valid_mcq_response,
+        workflow_metadata={"response_cache_keys": ["first", "repeated"]},
+    )
+
+    with patch(
+        "src.question.workflows.module_batch_workflow.discard_cached_responses",
+        new=AsyncMock(),
+    ) as discard:
+        state = await workflow.validate_batch(state)
+
+    assert state.generated_questions == []
+    assert workflow.should_retry(state) == "retry"
+    discard.assert_awaited_once_with(["repeated"])
+
+
+class PackRecordingLLMProvider(MockLLMProvider):
+    """Mock provider answering packed prompts with module-keyed questions."""
+
+    def __init__(self):
+        super().__init__()
+        self.prompts: list[str] = []
+
+    async def generate(self, messages: list[LLMMessage], **kwargs: Any) -> LLMResponse:
+        prompt = messages[-1].content
+        self.prompts.append(prompt)
+        packed = "[MODULE" in prompt
+        module_ids = ["small_a", "small_b"] if packed else ["large"]
+        self.response_content = json.dumps(
+            [
+                {
+                    "question_text": f"What is explained in module {module_id}?",
+                    "option_a": "One",
+                    "option_b": "Two",
+                    "option_c": "Three",
+                    "option_d": "Four",
+                    "correct_answer": "A",
+                    **({"module_id": module_id} if packed else {}),
+                }
+                for module_id in module_ids
+            ]
+        )
+        return await super().generate(messages, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_small_modules_are_packed_into_one_request(test_template_manager):
+    """Test that small modules share a request and keep per-batch accounting."""
+    from src.question.types import QuestionDifficulty
+    from src.question.workflows.dedup import QuestionDedupIndex
+    from src.question.workflows.module_batch_workflow import ParallelModuleProcessor
+
+    provider = PackRecordingLLMProvider()
+    processor = ParallelModuleProcessor(
+        llm_provider=provider, template_manager=test_template_manager
+    )
+
+    def module(name, content):
+        return {
+            "name": name,
+            "content": content,
+            "batches": [
+                {
+                    "question_type": QuestionType.MULTIPLE_CHOICE,
+                    "count": 1,
+                    "difficulty": QuestionDifficulty.MEDIUM,
+                    "batch_key": f"{name}_batch",
+                }
+            ],
+        }
+
+    modules_data = {
+        "small_a": module("Small A", "Short notes. " * 20),
+        "small_b": module("Small B", "Brief notes. " * 20),
+        "large": module("Large", "Long material. " * 400),
+    }
+
+    mock_session = AsyncMock()
+    with (
+        patch(
+            "src.question.workflows.module_batch_workflow.load_quiz_dedup_index",
+            AsyncMock(return_value=QuestionDedupIndex()),
+        ),
+        patch(
+            "src.question.workflows.module_batch_workflow.get_async_session"
+        ) as mock_get_session,
+        patch("src.question.workflows.module_batch_workflow.bulk_insert_questions"),
+    ):
+        mock_get_session.return_value.__aenter__.return_value = mock_session
+        results, batch_status = await processor.process_all_modules_with_batches(
+            uuid4(), modules_data
+        )
+
+    assert len(provider.prompts) == 2
+    packed_prompt = next(prompt for prompt in provider.prompts if "[MODULE" in prompt)
+    assert "[MODULE small_a] Small A" in packed_prompt
+    assert "[MODULE small_b] Small B" in packed_prompt
+    assert sorted(batch_status["successful_batches"]) == [
+        "Large_batch",
+        "Small A_batch",
+        "Small B_batch",
+    ]
+    assert batch_status["failed_batches"] == []
+    assert results["small_b"][0].question_data == {
+        "question_text": "What is explained in module small_b?",
+        "option_a": "One",
+        "option_b": "Two",
+        "option_c": "Three",
+        "option_d": "Four",
+        "correct_answer": "A",
+        "explanation": None,
+    }
+
+
+class StructuredOutputLLMProvider(MockLLMProvider):
+    """Mock provider honouring response schemas like strict structured output."""
+
+    def __init__(self):
+        super().__init__()
+        self.schemas: list[dict[str, Any] | None] = []
+
+    @property
+    def supports_structured_output(self) -> bool:
+        return True
+
+    async def generate(self, messages: list[LLMMessage], **kwargs: Any) -> LLMResponse:
+        self.schemas.append(kwargs.get("response_schema"))
+        self.response_content = json.dumps(
+            {
+                "questions": [
+                    {
+                        "question_text": "Is the schema enforced?",
+                        "explanation": None,
+                        "correct_answer": True,
+                    }
+                ]
+            }
+        )
+        return await super().generate(messages, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_structured_output_requests_the_question_schema(test_template_manager):
+    """Test that supporting providers get the batch schema and null fields drop."""
+    from src.question.workflows.module_batch_workflow import ModuleBatchWorkflow
+    from src.question.workflows.structured_output import question_batch_schema
+
+    provider = StructuredOutputLLMProvider()
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=test_template_manager
+    )
+
+    with (
+        patch("src.question.workflows.module_batch_workflow.get_async_session"),
+        patch("src.question.workflows.module_batch_workflow.bulk_insert_questions"),
+    ):
+        questions = await workflow.process_module(
+            quiz_id=uuid4(),
+            module_id="module_1",
+            module_name="Test Module",
+            module_content="Schemas constrain generated output.",
+            question_count=1,
+            question_type=QuestionType.TRUE_FALSE,
+        )
+
+    assert provider.schemas == [question_batch_schema(QuestionType.TRUE_FALSE)]
+    assert len(questions) == 1
+    assert questions[0].question_data["correct_answer"] is True
+
+    provider.schemas.clear()
+    with (
+        patch("src.config.settings.LLM_STRUCTURED_OUTPUT_ENABLED", False),
+        patch.object(workflow, "save_questions", side_effect=lambda state: state),
+    ):
+        await workflow.process_module(
+            quiz_id=uuid4(),
+            module_id="module_1",
+            module_name="Test Module",
+            module_content="Schemas constrain generated output.",
+            question_count=1,
+            question_type=QuestionType.TRUE_FALSE,
+        )
+
+    assert provider.schemas == [None]
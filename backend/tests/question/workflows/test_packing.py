@@ -0,0 +1,67 @@
+"""Tests for packing small module batches into one request."""
+
+
+def _modules():
+    from src.question.types import QuestionDifficulty, QuestionType
+
+    def batch(question_type, key):
+        return {
+            "question_type": question_type,
+            "count": 2,
+            "difficulty": QuestionDifficulty.EASY,
+            "batch_key": key,
+        }
+
+    return {
+        "a": {
+            "name": "A",
+            "content": "short",
+            "batches": [
+                batch(QuestionType.MULTIPLE_CHOICE, "a_mcq"),
+                batch(QuestionType.TRUE_FALSE, "a_tf"),
+            ],
+        },
+        "b": {
+            "name": "B",
+            "content": "short",
+            "batches": [batch(QuestionType.MULTIPLE_CHOICE, "b_mcq")],
+        },
+        "c": {
+            "name": "C",
+            "content": "long" * 100,
+            "batches": [batch(QuestionType.MULTIPLE_CHOICE, "c_mcq")],
+        },
+    }
+
+
+def test_plan_module_packs_groups_small_modules_by_batch_kind():
+    """Test that only small modules with matching batches are packed."""
+    from src.question.workflows.packing import plan_module_packs
+
+    packs = plan_module_packs(_modules(), max_module_chars=100, max_modules=4)
+
+    assert [[member.batch["batch_key"] for member in pack] for pack in packs] == [
+        ["a_mcq", "b_mcq"]
+    ]
+    assert plan_module_packs(_modules(), max_module_chars=0, max_modules=4) == []
+
+
+def test_split_packed_response_keys_questions_by_module():
+    """Test that packed responses are demultiplexed by module id."""
+    from src.question.workflows.packing import (
+        build_packed_content,
+        plan_module_packs,
+        split_packed_response,
+    )
+
+    members = plan_module_packs(_modules(), max_module_chars=100, max_modules=4)[0]
+
+    assert build_packed_content(members) == "[MODULE a] A\nshort\n\n[MODULE b] B\nshort"
+    assert split_packed_response(
+        [
+            {"question_text": "Q1", "module_id": "b"},
+            {"question_text": "Q2", "module_id": "unknown"},
+            {"question_text": "Q3", "module_id": "a"},
+        ],
+        members,
+    ) == {"a": [{"question_text": "Q3"}], "b": [{"question_text": "Q1"}]}
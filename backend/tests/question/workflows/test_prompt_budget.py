@@ -0,0 +1,154 @@
+"""Tests for context-window budgeting of generation prompts."""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+
+def test_estimate_output_tokens_scales_with_count_and_type():
+    """Test per-type output headroom."""
+    from src.question.types import QuestionType
+    from src.question.workflows.prompt_budget import (
+        OUTPUT_OVERHEAD_TOKENS,
+        OUTPUT_TOKENS_PER_QUESTION,
+        estimate_output_tokens,
+    )
+
+    mcq = estimate_output_tokens(QuestionType.MULTIPLE_CHOICE, 10)
+
+    assert mcq == (
+        10 * OUTPUT_TOKENS_PER_QUESTION[QuestionType.MULTIPLE_CHOICE]
+        + OUTPUT_OVERHEAD_TOKENS
+    )
+    assert estimate_output_tokens(QuestionType.MATCHING, 10) > mcq
+
+
+def test_prompt_budget_reserves_output_headroom():
+    """Test overflow calculation against the context window."""
+    from src.question.workflows.prompt_budget import SAFETY_MARGIN_TOKENS, PromptBudget
+
+    budget = PromptBudget(context_window=10_000, output_tokens=2_000)
+
+    assert budget.max_prompt_tokens == 8_000 - SAFETY_MARGIN_TOKENS
+    assert budget.overflow(budget.max_prompt_tokens) == 0
+    assert budget.overflow(budget.max_prompt_tokens + 50) == 50
+
+
+def test_truncate_at_boundary_prefers_paragraph_breaks():
+    """Test that truncation cuts at a paragraph break when possible."""
+    from src.question.utils import truncate_at_boundary
+
+    text = "First paragraph here.\n\nSecond paragraph is longer than the limit."
+
+    assert truncate_at_boundary(text, len(text)) == text
+    assert truncate_at_boundary(text, 40) == "First paragraph here."
+    assert truncate_at_boundary("abcdefghij", 5) == "abcde"
+
+
+@pytest.mark.asyncio
+async def test_prepare_prompt_trims_content_to_context_window():
+    """Test that oversized module content is trimmed before dispatch."""
+    from src.question.providers.tokens import TokenCounter
+    from src.question.types import QuestionType
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+    from src.question.workflows.prompt_budget import PromptBudget
+    from tests.question.workflows.test_module_batch_workflow import (
+        MockLLMProvider,
+        MockTemplateManager,
+    )
+
+    provider = MockLLMProvider()  # 4000-token context window
+    template_manager = MockTemplateManager()
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=template_manager
+    )
+    paragraph = "Photosynthesis converts light into chemical energy. " * 20
+    content = "\n\n".join([paragraph] * 40)
+
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="large-module",
+        module_name="Large Module",
+        module_content=content,
+        target_question_count=5,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=provider,
+        template_manager=template_manager,
+    )
+
+    with patch("src.question.providers.tokens._load_encoding", return_value=None):
+        counter = TokenCounter("test-model")
+    with (
+        patch(
+            "src.question.workflows.module_batch_workflow.get_token_counter",
+            return_value=counter,
+        ),
+        patch("src.config.settings.CONTENT_CHUNK_MAX_CHARS", 0),
+    ):
+        result = await workflow.prepare_prompt(state)
+
+    metadata = result.workflow_metadata
+    budget = PromptBudget(4000, metadata["estimated_completion_tokens"])
+
+    assert result.error_message is None
+    assert len(result.user_prompt) < len(content)
+    assert result.user_prompt.endswith(paragraph.rstrip())
+    assert metadata["estimated_prompt_tokens"] <= budget.max_prompt_tokens
+    assert result.module_content == content
+
+
+@pytest.mark.asyncio
+async def test_prepare_prompt_fails_when_fixed_parts_exceed_budget():
+    """Test that a prompt with no room left for content fails the batch."""
+    from src.question.providers.tokens import TokenCounter
+    from src.question.types import QuestionType
+    from src.question.workflows.module_batch_workflow import (
+        ModuleBatchState,
+        ModuleBatchWorkflow,
+    )
+    from src.question.workflows.prompt_budget import (
+        PromptBudgetError,
+        trim_to_tokens,
+    )
+    from tests.question.workflows.test_module_batch_workflow import (
+        MockLLMProvider,
+        MockTemplateManager,
+    )
+
+    provider = MockLLMProvider()  # 4000-token context window
+    template_manager = MockTemplateManager()
+    workflow = ModuleBatchWorkflow(
+        llm_provider=provider, template_manager=template_manager
+    )
+    state = ModuleBatchState(
+        quiz_id=uuid4(),
+        module_id="crowded-module",
+        module_name="Crowded Module",
+        module_content="Photosynthesis converts light into chemical energy. " * 20,
+        # Output headroom alone exceeds the context window
+        target_question_count=20,
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        llm_provider=provider,
+        template_manager=template_manager,
+    )
+
+    with patch("src.question.providers.tokens._load_encoding", return_value=None):
+        counter = TokenCounter("test-model")
+    with pytest.raises(PromptBudgetError):
+        trim_to_tokens(counter, "Some content", 0)
+
+    with (
+        patch(
+            "src.question.workflows.module_batch_workflow.get_token_counter",
+            return_value=counter,
+        ),
+        patch("src.config.settings.CONTENT_CHUNK_MAX_CHARS", 0),
+    ):
+        result = await workflow.prepare_prompt(state)
+
+    assert result.error_message is not None
+    assert "No room for module content" in result.error_message
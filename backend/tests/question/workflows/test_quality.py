@@ -0,0 +1,71 @@
+"""Tests for question candidate scoring and selection."""
+
+from uuid import uuid4
+
+
+def _mcq(question_text: str, **overrides):
+    from src.question.types import Question, QuestionType
+
+    data = {
+        "question_text": question_text,
+        "option_a": "Mitochondria",
+        "option_b": "Ribosome",
+        "option_c": "Nucleus",
+        "option_d": "Golgi apparatus",
+        "correct_answer": "A",
+        "explanation": "Mitochondria produce most of the cell's ATP.",
+        **overrides,
+    }
+    return Question(
+        quiz_id=uuid4(),
+        question_type=QuestionType.MULTIPLE_CHOICE,
+        question_data=data,
+        is_approved=False,
+    )
+
+
+def test_question_warnings_flag_cheap_quality_issues():
+    """Test the heuristic warnings for weak candidates."""
+    from src.question.types import QuestionType
+    from src.question.workflows.quality import question_warnings
+
+    good = _mcq("Which organelle produces most of a cell's ATP?").question_data
+    weak = _mcq(
+        "Mitochondria?",
+        option_b="mitochondria",
+        option_d="None of the above",
+        explanation=None,
+    ).question_data
+
+    assert question_warnings(QuestionType.MULTIPLE_CHOICE, good) == []
+    assert question_warnings(QuestionType.MULTIPLE_CHOICE, weak) == [
+        "stem_too_short",
+        "missing_explanation",
+        "duplicate_options",
+        "catch_all_option",
+        "answer_in_stem",
+    ]
+
+
+def test_select_best_questions_prefers_quality_and_distinct_stems():
+    """Test that weak and near-duplicate candidates are dropped first."""
+    from src.question.workflows.quality import select_best_questions
+
+    first = _mcq("Which organelle produces most of a cell's ATP?")
+    duplicate = _mcq("Which organelle produces most of the cell's ATP?")
+    weak = _mcq("Mitochondria?", explanation=None)
+    distinct = _mcq("Where in the cell does protein synthesis take place?")
+
+    kept, dropped = select_best_questions([first, duplicate, weak, distinct], keep=2)
+
+    assert kept == [first, distinct]
+    assert [scored.question for scored in dropped] == [duplicate, weak]
+
+
+def test_select_best_questions_keeps_everything_within_target():
+    """Test that nothing is dropped when there is no excess."""
+    from src.question.workflows.quality import select_best_questions
+
+    questions = [_mcq("Which organelle produces most of a cell's ATP?")]
+
+    assert select_best_questions(questions, keep=3) == (questions, [])
@@ -0,0 +1,96 @@
+"""Tests for the generation batch scheduler."""
+
+import asyncio
+import threading
+
+import pytest
+
+
+def _batches(costs, started, running, peak, release=None):
+    from src.question.workflows.scheduler import ScheduledBatch
+
+    def make(key):
+        async def run():
+            started.append(key)
+            running.append(key)
+            peak[0] = max(peak[0], len(running))
+            if release is not None:
+                await release.wait()
+            await asyncio.sleep(0)
+            running.remove(key)
+            return key.upper()
+
+        return run
+
+    return [ScheduledBatch(key=key, cost=cost, run=make(key)) for key, cost in costs]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_orders_by_cost_and_caps_parallelism():
+    """Test longest/shortest-first ordering and the concurrency cap."""
+    from src.question.workflows.scheduler import BatchScheduler
+
+    costs = [("small", 1.0), ("large", 9.0), ("medium", 5.0), ("tiny", 0.5)]
+    completed = []
+
+    async def on_complete(batch, result):
+        completed.append((batch.key, result))
+
+    started, running, peak = [], [], [0]
+    results = await BatchScheduler(max_concurrency=2).run(
+        _batches(costs, started, running, peak), on_complete=on_complete
+    )
+
+    assert started == ["large", "medium", "small", "tiny"]
+    assert peak[0] == 2
+    assert results == ["SMALL", "LARGE", "MEDIUM", "TINY"]
+    assert sorted(completed) == sorted(
+        zip(["small", "large", "medium", "tiny"], results, strict=True)
+    )
+
+    started, running, peak = [], [], [0]
+    await BatchScheduler(max_concurrency=1, order="shortest_first").run(
+        _batches(costs, started, running, peak)
+    )
+
+    assert started == ["tiny", "small", "medium", "large"]
+    assert peak[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_quiz_generation_can_be_cancelled_from_another_thread():
+    """Test that cancelling stops running and queued batches."""
+    from uuid import uuid4
+
+    from src.question.workflows.scheduler import (
+        BatchScheduler,
+        cancel_quiz_generation,
+        register_quiz_scheduler,
+    )
+
+    quiz_id = uuid4()
+    release = asyncio.Event()
+    started, running, peak = [], [], [0]
+    scheduler = BatchScheduler(max_concurrency=2)
+    register_quiz_scheduler(quiz_id, scheduler)
+
+    run = asyncio.create_task(
+        scheduler.run(
+            _batches(
+                [("a", 3.0), ("b", 2.0), ("c", 1.0)], started, running, peak, release
+            )
+        )
+    )
+    while len(started) < 2:
+        await asyncio.sleep(0)
+
+    # Deletion requests run in a worker thread
+    canceller = threading.Thread(target=cancel_quiz_generation, args=(quiz_id,))
+    canceller.start()
+    canceller.join()
+    results = await run
+
+    assert started == ["a", "b"]
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert scheduler.cancelled
+    assert not cancel_quiz_generation(quiz_id)
@@ -0,0 +1,60 @@
+"""Tests for structured-output response schemas."""
+
+import pytest
+
+from src.question.types import QuestionType
+
+
+def _assert_strict(schema):
+    if "properties" in schema:
+        assert schema["additionalProperties"] is False
+        assert set(schema["required"]) == set(schema["properties"])
+    for keyword in ("minLength", "maxLength", "default", "title"):
+        assert keyword not in schema
+    for key in ("properties", "$defs"):
+        for subschema in schema.get(key, {}).values():
+            _assert_strict(subschema)
+    if "items" in schema:
+        _assert_strict(schema["items"])
+    for option in schema.get("anyOf", []):
+        _assert_strict(option)
+
+
+@pytest.mark.parametrize("question_type", list(QuestionType))
+def test_question_batch_schema_is_strict(question_type):
+    """Test that every question type yields a strict wrapped batch schema."""
+    from src.question.workflows.structured_output import question_batch_schema
+
+    schema = dict(question_batch_schema(question_type))
+    assert schema.pop("title") == f"{question_type.value}_batch"
+    assert schema["required"] == ["questions"]
+    assert schema["properties"]["questions"]["type"] == "array"
+    _assert_strict(schema)
+
+
+def test_structured_response_with_nulls_validates():
+    """Test that null-filled optional fields validate once dropped."""
+    from src.question.types.registry import get_question_type_registry
+    from src.question.workflows.structured_output import drop_nulls
+
+    response = {
+        "question_text": "The capital of [blank_1] is Oslo.",
+        "explanation": None,
+        "blanks": [
+            {
+                "position": 1,
+                "correct_answer": "Norway",
+                "answer_variations": None,
+                "case_sensitive": None,
+            }
+        ],
+    }
+
+    data = (
+        get_question_type_registry()
+        .get_question_type(QuestionType.FILL_IN_BLANK)
+        .validate_data(drop_nulls(response))
+    )
+
+    assert data.blanks[0].case_sensitive is False
+    assert data.explanation is None
@@ -0,0 +1,190 @@
+"""Tests for incremental generation progress and live progress events."""
+
+import asyncio
+
+import pytest
+
+from tests.conftest import create_user_in_async_session
+from tests.test_data import DEFAULT_SELECTED_MODULES, get_unique_quiz_config
+
+
+@pytest.mark.asyncio
+async def test_record_generation_batch_updates_metadata_per_batch(async_session):
+    """Test that each finished batch is recorded and published."""
+    from src.quiz.models import Quiz
+    from src.quiz.service import record_generation_batch
+
+    user = await create_user_in_async_session(async_session)
+    quiz = Quiz(
+        owner_id=user.id,
+        **get_unique_quiz_config(),
+        selected_modules=DEFAULT_SELECTED_MODULES,
+        generation_metadata={"failed_batches": ["m1_mcq"], "custom": "kept"},
+    )
+    async_session.add(quiz)
+    await async_session.commit()
+    await async_session.refresh(quiz)
+
+    await record_generation_batch(
+        async_session, quiz.id, "m1_mcq", success=True, questions_saved=5
+    )
+    await record_generation_batch(
+        async_session, quiz.id, "m2_tf", success=False, questions_saved=0
+    )
+    await record_generation_batch(
+        async_session, quiz.id, "m3_mcq", success=True, questions_saved=3
+    )
+    await async_session.commit()
+    await async_session.refresh(quiz)
+
+    assert sorted(quiz.generation_metadata["successful_batches"]) == [
+        "m1_mcq",
+        "m3_mcq",
+    ]
+    assert quiz.generation_metadata["failed_batches"] == ["m2_tf"]
+    assert quiz.generation_metadata["questions_generated"] == 8
+    assert quiz.generation_metadata["custom"] == "kept"
+
+
+@pytest.mark.asyncio
+async def test_generation_reservation_resets_question_counter(async_session):
+    """Test that a new generation run counts from the quiz's current questions."""
+    from src.question.types import Question, QuestionType
+    from src.quiz.models import Quiz
+    from src.quiz.schemas import QuizStatus
+    from src.quiz.service import get_generation_progress, reserve_quiz_job
+
+    user = await create_user_in_async_session(async_session)
+    quiz = Quiz(
+        owner_id=user.id,
+        **get_unique_quiz_config(),
+        selected_modules=DEFAULT_SELECTED_MODULES,
+        status=QuizStatus.FAILED,
+        generation_metadata={
+            "successful_batches": ["m1_mcq"],
+            "questions_generated": 12,
+        },
+    )
+    async_session.add(quiz)
+    await async_session.commit()
+    await async_session.refresh(quiz)
+    quiz_id = quiz.id
+    async_session.add(
+        Question(
+            quiz_id=quiz_id,
+            question_type=QuestionType.MULTIPLE_CHOICE,
+            question_data={"question_text": "Kept from the first run"},
+        )
+    )
+    await async_session.commit()
+
+    assert await reserve_quiz_job(async_session, quiz_id, "generation") == {}
+    await async_session.commit()
+
+    progress = await get_generation_progress(async_session, quiz_id)
+    assert progress["status"] == QuizStatus.GENERATING_QUESTIONS
+    assert progress["questions_generated"] == 1
+    assert progress["successful_batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_progress_listener_fans_out_notifications_per_quiz():
+    """Test that NOTIFY payloads reach only the subscribers of their quiz."""
+    import json
+    import uuid
+
+    import asyncpg
+
+    from src.quiz.progress import PROGRESS_CHANNEL, QuizProgressListener, format_sse
+    from tests.database import TEST_DATABASE_URL
+
+    listener = QuizProgressListener(dsn=TEST_DATABASE_URL)
+    quiz_id, other_quiz_id = uuid.uuid4(), uuid.uuid4()
+    connection = await asyncpg.connect(TEST_DATABASE_URL)
+    try:
+        async with (
+            listener.subscribe(quiz_id) as queue,
+            listener.subscribe(other_quiz_id) as other_queue,
+        ):
+            payload = {"quiz_id": str(quiz_id), "event": "batch_completed"}
+            await connection.execute(
+                "SELECT pg_notify($1, $2)", PROGRESS_CHANNEL, json.dumps(payload)
+            )
+            event = await asyncio.wait_for(queue.get(), timeout=5)
+
+            assert event == payload
+            assert other_queue.empty()
+            assert format_sse(event) == (
+                f"event: batch_completed\ndata: {json.dumps(payload)}\n\n"
+            )
+
+        assert listener._subscribers == {}
+    finally:
+        await connection.close()
+        await listener.aclose()
+
+
+@pytest.mark.asyncio
+async def test_progress_stream_reads_snapshot_after_subscribing(async_session):
+    """Test that generation finishing before the stream subscribes ends it."""
+    import json
+    from contextlib import asynccontextmanager
+    from unittest.mock import MagicMock, patch
+
+    from src.quiz.models import Quiz
+    from src.quiz.router import stream_quiz_progress
+    from src.quiz.schemas import QuizStatus
+
+    user = await create_user_in_async_session(async_session)
+    current_user = MagicMock(id=user.id)
+    quiz = Quiz(
+        owner_id=user.id,
+        **get_unique_quiz_config(),
+        selected_modules=DEFAULT_SELECTED_MODULES,
+        status=QuizStatus.READY_FOR_REVIEW,
+        generation_metadata={
+            "successful_batches": ["m1_mcq"],
+            "questions_generated": 5,
+        },
+    )
+    async_session.add(quiz)
+    await async_session.commit()
+    await async_session.refresh(quiz)
+
+    # The quiz as loaded by the ownership dependency, before generation finished
+    loaded_quiz = MagicMock(
+        id=quiz.id, status=QuizStatus.GENERATING_QUESTIONS, generation_metadata={}
+    )
+
+    @asynccontextmanager
+    async def subscribe(_quiz_id):
+        yield asyncio.Queue()
+
+    @asynccontextmanager
+    async def get_async_session():
+        yield async_session
+
+    listener = MagicMock(subscribe=subscribe)
+    with (
+        patch("src.quiz.progress.get_progress_listener", return_value=listener),
+        patch("src.database.get_async_session", get_async_session),
+    ):
+        response = await stream_quiz_progress(loaded_quiz, current_user)
+        chunks = await asyncio.wait_for(
+            _collect(response.body_iterator), timeout=KEEPALIVE_TEST_TIMEOUT
+        )
+
+    assert len(chunks) == 1
+    snapshot = json.loads(chunks[0].split("data: ", 1)[1])
+    assert snapshot["event"] == "snapshot"
+    assert snapshot["status"] == QuizStatus.READY_FOR_REVIEW
+    assert snapshot["questions_generated"] == 5
+    assert snapshot["successful_batches"] == 1
+
+
+# Well below the keepalive interval, so a stream that never ends times out
+KEEPALIVE_TEST_TIMEOUT = 5
+
+
+async def _collect(body_iterator):
+    return [chunk async for chunk in body_iterator]